@@ -29,12 +29,53 @@ def prepare_opcua_backend(opcua_backend, open62541_compat_branch):
 def build():
     invoke_and_check('./quasar.py build Release')
 
-def run_and_dump_address_space():
-    invoke_and_check('./.CI/travis/server_fixture.py --command_to_run uasak_dump')
+def run_and_dump_address_space(server_args=None):
+    extra_args = f' --server_args="{server_args}"' if server_args else ''
+    invoke_and_check('./.CI/travis/server_fixture.py --command_to_run uasak_dump' + extra_args)
 
 def compare_with_nodeset(reference_ns):
     invoke_and_check(f'/opt/NodeSetTools/nodeset_compare.py {reference_ns} build/bin/dump.xml --ignore_nodeids StandardMetaData')
 
+def set_aside_compared_files(prefix):
+    '''Renames the address space dump and the files the server wrote for comparison (*.compare.txt) of the
+    last run with the given prefix, and returns their names'''
+    bin_dir = os.path.join('build', 'bin')
+    compared = ['dump.xml'] + sorted([f for f in os.listdir(bin_dir) if f.endswith('.compare.txt')])
+    for f in compared:
+        shutil.move(os.path.join(bin_dir, f), os.path.join(bin_dir, prefix + f))
+    return compared
+
+def compare_with_set_aside_files(prefix, compared):
+    bin_dir = os.path.join('build', 'bin')
+    invoke_and_check(f'/opt/NodeSetTools/nodeset_compare.py {bin_dir}/{prefix}dump.xml {bin_dir}/dump.xml')
+    for f in compared[1:]:
+        invoke_and_check(f'diff {bin_dir}/{prefix}{f} {bin_dir}/{f}')
+
+def compare_with_parallel_configuration(num_threads):
+    '''Runs the server again, configured by num_threads threads: the address space and the files
+    the server wrote for comparison (*.compare.txt) must be the same as from the sequential run'''
+    compared = set_aside_compared_files('sequential.')
+    run_and_dump_address_space(f'--configuration_threads {num_threads}')
+    compare_with_set_aside_files('sequential.', compared)
+
+def compare_with_configuration_snapshot():
+    '''Runs the server twice with a configuration snapshot: the first run saves it, the second one is configured
+    from it. The address space and the files the server wrote for comparison (*.compare.txt) must be the same as
+    from the run parsing the config file'''
+    compared = set_aside_compared_files('parsed.')
+    snapshot = os.path.join('build', 'bin', 'config.snapshot')
+    if os.path.exists(snapshot):
+        os.remove(snapshot)
+    run_and_dump_address_space('--configuration_snapshot config.snapshot')
+    if not os.path.isfile(snapshot):
+        raise Exception('The server did not save the configuration snapshot')
+    saved = os.stat(snapshot).st_mtime_ns
+    run_and_dump_address_space('--configuration_snapshot config.snapshot')
+    # a stale or unreadable snapshot would have been saved again
+    if os.stat(snapshot).st_mtime_ns != saved:
+        raise Exception('The server did not configure from the configuration snapshot')
+    compare_with_set_aside_files('parsed.', compared)
+
 def main():
     parser = argparse.ArgumentParser()
 
@@ -46,6 +87,10 @@ def main():
     parser.add_argument('--config', default=None)
     parser.add_argument('--compare_with_nodeset', default=None)
     parser.add_argument('--generate_all_devices', action='store_true')
+    parser.add_argument('--compare_parallel_configuration', type=int, default=None,
+        help='Number of configuration threads of a second run, which must give the same results as the first (sequential) one')
+    parser.add_argument('--compare_configuration_snapshot', action='store_true',
+        help='Runs the server again configured from a configuration snapshot, which must give the same results as the first run')
     args = parser.parse_args()
 
     if args.clone:
@@ -67,6 +112,10 @@ def main():
     run_and_dump_address_space()
     if args.compare_with_nodeset:
         compare_with_nodeset(args.compare_with_nodeset)
+    if args.compare_parallel_configuration:
+        compare_with_parallel_configuration(args.compare_parallel_configuration)
+    if args.compare_configuration_snapshot:
+        compare_with_configuration_snapshot()
 
     print('a')
     pass
@@ -0,0 +1,103 @@
+/* © Copyright CERN, 2026.  All rights not expressly granted are reserved.
+ * QuasarServerTestHelpers.h
+ *
+ *  Created on: 19 Oct 2026
+ *
+ *  This file is part of Quasar.
+ *
+ *  Quasar is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU Lesser General Public Licence as published by
+ *  the Free Software Foundation, either version 3 of the Licence.
+ *
+ *  Quasar is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU Lesser General Public Licence for more details.
+ *
+ *  You should have received a copy of the GNU Lesser General Public License
+ *  along with Quasar.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+/* Checks shared by the QuasarServer.test.cpp of the test cases. A QuasarServer.test.cpp gets copied to
+ * Server/src/QuasarServer.cpp, from where it includes this file as "../../.CI/test_cases/common/QuasarServerTestHelpers.h".
+ * A failed check throws, so that the server fails to start when it is done in QuasarServer::initialize().
+ */
+
+#ifndef CI_TEST_CASES_COMMON_QUASARSERVERTESTHELPERS_H_
+#define CI_TEST_CASES_COMMON_QUASARSERVERTESTHELPERS_H_
+
+#include <cmath>
+#include <cstdint>
+#include <stdexcept>
+#include <string>
+
+#include <LogIt.h>
+
+#include <ASNodeManager.h>
+#include <ChangeNotifyingVariable.h>
+#include <CalculatedVariable.h>
+
+inline UaNode* findNode (AddressSpace::ASNodeManager* nm, const std::string& name)
+{
+    UaNode* node = nm->getNode(UaNodeId(name.c_str(), nm->getNameSpaceIndex()));
+    if (!node)
+        throw std::runtime_error("Test failed: no node " + name);
+    return node;
+}
+
+//! Cache-variables, FreeVariables and Calculated Variables are all ChangeNotifyingVariables
+inline AddressSpace::ChangeNotifyingVariable* cacheVariable (AddressSpace::ASNodeManager* nm, const std::string& name)
+{
+    AddressSpace::ChangeNotifyingVariable* variable = dynamic_cast<AddressSpace::ChangeNotifyingVariable*>(findNode(nm, name));
+    if (!variable)
+        throw std::runtime_error("Test failed: " + name + " is not a cache-variable");
+    return variable;
+}
+
+inline CalculatedVariables::CalculatedVariable* calculatedVariable (AddressSpace::ASNodeManager* nm, const std::string& name)
+{
+    CalculatedVariables::CalculatedVariable* variable = dynamic_cast<CalculatedVariables::CalculatedVariable*>(findNode(nm, name));
+    if (!variable)
+        throw std::runtime_error("Test failed: " + name + " is not a CalculatedVariable");
+    return variable;
+}
+
+//! Sets the variable as a client write would
+inline void setFreeVariable (AddressSpace::ASNodeManager* nm, const std::string& name, double value)
+{
+    UaVariant variant;
+    variant.setDouble(value);
+    cacheVariable(nm, name)->setValue(nullptr, UaDataValue(variant, OpcUa_Good, UaDateTime::now(), UaDateTime::now()), OpcUa_False);
+}
+
+inline void expect (bool condition, const std::string& what)
+{
+    if (!condition)
+        throw std::runtime_error("Test failed: " + what);
+    LOG(Log::INF) << "OK: " << what;
+}
+
+inline void expectValue (double value, double expected, const std::string& name)
+{
+    if (std::abs(value - expected) > 1E-9)
+        throw std::runtime_error("Test failed: " + name + " is " + std::to_string(value) + ", expected " + std::to_string(expected));
+    LOG(Log::INF) << "OK: " << name << " = " << value;
+}
+
+inline void expectValue (AddressSpace::ASNodeManager* nm, const std::string& name, double expected)
+{
+    OpcUa_Double value;
+    if (!AddressSpace::ChangeNotifyingVariable::toNumeric(cacheVariable(nm, name)->value(nullptr), value))
+        throw std::runtime_error("Test failed: " + name + " has no numeric value");
+    expectValue(value, expected, name);
+}
+
+inline void expectEvaluations (AddressSpace::ASNodeManager* nm, const std::string& name, uint64_t since, uint64_t expected)
+{
+    uint64_t numEvaluations = calculatedVariable(nm, name)->numEvaluations() - since;
+    if (numEvaluations != expected)
+        throw std::runtime_error("Test failed: " + name + " evaluated " + std::to_string(numEvaluations) + " times, expected " + std::to_string(expected));
+    LOG(Log::INF) << "OK: " << name << " evaluated " << numEvaluations << " times";
+}
+
+#endif /* CI_TEST_CASES_COMMON_QUASARSERVERTESTHELPERS_H_ */
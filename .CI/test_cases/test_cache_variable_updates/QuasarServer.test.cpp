@@ -0,0 +1,214 @@
+/* © Copyright CERN, 2026.  All rights not expressly granted are reserved.
+ * QuasarServer.test.cpp
+ *
+ *  Created on: 19 Oct 2026
+ *
+ *  This file is part of Quasar.
+ *
+ *  Quasar is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU Lesser General Public Licence as published by
+ *  the Free Software Foundation, either version 3 of the Licence.
+ *
+ *  Quasar is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU Lesser General Public Licence for more details.
+ *
+ *  You should have received a copy of the GNU Lesser General Public License
+ *  along with Quasar.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+/* QuasarServer of the test_cache_variable_updates test case: the checks are done in initialize(), and a failed
+ * check throws so that the server fails to start.
+ */
+
+#include <chrono>
+#include <map>
+#include <stdexcept>
+#include <string>
+#include <thread>
+
+#include "QuasarServer.h"
+#include <LogIt.h>
+#include <shutdown.h>
+
+#include <ASNodeManager.h>
+#include <ASSensor.h>
+#include <ChangeNotifyingVariable.h>
+#include <CalculatedVariable.h>
+#include "../../.CI/test_cases/common/QuasarServerTestHelpers.h"
+
+using AddressSpace::ASSensor;
+using AddressSpace::ChangeNotifyingVariable;
+using CalculatedVariables::CalculatedVariable;
+
+//! Per cache-variable: how many times its value changed, and the source timestamp of the last change
+static std::map<std::string, int> numChanges;
+static std::map<std::string, std::string> lastSourceTimestamp;
+
+static void watch (AddressSpace::ASNodeManager* nm, const std::string& name)
+{
+    numChanges[name] = 0;
+    cacheVariable(nm, name)->addChangeListener([name](ChangeNotifyingVariable&, const UaDataValue& dataValue)
+    {
+        numChanges[name]++;
+        lastSourceTimestamp[name] = UaDateTime(dataValue.sourceTimestamp()).toString().toUtf8();
+    });
+}
+
+static void expectChanges (const std::string& name, int expected, const std::string& after)
+{
+    if (numChanges[name] != expected)
+        throw std::runtime_error("Test failed: " + name + " changed " + std::to_string(numChanges[name]) +
+                " times after " + after + ", expected " + std::to_string(expected));
+    LOG(Log::INF) << "OK: " << name << " changed " << expected << " times after " << after;
+}
+
+QuasarServer::QuasarServer() : BaseQuasarServer()
+{
+
+}
+
+QuasarServer::~QuasarServer()
+{
+
+}
+
+void QuasarServer::mainLoop()
+{
+    printServerMsg("Press "+std::string(SHUTDOWN_SEQUENCE)+" to shutdown server");
+
+    // Wait for user command to terminate the server thread.
+
+    while(ShutDownFlag() == 0)
+    {
+        std::this_thread::sleep_for(std::chrono::milliseconds(100));
+    }
+    printServerMsg(" Shutting down server");
+}
+
+void QuasarServer::initialize()
+{
+    LOG(Log::INF) << "Initializing Quasar server.";
+    AddressSpace::ASNodeManager* nm = getNodeManager();
+    ASSensor* s1 = dynamic_cast<ASSensor*>(findNode(nm, "s1"));
+    if (!s1)
+        throw std::runtime_error("Test failed: s1 is not a Sensor");
+    for (const std::string& name : {"temperature", "counter", "shadowed", "level", "pressure", "flow", "setpoint", "readback"})
+        watch(nm, "s1." + name);
+
+    // bulk update: one timestamp, and the Calculated Variable depending on two of the values is evaluated once
+    CalculatedVariable* derived = calculatedVariable(nm, "derived");
+    uint64_t derivedBefore = derived->numEvaluations();
+    expect(s1->bulkUpdate().setTemperature(21.5).setCounter(3).apply().isGood(), "bulk update applied");
+    expectValue(s1->getTemperature(), 21.5, "temperature");
+    expectValue(s1->getCounter(), 3, "counter");
+    expectChanges("s1.temperature", 1, "bulk update");
+    expectChanges("s1.counter", 1, "bulk update");
+    expect(lastSourceTimestamp["s1.temperature"] == lastSourceTimestamp["s1.counter"], "bulk update used one source timestamp");
+    OpcUa_Double derivedValue;
+    expect(ChangeNotifyingVariable::toNumeric(derived->value(nullptr), derivedValue), "derived is numeric");
+    expectValue(derivedValue, 24.5, "derived");
+    expect(derived->numEvaluations() - derivedBefore == 1, "derived evaluated once by the bulk update");
+    // the same with the usual setters
+    s1->setTemperature(22.5, OpcUa_Good);
+    s1->setCounter(4, OpcUa_Good);
+    expect(derived->numEvaluations() - derivedBefore == 3, "derived evaluated by each setter");
+
+    // native shadow: the getter follows the node, whoever sets it
+    expectValue(s1->getShadowed(), 1.5, "shadowed (initial value)");
+    s1->setShadowed(2.5, OpcUa_Good);
+    expectValue(s1->getShadowed(), 2.5, "shadowed (setter)");
+    UaVariant variant;
+    variant.setDouble(3.5);
+    cacheVariable(nm, "s1.shadowed")->setValue(nullptr, UaDataValue(variant, OpcUa_Good, UaDateTime::now(), UaDateTime::now()), OpcUa_False);
+    OpcUa_Double shadowed = 0;
+    expect(s1->getShadowed(shadowed).isGood(), "shadowed has a value");
+    expectValue(shadowed, 3.5, "shadowed (set on the node, as by a client write)");
+    expectValue(s1->getShadowed(), 3.5, "shadowed (short getter)");
+
+    // absolute deadband of 0.5
+    s1->setLevel(10, OpcUa_Good);
+    expectChanges("s1.level", 1, "first setLevel");
+    s1->setLevel(10.4, OpcUa_Good);
+    s1->setLevel(9.5, OpcUa_Good);
+    expectChanges("s1.level", 1, "changes within the deadband");
+    expectValue(s1->getLevel(), 10, "level");
+    s1->setLevel(10.6, OpcUa_Good);
+    expectChanges("s1.level", 2, "a change beyond the deadband");
+    s1->setLevel(10.6, OpcUa_BadInternalError);
+    expectChanges("s1.level", 3, "a change of status");
+    s1->bulkUpdate().setLevel(10.7, OpcUa_BadInternalError).apply();
+    expectChanges("s1.level", 3, "a bulk update within the deadband");
+
+    // deadband of 10 percent of the value held, the initial value (100) to start with
+    s1->setPressure(109, OpcUa_Good);
+    expectChanges("s1.pressure", 0, "a change of 9% from the initial value");
+    s1->setPressure(89, OpcUa_Good);
+    expectChanges("s1.pressure", 1, "a change of 11%");
+    s1->setPressure(97, OpcUa_Good); // 10% of 89 is 8.9
+    expectChanges("s1.pressure", 1, "a change of 8 from 89");
+    s1->bulkUpdate().setPressure(80, OpcUa_Good).apply();
+    expectChanges("s1.pressure", 2, "a bulk update beyond the deadband");
+    expectValue(s1->getPressure(), 80, "pressure");
+
+    // the deadband reference is the value held, however it was stored
+    s1->setFlow(5.0, OpcUa_Good);
+    expectChanges("s1.flow", 1, "the first value (after null)");
+    s1->setFlow(5.5, OpcUa_Good);
+    expectChanges("s1.flow", 1, "a change within the deadband");
+    s1->setNullFlow(OpcUa_Good);
+    expectChanges("s1.flow", 2, "setting null");
+    s1->setFlow(5.5, OpcUa_Good);
+    expectChanges("s1.flow", 3, "a value after null, within the deadband of the value before");
+    s1->setFlow(10.0, OpcUa_Good);
+    expectChanges("s1.flow", 4, "a change beyond the deadband");
+    s1->setFlow(10.5, OpcUa_Good);
+    expectChanges("s1.flow", 4, "a change within the deadband");
+    variant.setDouble(20);
+    cacheVariable(nm, "s1.flow")->setValue(nullptr, UaDataValue(variant, OpcUa_Good, UaDateTime::now(), UaDateTime::now()), OpcUa_False);
+    expectChanges("s1.flow", 5, "a value set on the node, as by a client write");
+    s1->setFlow(20.5, OpcUa_Good);
+    expectChanges("s1.flow", 5, "a change within the deadband of the value set on the node");
+    s1->setFlow(10.5, OpcUa_Good);
+    expectChanges("s1.flow", 6, "going back to the value before the one set on the node");
+    {
+        ASSensor::BulkUpdate discarded (s1->bulkUpdate());
+        discarded.setFlow(30.0, OpcUa_Good);
+    } // never applied
+    s1->setFlow(30.5, OpcUa_Good);
+    expectChanges("s1.flow", 7, "a change beyond the deadband, within the one of a discarded bulk update");
+    s1->bulkUpdate().setFlow(31.0, OpcUa_Good).apply();
+    expectChanges("s1.flow", 7, "a bulk update within the deadband");
+    OpcUa_Double flow = 0;
+    expect(s1->getFlow(flow).isGood(), "flow has a value");
+    expectValue(flow, 30.5, "flow");
+
+    // skipUnchanged, compared with readback which publishes every set
+    for (int i = 0; i < 3; ++i)
+    {
+        s1->setSetpoint(5, OpcUa_Good);
+        s1->setReadback(5, OpcUa_Good);
+    }
+    expectChanges("s1.setpoint", 1, "the same value set 3 times");
+    expectChanges("s1.readback", 3, "the same value set 3 times");
+    s1->setSetpoint(5, OpcUa_BadInternalError);
+    expectChanges("s1.setpoint", 2, "a change of status");
+    s1->bulkUpdate().setSetpoint(5, OpcUa_BadInternalError).apply();
+    expectChanges("s1.setpoint", 2, "a bulk update with the same value");
+    s1->bulkUpdate().setSetpoint(6, OpcUa_Good).apply();
+    expectChanges("s1.setpoint", 3, "a bulk update with another value");
+
+    LOG(Log::INF) << "All checks passed.";
+}
+
+void QuasarServer::shutdown()
+{
+    LOG(Log::INF) << "Shutting down Quasar server.";
+}
+
+void QuasarServer::initializeLogIt()
+{
+    BaseQuasarServer::initializeLogIt();
+    LOG(Log::INF) << "Logging initialized.";
+}
@@ -0,0 +1,107 @@
+/* © Copyright CERN, 2026.  All rights not expressly granted are reserved.
+ * QuasarServer.test.cpp
+ *
+ *  Created on: 19 Oct 2026
+ *
+ *  This file is part of Quasar.
+ *
+ *  Quasar is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU Lesser General Public Licence as published by
+ *  the Free Software Foundation, either version 3 of the Licence.
+ *
+ *  Quasar is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU Lesser General Public Licence for more details.
+ *
+ *  You should have received a copy of the GNU Lesser General Public License
+ *  along with Quasar.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+/* QuasarServer of the test_calculated_variables_min_update_interval test case: the checks are done in
+ * initialize(), and a failed check throws so that the server fails to start.
+ */
+
+#include <chrono>
+#include <stdexcept>
+#include <string>
+#include <thread>
+
+#include "QuasarServer.h"
+#include <LogIt.h>
+#include <shutdown.h>
+
+#include <ASNodeManager.h>
+#include <ChangeNotifyingVariable.h>
+#include <CalculatedVariable.h>
+#include "../../.CI/test_cases/common/QuasarServerTestHelpers.h"
+
+using CalculatedVariables::CalculatedVariable;
+
+QuasarServer::QuasarServer() : BaseQuasarServer()
+{
+
+}
+
+QuasarServer::~QuasarServer()
+{
+
+}
+
+void QuasarServer::mainLoop()
+{
+    printServerMsg("Press "+std::string(SHUTDOWN_SEQUENCE)+" to shutdown server");
+
+    // Wait for user command to terminate the server thread.
+
+    while(ShutDownFlag() == 0)
+    {
+        std::this_thread::sleep_for(std::chrono::milliseconds(100));
+    }
+    printServerMsg(" Shutting down server");
+}
+
+void QuasarServer::initialize()
+{
+    LOG(Log::INF) << "Initializing Quasar server.";
+    AddressSpace::ASNodeManager* nm = getNodeManager();
+    CalculatedVariable* limited = calculatedVariable(nm, "limited");
+    CalculatedVariable* unlimited = calculatedVariable(nm, "unlimited");
+    if (limited->minUpdateInterval() != std::chrono::milliseconds(1000) || unlimited->minUpdateInterval().count() != 0)
+        throw std::runtime_error("Test failed: minUpdateInterval not taken from the configuration");
+
+    // let the interval since the initial evaluation elapse
+    std::this_thread::sleep_for(std::chrono::milliseconds(1100));
+    uint64_t limitedBefore = limited->numEvaluations();
+    uint64_t unlimitedBefore = unlimited->numEvaluations();
+
+    std::chrono::steady_clock::time_point start = std::chrono::steady_clock::now();
+    for (int i = 1; i <= 20; ++i)
+        setFreeVariable(nm, "a", i);
+    if (std::chrono::steady_clock::now() - start > std::chrono::milliseconds(500))
+        throw std::runtime_error("Test failed: setting the input 20 times took too long for the test to be meaningful");
+
+    // the first change is evaluated at once, the others wait for the interval
+    expectEvaluations(nm, "unlimited", unlimitedBefore, 20);
+    expectValue(nm, "unlimited", 60);
+    expectEvaluations(nm, "limited", limitedBefore, 1);
+    expectValue(nm, "limited", 2);
+
+    // then a single trailing evaluation with the latest value
+    std::this_thread::sleep_for(std::chrono::milliseconds(1500));
+    expectEvaluations(nm, "limited", limitedBefore, 2);
+    expectValue(nm, "limited", 40);
+
+    LOG(Log::INF) << "All checks passed.";
+}
+
+void QuasarServer::shutdown()
+{
+    LOG(Log::INF) << "Shutting down Quasar server.";
+}
+
+void QuasarServer::initializeLogIt()
+{
+    BaseQuasarServer::initializeLogIt();
+    LOG(Log::INF) << "Logging initialized.";
+}
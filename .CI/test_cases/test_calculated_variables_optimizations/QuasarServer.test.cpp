@@ -0,0 +1,161 @@
+/* © Copyright CERN, 2026.  All rights not expressly granted are reserved.
+ * QuasarServer.test.cpp
+ *
+ *  Created on: 19 Oct 2026
+ *
+ *  This file is part of Quasar.
+ *
+ *  Quasar is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU Lesser General Public Licence as published by
+ *  the Free Software Foundation, either version 3 of the Licence.
+ *
+ *  Quasar is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU Lesser General Public Licence for more details.
+ *
+ *  You should have received a copy of the GNU Lesser General Public License
+ *  along with Quasar.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+/* QuasarServer of the test_calculated_variables_optimizations test case: the checks are done in initialize(),
+ * which runs after Engine::optimize(), and a failed check throws so that the server fails to start.
+ */
+
+#include <map>
+#include <stdexcept>
+#include <string>
+#include <thread>
+#include <vector>
+
+#include "QuasarServer.h"
+#include <LogIt.h>
+#include <shutdown.h>
+
+#include <ASNodeManager.h>
+#include <ChangeNotifyingVariable.h>
+#include <CalculatedVariable.h>
+#include <BatchEvaluator.h>
+#include "../../.CI/test_cases/common/QuasarServerTestHelpers.h"
+
+QuasarServer::QuasarServer() : BaseQuasarServer()
+{
+
+}
+
+QuasarServer::~QuasarServer()
+{
+
+}
+
+void QuasarServer::mainLoop()
+{
+    printServerMsg("Press "+std::string(SHUTDOWN_SEQUENCE)+" to shutdown server");
+
+    // Wait for user command to terminate the server thread.
+
+    while(ShutDownFlag() == 0)
+    {
+        std::this_thread::sleep_for(std::chrono::milliseconds(100));
+    }
+    printServerMsg(" Shutting down server");
+}
+
+void QuasarServer::initialize()
+{
+    LOG(Log::INF) << "Initializing Quasar server.";
+    AddressSpace::ASNodeManager* nm = getNodeManager();
+
+    // the optimizations themselves
+    expectValue(nm, "folded", 7);
+    expectValue(nm, "copy", 1);
+    expect(calculatedVariable(nm, "copy")->isForwarding(), "copy is forwarding its input");
+    expectValue(nm, "sum1", 3);
+    expect(!calculatedVariable(nm, "sum1")->isSharingEvaluation(), "sum1 evaluates by itself");
+    for (const std::string& duplicate : {"sum2", "sum3", "sum4"})
+        expect(calculatedVariable(nm, duplicate)->sharedEvaluationSource() == calculatedVariable(nm, "sum1"),
+                duplicate + " shares evaluation with sum1");
+
+    setFreeVariable(nm, "a", 10);
+    expectValue(nm, "folded", 16);
+    expectValue(nm, "copy", 10);
+    for (const std::string& sum : {"sum1", "sum2", "sum3", "sum4"})
+        expectValue(nm, sum, 12);
+
+    // a duplicate without automatic updates keeps its value
+    calculatedVariable(nm, "sum2")->setAutoUpdate(false);
+    expect(!calculatedVariable(nm, "sum2")->isSharingEvaluation(), "sum2 stopped sharing evaluation");
+    setFreeVariable(nm, "a", 20);
+    expectValue(nm, "sum1", 22);
+    expectValue(nm, "sum2", 12);
+    expectValue(nm, "sum3", 22);
+    calculatedVariable(nm, "sum2")->triggerRecalculation();
+    expectValue(nm, "sum2", 22);
+
+    // the variable evaluating for its duplicates goes without automatic updates: the duplicates must still be updated
+    calculatedVariable(nm, "sum1")->setAutoUpdate(false);
+    setFreeVariable(nm, "b", 30);
+    expectValue(nm, "sum1", 22);
+    expectValue(nm, "sum2", 22);
+    expectValue(nm, "sum3", 50);
+    expectValue(nm, "sum4", 50);
+
+    // and back
+    calculatedVariable(nm, "sum1")->setAutoUpdate(true);
+    setFreeVariable(nm, "a", 0);
+    expectValue(nm, "sum1", 30);
+    expectValue(nm, "sum2", 22);
+    expectValue(nm, "sum3", 30);
+    expectValue(nm, "sum4", 30);
+
+    // batch evaluation
+    CalculatedVariables::BatchEvaluator* scaledEvaluator = calculatedVariable(nm, "scaled1")->batchEvaluator();
+    CalculatedVariables::BatchEvaluator* mixEvaluator = calculatedVariable(nm, "mix1")->batchEvaluator();
+    expect(scaledEvaluator && scaledEvaluator->numMembers() == 3, "scaled1 is in a batch evaluation group of 3");
+    expect(calculatedVariable(nm, "scaled2")->batchEvaluator() == scaledEvaluator &&
+            calculatedVariable(nm, "scaled3")->batchEvaluator() == scaledEvaluator, "scaled2 and scaled3 are in the group of scaled1");
+    expect(mixEvaluator && mixEvaluator->numMembers() == 2 && calculatedVariable(nm, "mix2")->batchEvaluator() == mixEvaluator,
+            "mix1 and mix2 are in a batch evaluation group");
+    expect(calculatedVariable(nm, "copy")->batchEvaluator() == nullptr, "copy is not batched");
+
+    const std::vector<std::string> batched {"scaled1", "scaled2", "scaled3", "mix1", "mix2"};
+    std::map<std::string, uint64_t> evaluationsBefore;
+    for (const std::string& name : batched)
+        evaluationsBefore[name] = calculatedVariable(nm, name)->numEvaluations();
+    {
+        CalculatedVariables::BatchUpdate batchUpdate;
+        setFreeVariable(nm, "x1", 10);
+        setFreeVariable(nm, "x2", 20);
+        setFreeVariable(nm, "x3", 30);
+        expectEvaluations(nm, "scaled1", evaluationsBefore["scaled1"], 0); // not before the end of the scope
+    }
+    expectValue(nm, "scaled1", 21);
+    expectValue(nm, "scaled2", 41);
+    expectValue(nm, "scaled3", 61);
+    expectValue(nm, "mix1", 0);
+    expectValue(nm, "mix2", 40);
+    for (const std::string& name : batched)
+        expectEvaluations(nm, name, evaluationsBefore[name], 1);
+
+    // outside of a batch update as usual
+    setFreeVariable(nm, "x1", 0);
+    expectValue(nm, "scaled1", 1);
+    expectValue(nm, "mix1", -10);
+    expectValue(nm, "mix2", 50);
+    expectEvaluations(nm, "scaled1", evaluationsBefore["scaled1"], 2);
+    expectEvaluations(nm, "scaled2", evaluationsBefore["scaled2"], 1);
+    expectEvaluations(nm, "mix1", evaluationsBefore["mix1"], 2);
+
+    LOG(Log::INF) << "All checks passed.";
+}
+
+void QuasarServer::shutdown()
+{
+    LOG(Log::INF) << "Shutting down Quasar server.";
+}
+
+void QuasarServer::initializeLogIt()
+{
+    BaseQuasarServer::initializeLogIt();
+    LOG(Log::INF) << "Logging initialized.";
+}
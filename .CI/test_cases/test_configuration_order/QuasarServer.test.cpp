@@ -0,0 +1,198 @@
+/* © Copyright CERN, 2026.  All rights not expressly granted are reserved.
+ * QuasarServer.test.cpp
+ *
+ *  Created on: 19 Oct 2026
+ *
+ *  This file is part of Quasar.
+ *
+ *  Quasar is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU Lesser General Public Licence as published by
+ *  the Free Software Foundation, either version 3 of the Licence.
+ *
+ *  Quasar is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU Lesser General Public Licence for more details.
+ *
+ *  You should have received a copy of the GNU Lesser General Public License
+ *  along with Quasar.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+/* QuasarServer of the test_configuration_order test case, run by two CI jobs: one compares the sequential
+ * configuration with the parallel one (--configuration_threads), the other the configuration parsed from config.xml
+ * with the one loaded from a snapshot of it (--configuration_snapshot).
+ * initialize() writes the contents of the registries filled while the configuration is loaded to
+ * registration_order.compare.txt, which the jobs compare between the runs. It also checks that the Device Logic
+ * registries follow the order of the elements in config.xml (content_order of the xsdcxx object model, which the
+ * snapshot has to keep), and the value of a Calculated Variable depending on values from all over the configuration.
+ * A failed check throws so that the server fails to start.
+ */
+
+#include <algorithm>
+#include <fstream>
+#include <map>
+#include <regex>
+#include <sstream>
+#include <stdexcept>
+#include <string>
+#include <thread>
+#include <vector>
+
+#include "QuasarServer.h"
+#include <LogIt.h>
+#include <shutdown.h>
+
+#include <ASNodeManager.h>
+#include <CalculatedVariablesEngine.h>
+#include <DController.h>
+#include <DChannel.h>
+#include "../../.CI/test_cases/common/QuasarServerTestHelpers.h"
+
+template<typename Objects>
+static void writeFullNames (std::ostream& out, const std::string& title, const Objects& objects)
+{
+    out << "# " << title << std::endl;
+    for (const auto* object : objects)
+        out << object->getFullName() << std::endl;
+}
+
+template<typename Objects>
+static std::vector<std::string> fullNamesOf (const Objects& objects)
+{
+    std::vector<std::string> fullNames;
+    for (const auto* object : objects)
+        fullNames.push_back(object->getFullName());
+    return fullNames;
+}
+
+//! Full names of the objects in config.xml, in the order of the file
+struct ObjectsInFileOrder
+{
+    std::vector<std::string> controllers;
+    std::vector<std::string> channels;
+    std::vector<std::string> channelsOfGroups; //! these have no Device Logic parent: orphans
+};
+
+//! config.xml of this test case has one element per line, so it is read line by line rather than parsed
+static ObjectsInFileOrder readObjectsInFileOrder (const std::string& fileName)
+{
+    std::ifstream file (fileName);
+    if (!file)
+        throw std::runtime_error("Test failed: can't read " + fileName);
+    const std::regex opening ("^\\s*<(Controller|Group|Channel) name=\"([^\"]+)\"[^>]*?(/?)>");
+    const std::regex closing ("^\\s*</(Controller|Group)>");
+    ObjectsInFileOrder objects;
+    std::vector<std::pair<std::string, std::string>> parents; // class and full name
+    std::string line;
+    while (std::getline(file, line))
+    {
+        std::smatch match;
+        if (std::regex_search(line, match, opening))
+        {
+            const std::string fullName ((parents.empty() ? "" : parents.back().second + ".") + match[2].str());
+            if (match[1] == "Controller")
+                objects.controllers.push_back(fullName);
+            else if (match[1] == "Channel")
+            {
+                objects.channels.push_back(fullName);
+                if (!parents.empty() && parents.back().first == "Group")
+                    objects.channelsOfGroups.push_back(fullName);
+            }
+            if (match[3].str().empty() && match[1] != "Channel")
+                parents.emplace_back(match[1].str(), fullName);
+        }
+        else if (std::regex_search(line, closing))
+            parents.pop_back();
+    }
+    return objects;
+}
+
+static void expectFileOrder (const std::vector<std::string>& registered, const std::vector<std::string>& inFile, const std::string& what)
+{
+    if (registered != inFile)
+    {
+        std::ostringstream message;
+        message << "Test failed: " << what << " not in the order of config.xml:";
+        for (size_t i = 0; i < std::max(registered.size(), inFile.size()); ++i)
+            message << " [" << (i < registered.size() ? registered[i] : "-") << " / " << (i < inFile.size() ? inFile[i] : "-") << "]";
+        throw std::runtime_error(message.str());
+    }
+    LOG(Log::INF) << "OK: " << what << " in the order of config.xml (" << registered.size() << " objects)";
+}
+
+QuasarServer::QuasarServer() : BaseQuasarServer()
+{
+
+}
+
+QuasarServer::~QuasarServer()
+{
+
+}
+
+void QuasarServer::mainLoop()
+{
+    printServerMsg("Press "+std::string(SHUTDOWN_SEQUENCE)+" to shutdown server");
+
+    // Wait for user command to terminate the server thread.
+
+    while(ShutDownFlag() == 0)
+    {
+        std::this_thread::sleep_for(std::chrono::milliseconds(100));
+    }
+    printServerMsg(" Shutting down server");
+}
+
+void QuasarServer::initialize()
+{
+    LOG(Log::INF) << "Initializing Quasar server.";
+    std::ofstream out ("registration_order.compare.txt");
+
+    writeFullNames(out, "DController::allObjects()", Device::DController::allObjects());
+    writeFullNames(out, "DController::orphanedObjects()", Device::DController::orphanedObjects());
+    writeFullNames(out, "DChannel::allObjects()", Device::DChannel::allObjects());
+    writeFullNames(out, "DChannel::orphanedObjects()", Device::DChannel::orphanedObjects());
+
+    // the registry is keyed by type, which has no particular order
+    std::map<std::string, const AddressSpace::ASNodeManager::RegisteredNodes*> nodeRegistry;
+    for (const auto& registered : getNodeManager()->getNodeRegistry())
+        nodeRegistry.emplace(registered.first.name(), &registered.second);
+    for (const auto& registered : nodeRegistry)
+    {
+        out << "# node registry: " << registered.first << (registered.second->referenced ? "" : " (unreferenced)") << std::endl;
+        for (const UaNode* node : registered.second->nodes)
+            out << node->nodeId().toString().toUtf8() << std::endl;
+    }
+    out << "# unreferenced nodes" << std::endl;
+    for (const UaNode* node : getNodeManager()->getUnreferencedNodes())
+        out << node->nodeId().toString().toUtf8() << std::endl;
+
+    // ParserVariables and Calculated Variables, without the evaluation times
+    std::ostringstream graph;
+    CalculatedVariables::Engine::writeDependencyGraph(graph, CalculatedVariables::Engine::GraphFormat::Json);
+    out << "# dependency graph" << std::endl << std::regex_replace(graph.str(), std::regex(", \"evaluationTimeUs\": [0-9]+"), "");
+
+    if (!out)
+        throw std::runtime_error("Test failed: couldn't write registration_order.compare.txt");
+    LOG(Log::INF) << "Wrote registration_order.compare.txt";
+
+    // objects are registered depth-first in the order of the file, whichever elements of other types come between them
+    const ObjectsInFileOrder inFile (readObjectsInFileOrder("config.xml"));
+    expectFileOrder(fullNamesOf(Device::DController::allObjects()), inFile.controllers, "DController::allObjects()");
+    expectFileOrder(fullNamesOf(Device::DChannel::allObjects()), inFile.channels, "DChannel::allObjects()");
+    expectFileOrder(fullNamesOf(Device::DChannel::orphanedObjects()), inFile.channelsOfGroups, "DChannel::orphanedObjects()");
+
+    // (10 + 11 + 2) + (20 + 21) + 50 + 1, times 2
+    expectValue(getNodeManager(), "scaled", 230);
+}
+
+void QuasarServer::shutdown()
+{
+    LOG(Log::INF) << "Shutting down Quasar server.";
+}
+
+void QuasarServer::initializeLogIt()
+{
+    BaseQuasarServer::initializeLogIt();
+    LOG(Log::INF) << "Logging initialized.";
+}
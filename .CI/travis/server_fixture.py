@@ -34,6 +34,7 @@ import os
 import subprocess
 import time
 import argparse
+import shlex
 from colorama import Fore, Style
 
 def print_msg(msg):
@@ -64,11 +65,15 @@ def main():
         default=None,
         type=str,
         help='Supplementary command to run when server successfully started. Not mandatory.')
+    parser.add_argument("--server_args",
+        default='',
+        type=str,
+        help='Command line arguments for the server. Not mandatory.')
     args = parser.parse_args()
 
     os.chdir(os.path.sep.join(['build', 'bin']))
 
-    process = subprocess.Popen('./OpcUaServer')
+    process = subprocess.Popen(['./OpcUaServer'] + shlex.split(args.server_args))
 
     print_msg('Server process was run under PID: {0}'.format(process.pid))
     print_msg('Now waiting few seconds to let it spin up... ')
@@ -21,6 +21,12 @@
 
 #pragma once
 
+#include <memory>
+#include <string>
+
+#include <uadatavalue.h>
+#include <uavariant.h>
+
 namespace AddressSpace
 {
 
@@ -30,4 +36,66 @@ struct QuasarNullDataType {};
 
 const std::string SingleItemNodeObjectPrefix ("__single_item_node__");
 
+/** Read-only view of the variant held by a UaDataValue, so that getters don't need to copy the variant
+(with its string/ByteString/array payload) just to convert it. The UaDataValue must outlive the view.
+Only UA-SDK lets a UaVariant borrow the content of another variant; with other backends the view is a copy. */
+class VariantView
+{
+public:
+#ifdef BACKEND_UATOOLKIT
+    explicit VariantView (const UaDataValue& dataValue) { m_variant.attach(dataValue.value()); }
+    ~VariantView ()
+    {
+        OpcUa_Variant borrowed;
+        m_variant.detach(&borrowed); // the content still belongs to the UaDataValue
+    }
+#else
+    explicit VariantView (const UaDataValue& dataValue)
+    {
+        if (dataValue.value())
+            m_variant = UaVariant(*dataValue.value());
+    }
+#endif
+
+    VariantView (const VariantView& other) = delete;
+    VariantView& operator= (const VariantView& other) = delete;
+
+    const UaVariant& operator* () const { return m_variant; }
+    const UaVariant* operator-> () const { return std::addressof(m_variant); }
+
+private:
+    UaVariant m_variant;
+};
+
+/** True when dataValue already holds given value and status, i.e. storing them would change nothing. */
+inline bool holdsValueAndStatus (const UaDataValue& dataValue, const UaVariant& value, OpcUa_StatusCode statusCode)
+{
+    if (dataValue.statusCode() != statusCode)
+        return false;
+    VariantView current (dataValue);
+    return *current == value;
+}
+
+/** Builds a UaDataValue taking over the contents of value (which is left empty), instead of copying them.
+With backends other than UA-SDK the contents are copied. */
+inline UaDataValue makeDataValueDetaching (
+    UaVariant&          value,
+    OpcUa_StatusCode    statusCode,
+    const UaDateTime&   srcTime,
+    const UaDateTime&   serverTime)
+{
+#ifdef BACKEND_UATOOLKIT
+    UaDataValue dataValue;
+    dataValue.setValue(value, /*detach*/ OpcUa_True);
+    dataValue.setStatusCode(statusCode);
+    dataValue.setSourceTimestamp(srcTime);
+    dataValue.setServerTimestamp(serverTime);
+    return dataValue;
+#else
+    UaDataValue dataValue (value, statusCode, srcTime, serverTime);
+    value = UaVariant();
+    return dataValue;
+#endif
+}
+
 }
@@ -24,10 +24,15 @@
 #define ASNODEMANAGER_H_
 
 #include <functional> // for std::function
+#include <mutex>
+#include <typeindex>
+#include <unordered_map>
+#include <vector>
 
 #include <nodemanagerbase.h>
 
 #include <ASUtils.h>
+#include <QuasarRegistrationJournal.h>
 
 namespace AddressSpace
 
@@ -44,6 +49,18 @@ namespace AddressSpace
 
 	virtual ~ASNodeManager();
 
+  /* Node additions are serialized, so that the address space may be built by several threads
+   * (see the parallel configuration mode). The added nodes get registered (see getNodeRegistry()). */
+  UaStatus addNodeAndReference(
+    const UaNodeId&   sourceNodeId,
+    UaReferenceLists* pNewNode,
+    const UaNodeId&   referenceTypeId);
+
+  UaStatus addNodeAndReference(
+    UaReferenceLists* pSourceNode,
+    UaReferenceLists* pNewNode,
+    const UaNodeId&   referenceTypeId);
+
   /* Wrapper on top of UA-SDK that throws when the call wasn't successful */
   UaStatus addNodeAndReferenceThrows(
     const UaNodeId&   parentNodeId,
@@ -77,10 +94,31 @@ namespace AddressSpace
 	UaStatus addUnreferencedNode( UaNode* node );
 	const std::list<UaNode*>& getUnreferencedNodes () const { return m_unreferencedNodes; }
 
+  /* Registry of the nodes of this node manager by their concrete (most derived) type, used by ASNodeQueries
+   * so that lookups don't walk the whole node tree. Nodes added via addNodeAndReference(Throws) and
+   * addUnreferencedNode are registered automatically; nodes added otherwise may be registered explicitly.
+   * The registry is filled while the address space is built and is read-only afterwards.
+   */
+  struct RegisteredNodes
+  {
+    bool referenced; //! false for the nodes added with addUnreferencedNode
+    std::vector<UaNode*> nodes;
+  };
+  typedef std::unordered_map<std::type_index, RegisteredNodes> NodeRegistry;
+
+  void registerNode( UaNode* node, bool referenced=true );
+  const NodeRegistry& getNodeRegistry () const { return m_nodeRegistry; }
+  //! After the parallel configuration: puts the registry and the unreferenced nodes back in the order of the configuration file
+  void restoreRegistrationOrder( const Quasar::RegistrationJournal::Ranks& ranks );
+
   private:
     UaStatus createTypeNodes();
+    void registerAddedNode( UaReferenceLists* node ); // m_addNodesLock held
+    void registerNodeLocked( UaNode* node, bool referenced ); // m_addNodesLock held
     std::function<UaStatus ()> m_afterStartUpDelegate;
 	std::list<UaNode*> m_unreferencedNodes;
+	NodeRegistry m_nodeRegistry;
+	std::mutex m_addNodesLock; // guards the additions of nodes, m_unreferencedNodes and m_nodeRegistry
   };
 
 
@@ -28,6 +28,7 @@
 namespace AddressSpace
 {
 
+    /* Exact lookup, uses the node manager's own index of NodeIds */
     template<typename T>
         T* findByStringId (ASNodeManager *nm,   const std::string & stringId)
     {
@@ -42,8 +43,88 @@ namespace AddressSpace
             return 0;
     }
 
+    inline boost::xpressive::sregex compilePattern (const std::string & pattern)
+    {
+        boost::xpressive::sregex expression;
+        try
+        {
+            expression = boost::xpressive::sregex::compile( pattern );
+        }
+        catch (boost::xpressive::regex_error &e)
+        {
+            ABORT_MESSAGE(CONCAT3(" REGEX Expression is wrong:",pattern,e.what()));
+        }
+        return expression;
+    }
+
+    /* All registered nodes of one concrete type share the answer to the type check, so it is made once per type */
+    template<typename T>
+        bool registeredNodesAre (const ASNodeManager::RegisteredNodes & registered, OpcUa_NodeClass nodeClass)
+    {
+        if (registered.nodes.empty())
+            return false;
+        UaNode* sample = registered.nodes.front();
+        return sample->nodeClass() == nodeClass && sample == dynamic_cast<T*>(sample);
+    }
 
+    /* Collects the registered nodes of given node class which are T or its descendant, and whose string address
+     * matches the expression. Only the candidates of the right type are matched against the expression.
+     * With a non-empty scope, only the node of that address and its descendants (scope.*) are considered.
+     */
+    template<typename T>
+        unsigned int findRegisteredByRegex (
+            const ASNodeManager *nm,
+            OpcUa_NodeClass nodeClass,
+            bool includeUnreferenced,
+            const std::string & scope,
+            const boost::xpressive::sregex & expression,
+            std::vector<T*> &storage)
+    {
+        unsigned int numAdded=0;
+        for (const auto& typeAndNodes : nm->getNodeRegistry())
+        {
+            const ASNodeManager::RegisteredNodes& registered = typeAndNodes.second;
+            if (!registeredNodesAre<T>(registered, nodeClass) || (!registered.referenced && !includeUnreferenced))
+                continue;
+            for (UaNode* node : registered.nodes)
+            {
+                UaNodeId id = node->nodeId();
+                if (id.identifierType() != OpcUa_IdentifierType_String)
+                    continue;
+                std::string sId = UaString(id.identifierString()).toUtf8();
+                if (!scope.empty() &&
+                    !(sId.compare(0, scope.size(), scope) == 0 && (sId.size() == scope.size() || sId[scope.size()] == '.')))
+                    continue;
+                boost::xpressive::smatch what;
+                if (boost::xpressive::regex_match( sId , what, expression ))
+                {
+                    storage.push_back( dynamic_cast<T*>(node) );
+                    numAdded++;
+                }
+            }
+        }
+        return numAdded;
+    }
 
+    /* Costs O(number of registered types + number of results) */
+    template<typename T>
+        unsigned int findAllObjectsOfTypeInNodeManager (const ASNodeManager *nm, std::vector<T*> &storage)
+    {
+        unsigned int numAdded=0;
+        for (const auto& typeAndNodes : nm->getNodeRegistry())
+        {
+            const ASNodeManager::RegisteredNodes& registered = typeAndNodes.second;
+            if (!registeredNodesAre<T>(registered, OpcUa_NodeClass_Object))
+                continue;
+            for (UaNode* node : registered.nodes)
+                storage.push_back( dynamic_cast<T*>(node) );
+            numAdded += registered.nodes.size();
+        }
+        return numAdded;
+    }
+
+    /* Walks the node tree below startNode, for callers without the node manager at hand.
+     * Prefer findVariablesByPattern with the node manager which uses the registry. */
     template<typename T>
         unsigned int findVariablesByRegex (UaNode* startNode, const boost::xpressive::sregex & expression, std::vector<T*> &storage)
     {
@@ -61,11 +142,9 @@ namespace AddressSpace
                 boost::xpressive::smatch what;
                 if (boost::xpressive::regex_match( sId , what, expression ))
                 {
-                    std::cout << "name matched:" << sId << std::endl;
                     T* t = dynamic_cast<T*>(startNode);
                     if (t == startNode) /* this type itself or its descendant */
                     {
-                        std::cout << "type also matched" << std::endl;
                         storage.push_back( t );
                         return 1;
                     }
@@ -103,68 +182,39 @@ namespace AddressSpace
     {
         if (!startNode)
             return 0;
-        boost::xpressive::sregex expression;
-        try
-        {
-            expression = boost::xpressive::sregex::compile( pattern );
-        }
-        catch (boost::xpressive::regex_error &e)
+        return findVariablesByRegex<T> (startNode, compilePattern(pattern), storage);
+    }
+
+    /* The scope of the registry queries: the string address of startNode, empty for the Objects folder (everything).
+     * Returns false for start nodes which can't have children in this node manager. */
+    inline bool scopeOfStartNode (UaNode* startNode, std::string & scope)
+    {
+        UaNodeId id = startNode->nodeId();
+        if (id.identifierType() == OpcUa_IdentifierType_String)
         {
-            ABORT_MESSAGE(CONCAT3(" REGEX Expression is wrong:",pattern,e.what()));
+            scope = UaString(id.identifierString()).toUtf8();
+            return true;
         }
-        return findVariablesByRegex<T> (startNode, expression, storage);
+        scope.clear();
+        return id.namespaceIndex() == 0 && id.identifierType() == OpcUa_IdentifierType_Numeric && id.identifierNumeric() == OpcUaId_ObjectsFolder;
     }
 
     template<typename T>
-        unsigned int findAllByRegex (const ASNodeManager *nm, UaNode* startNode, OpcUa_NodeClass nodeClass, const boost::xpressive::sregex & expression, std::vector<T*> &storage)
+        unsigned int findVariablesByPattern (const ASNodeManager *nm, UaNode* startNode, const std::string & pattern, std::vector<T*> &storage)
     {
-        if (!startNode)
+        std::string scope;
+        if (!startNode || !scopeOfStartNode(startNode, scope))
             return 0;
+        return findRegisteredByRegex<T> (nm, OpcUa_NodeClass_Variable, /*include unreferenced*/ false, scope, compilePattern(pattern), storage);
+    }
 
-        UaNodeId id = startNode->nodeId();
-        unsigned int numAdded=0;
-        if (startNode->nodeClass() == nodeClass)
-        {
-            if (id.identifierType() == OpcUa_IdentifierType_String)
-            {
-                std::string sId = UaString(id.identifierString()).toUtf8();
-                boost::xpressive::smatch what;
-                if (boost::xpressive::regex_match( sId , what, expression ))
-                {
-                    //std::cout << "name matched:" << sId << std::endl;
-                    T* t = dynamic_cast<T*>(startNode);
-                    if (t == startNode) /* this type itself or its descendant */
-                    {
-                        //      std::cout << "type also matched" << std::endl;
-                        storage.push_back( t );
-                        numAdded++;
-                    }
-                    //else
-                    //  std::cout << "type didnt match:" << typeid(startNode).name() << std::endl;
-                }
-            }
-        }
-        if (startNode->nodeClass() == OpcUa_NodeClass_Object)
-        {
-            unsigned int nMatched=0;
-#ifdef BACKEND_OPEN62541
-    for(const UaNode::ReferencedTarget &target : *(startNode->referencedTargets()) )
-	{
-	  nMatched = nMatched + findAllByRegex(nm, target.target, nodeClass, expression, storage);
-	}
-#else // BACKEND_OPEN62541
-            UaReference *pRefList = const_cast<UaReference *>(startNode->getUaReferenceLists()->pTargetNodes());
-            while (pRefList)
-            {
-                nMatched = nMatched + findAllByRegex(nm, pRefList->pTargetNode(), nodeClass, expression, storage);
-                pRefList = pRefList->pNextForwardReference();
-            }
-
-#endif // BACKEND_OPEN62541
-            return nMatched;
-        }
-        else
-            return numAdded;
+    template<typename T>
+        unsigned int findAllByRegex (const ASNodeManager *nm, UaNode* startNode, OpcUa_NodeClass nodeClass, const boost::xpressive::sregex & expression, std::vector<T*> &storage)
+    {
+        std::string scope;
+        if (!startNode || !scopeOfStartNode(startNode, scope))
+            return 0;
+        return findRegisteredByRegex<T> (nm, nodeClass, /*include unreferenced*/ false, scope, expression, storage);
     }
 
     template<typename T>
@@ -172,58 +222,14 @@ namespace AddressSpace
     {
         if (!startNode)
             return 0;
-        boost::xpressive::sregex expression;
-        try
-        {
-            expression = boost::xpressive::sregex::compile( pattern );
-        }
-        catch (boost::xpressive::regex_error &e)
-        {
-            ABORT_MESSAGE(CONCAT3(" REGEX Expression is wrong:",pattern,e.what()));
-        }
-        return findAllByRegex<T> (nm, startNode, nodeClass, expression, storage);
+        return findAllByRegex<T> (nm, startNode, nodeClass, compilePattern(pattern), storage);
     }
 
+    /* Objects referenced from the Objects folder as well as the unreferenced ones */
     template<typename T>
         unsigned int findAllObjectsByPatternInNodeManager (ASNodeManager *nm, const std::string & pattern, std::vector<T*> &storage)
     {
-        boost::xpressive::sregex expression;
-        try
-        {
-            expression = boost::xpressive::sregex::compile( pattern );
-        }
-        catch (boost::xpressive::regex_error &e)
-        {
-            ABORT_MESSAGE(CONCAT3(" REGEX Expression is wrong:",pattern,e.what()));
-        }
-        int numReferenced = findAllByRegex<T> (nm, nm->getNode(UaNodeId(OpcUaId_ObjectsFolder, 0)), OpcUa_NodeClass_Object, expression, storage);
-        int numUnreferenced = 0;
-        auto& unreferencedNodes = nm->getUnreferencedNodes();
-        for (auto it = unreferencedNodes.begin(); it!=unreferencedNodes.end(); it++)
-        {
-            UaNodeId id = (*it)->nodeId();
-            if ((*it)->nodeClass() == OpcUa_NodeClass_Object)
-            {
-                if (id.identifierType() == OpcUa_IdentifierType_String)
-                {
-                    std::string sId = UaString(id.identifierString()).toUtf8();
-                    boost::xpressive::smatch what;
-                    if (boost::xpressive::regex_match( sId , what, expression ))
-                    {
-                        //std::cout << "name matched:" << sId << std::endl;
-                        T* t = dynamic_cast<T*>((*it));
-                        if (t == *it) /* this type itself or its descendant */
-                        {
-                            //  std::cout << "type also matched" << std::endl;
-                            storage.push_back( t );
-                            numUnreferenced++;
-                        }
-                    }
-                }
-            }
-        }
-        return numReferenced + numUnreferenced;
-
+        return findRegisteredByRegex<T> (nm, OpcUa_NodeClass_Object, /*include unreferenced*/ true, /*scope*/ "", compilePattern(pattern), storage);
     }
 
 }
@@ -50,6 +50,19 @@ namespace ArrayTools
 	void convertVectorToUaVariant( const std::vector <UaVariant>& input, UaVariant& output );
 	void convertVectorToUaVariant( const std::vector< UaByteString>& input, UaVariant& output );
 
+	/* Non-owning pointer+length variants of the above, for plain numeric data, so that callers don't need an intermediate vector. */
+	void convertBooleanArrayToUaVariant( const OpcUa_Boolean* input, size_t size, UaVariant& output );
+	void convertByteArrayToUaVariant( const OpcUa_Byte* input, size_t size, UaVariant& output );
+	void convertArrayToUaVariant( const OpcUa_SByte* input, size_t size, UaVariant& output );
+	void convertArrayToUaVariant( const OpcUa_Int16* input, size_t size, UaVariant& output );
+	void convertArrayToUaVariant( const OpcUa_UInt16* input, size_t size, UaVariant& output );
+	void convertArrayToUaVariant( const OpcUa_Int32* input, size_t size, UaVariant& output );
+	void convertArrayToUaVariant( const OpcUa_UInt32* input, size_t size, UaVariant& output );
+	void convertArrayToUaVariant( const OpcUa_Int64* input, size_t size, UaVariant& output );
+	void convertArrayToUaVariant( const OpcUa_UInt64* input, size_t size, UaVariant& output );
+	void convertArrayToUaVariant( const OpcUa_Float* input, size_t size, UaVariant& output );
+	void convertArrayToUaVariant( const OpcUa_Double* input, size_t size, UaVariant& output );
+
 	UaStatus convertUaVariantToBooleanVector( const UaVariant& input, std::vector <OpcUa_Boolean> &vect );
 	UaStatus convertUaVariantToByteVector( const UaVariant& input, std::vector <OpcUa_Byte> &vect );
 	UaStatus convertUaVariantToVector( const UaVariant& input, std::vector <OpcUa_SByte> &vect );
@@ -0,0 +1,129 @@
+/* © Copyright CERN, 2026.  All rights not expressly granted are reserved.
+ * AsyncUpdateChannel.h
+ *
+ *  Created on: 19 Oct 2026
+ *
+ *  This file is part of Quasar.
+ *
+ *  Quasar is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU Lesser General Public Licence as published by
+ *  the Free Software Foundation, either version 3 of the Licence.
+ *
+ *  Quasar is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU Lesser General Public Licence for more details.
+ *
+ *  You should have received a copy of the GNU Lesser General Public License
+ *  along with Quasar.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#ifndef ADDRESSSPACE_INCLUDE_ASYNCUPDATECHANNEL_H_
+#define ADDRESSSPACE_INCLUDE_ASYNCUPDATECHANNEL_H_
+
+#include <atomic>
+#include <mutex>
+#include <thread>
+#include <vector>
+#include <condition_variable>
+
+#include <uadatavalue.h>
+
+namespace AddressSpace
+{
+
+class ChangeNotifyingVariable;
+
+/* Decouples the threads producing values (typically device logic) from the address space:
+ * post() only puts the update into a bounded lock-free queue, and a dedicated publisher thread
+ * stores the updates in the variables, in batches. So a producer never waits for node locks held
+ * by the server's read and publish paths.
+ * The channel is optional: while it is not started, post() stores the value directly.
+ * Updates of the same variable are applied in the order they were posted.
+ */
+class AsyncUpdateChannel
+{
+public:
+    //! capacity gets rounded up to a power of 2
+    static void start (size_t capacity);
+    /*! Applies whatever is still queued and stops the publisher thread. The stopped channel is kept
+     *  (and its counters stay readable) until the program exits, as a poster or a reader may still hold it. */
+    static void shutdown ();
+    //! Is nullptr when the channel is not started; the pointer stays valid after shutdown()
+    static AsyncUpdateChannel* instance () { return s_instance.load(std::memory_order_acquire); }
+
+    /*! Returns false (and counts an overflow) when the queue is full; then the update is dropped.
+     *  With skipUnchanged, the update is dropped when applied if the variable holds the same value and status
+     *  by then: comparing on the producer's side would miss updates of the variable still in the queue. */
+    static bool post (ChangeNotifyingVariable* variable, const UaDataValue& dataValue, bool skipUnchanged = false);
+
+    //! Approximate number of updates waiting for the publisher
+    size_t depth () const;
+    size_t capacity () const { return m_cells.size(); }
+    size_t numOverflows () const { return m_numOverflows.load(std::memory_order_relaxed); }
+    size_t numPublished () const { return m_numPublished.load(std::memory_order_relaxed); }
+    //! Highest depth seen by the publisher so far
+    size_t maxDepth () const { return m_maxDepth.load(std::memory_order_relaxed); }
+
+    explicit AsyncUpdateChannel (size_t capacity);
+    ~AsyncUpdateChannel ();
+
+    AsyncUpdateChannel (const AsyncUpdateChannel& other) = delete;
+    AsyncUpdateChannel& operator= (const AsyncUpdateChannel& other) = delete;
+
+private:
+    struct Update
+    {
+        ChangeNotifyingVariable* variable;
+        UaDataValue dataValue;
+        bool skipUnchanged;
+    };
+
+    /* A cell of the bounded multi-producer queue (after D. Vyukov): the sequence number tells
+     * whether the cell is free for the producer of given position or holds an update for the consumer.
+     */
+    struct Cell
+    {
+        std::atomic<size_t> sequence;
+        Update update;
+    };
+
+    //! Counts a post() in progress, which shutdown() waits for
+    class PosterGuard
+    {
+    public:
+        explicit PosterGuard (AsyncUpdateChannel& channel): m_channel(channel) {}
+        ~PosterGuard () { m_channel.m_numPosters.fetch_sub(1); }
+    private:
+        AsyncUpdateChannel& m_channel;
+    };
+
+    //! Publishes whatever is still queued and joins the publisher; later calls do nothing
+    void stop ();
+    bool tryEnqueue (ChangeNotifyingVariable* variable, const UaDataValue& dataValue, bool skipUnchanged);
+    bool tryDequeue (Update& update);
+    void publish ();
+
+    std::vector<Cell> m_cells;
+    const size_t m_mask;
+    std::atomic<size_t> m_enqueuePosition;
+    std::atomic<size_t> m_dequeuePosition;
+
+    std::atomic<size_t> m_numOverflows;
+    std::atomic<size_t> m_numPublished;
+    std::atomic<size_t> m_maxDepth;
+    std::atomic<size_t> m_numPosters;
+
+    //! The publisher only takes the mutex to go to sleep when the queue is empty
+    std::mutex m_sleepLock;
+    std::condition_variable m_wakeUp;
+    std::atomic<bool> m_publisherSleeping;
+    bool m_quit;
+    std::thread m_publisher;
+
+    static std::atomic<AsyncUpdateChannel*> s_instance;
+};
+
+}
+
+#endif /* ADDRESSSPACE_INCLUDE_ASYNCUPDATECHANNEL_H_ */
@@ -24,11 +24,30 @@
 
 #include <opcua_basedatavariabletype.h>
 #include <functional>
-#include <list>
+#include <memory>
+#include <vector>
 
 namespace AddressSpace
 {
 
+class ChangeNotifyingVariable;
+
+/* Listener for the hot path: the variable decodes a scalar numeric value once per change and passes it as double,
+ * so the listener doesn't have to convert the UaVariant itself (see ChangeNotifyingVariable::toNumeric).
+ */
+class NumericChangeListener
+{
+public:
+    virtual ~NumericChangeListener () {}
+
+    //! isNumeric tells whether newValue holds a scalar numeric or boolean value, which then is given in numericValue
+    virtual void onChange (
+            ChangeNotifyingVariable& fromWhere,
+            const UaDataValue&       newValue,
+            bool                     isNumeric,
+            OpcUa_Double             numericValue) = 0;
+};
+
 class ChangeNotifyingVariable: public OpcUa::BaseDataVariableType
 {
 public:
@@ -51,12 +70,84 @@ public:
         const UaDataValue& dataValue,
         OpcUa_Boolean checkAccessLevel);
 
+    //! Listeners of both kinds are called in the order they were added
     virtual void addChangeListener (OnChangeListener onChangeListener);
+    //! The variable takes ownership of the listener
+    virtual void addChangeListener (std::unique_ptr<NumericChangeListener> numericChangeListener);
     virtual size_t changeListenerSize () const { return m_changeListeners.size(); }
     virtual void removeAllChangeListeners () { m_changeListeners.clear(); }
+    size_t numericChangeListenerSize () const;
+    //! The other listeners keep their order
+    void removeAllNumericChangeListeners ();
+
+    /*! Reads a scalar numeric or boolean value. Returns false for any other content.
+     *  With UA-SDK the variant is read in place; other backends convert a copy of it. */
+    static bool toNumeric (const UaDataValue& dataValue, OpcUa_Double& value);
 
 private:
-    std::list<OnChangeListener> m_changeListeners;
+
+    /* Holds the first listener inline, further ones (rare) in a vector allocated on demand. With zero or one
+     * listener -- almost all variables -- neither registration nor dispatch touches any heap-allocated container,
+     * and an empty list costs a pointer next to the inline listener: this is paid by every variable node.
+     */
+    template<typename T>
+    class ListenerList
+    {
+    public:
+        void add (T&& listener)
+        {
+            if (!m_first)
+                m_first = std::move(listener);
+            else
+            {
+                if (!m_others)
+                    m_others.reset(new std::vector<T>);
+                m_others->push_back(std::move(listener));
+            }
+        }
+        void clear () { m_first = T(); m_others.reset(); }
+        size_t size () const { return (m_first ? 1 : 0) + (m_others ? m_others->size() : 0); }
+        template<typename F> void forEach (F f)
+        {
+            if (!m_first)
+                return;
+            f(m_first);
+            if (m_others)
+                for (T& listener : *m_others)
+                    f(listener);
+        }
+        template<typename F> void forEach (F f) const
+        {
+            if (!m_first)
+                return;
+            f(m_first);
+            if (m_others)
+                for (const T& listener : *m_others)
+                    f(listener);
+        }
+        //! Keeps the order of the remaining listeners
+        template<typename P> void removeIf (P predicate)
+        {
+            std::vector<T> kept;
+            forEach([&](T& listener){ if (!predicate(listener)) kept.push_back(std::move(listener)); });
+            clear();
+            for (T& listener : kept)
+                add(std::move(listener));
+        }
+    private:
+        T m_first;
+        std::unique_ptr<std::vector<T>> m_others;
+    };
+
+    //! Either kind of listener: one list, so that they are called in the order they were added
+    struct Listener
+    {
+        OnChangeListener function;
+        std::unique_ptr<NumericChangeListener> numeric;
+        explicit operator bool () const { return function || numeric; }
+    };
+
+    ListenerList<Listener> m_changeListeners;
 };
 
 }
@@ -20,6 +20,7 @@
  *  along with Quasar.  If not, see <http://www.gnu.org/licenses/>.
  */
 
+#include <algorithm>
 #include <iostream>
 #include <stdexcept>
 #include <boost/xpressive/xpressive.hpp>
@@ -54,6 +55,30 @@ ASNodeManager::~ASNodeManager()
 
 }
 
+UaStatus ASNodeManager::addNodeAndReference(
+	const UaNodeId&   sourceNodeId,
+	UaReferenceLists* pNewNode,
+	const UaNodeId&   referenceTypeId)
+{
+	std::lock_guard<std::mutex> lock (m_addNodesLock);
+	UaStatus status = NodeManagerBase::addNodeAndReference(sourceNodeId, pNewNode, referenceTypeId);
+	if (status.isGood())
+		registerAddedNode(pNewNode);
+	return status;
+}
+
+UaStatus ASNodeManager::addNodeAndReference(
+	UaReferenceLists* pSourceNode,
+	UaReferenceLists* pNewNode,
+	const UaNodeId&   referenceTypeId)
+{
+	std::lock_guard<std::mutex> lock (m_addNodesLock);
+	UaStatus status = NodeManagerBase::addNodeAndReference(pSourceNode, pNewNode, referenceTypeId);
+	if (status.isGood())
+		registerAddedNode(pNewNode);
+	return status;
+}
+
 UaStatus ASNodeManager::addNodeAndReferenceThrows(
 	const UaNodeId&   parentNodeId,
 	UaReferenceLists* pNewNode,
@@ -178,8 +203,48 @@ UaStatus ASNodeManager::beforeShutDown()
 	UaStatus ASNodeManager::addUnreferencedNode( UaNode* node )
 	{
 		LOG(Log::TRC, "AddressSpace") << "Adding unreferenced node with nodeId: " << node->nodeId().toString().toUtf8();
-		m_unreferencedNodes.push_back(node);
+		{
+			std::lock_guard<std::mutex> lock (m_addNodesLock);
+			m_unreferencedNodes.push_back(node);
+			Quasar::RegistrationJournal::note(&m_unreferencedNodes, node);
+		}
+		registerNode(node, /*referenced*/ false);
 		return OpcUa_Good;
 	}
 
+	void ASNodeManager::registerNode( UaNode* node, bool referenced )
+	{
+		std::lock_guard<std::mutex> lock (m_addNodesLock);
+		registerNodeLocked(node, referenced);
+	}
+
+	void ASNodeManager::registerNodeLocked( UaNode* node, bool referenced )
+	{
+		auto it = m_nodeRegistry.find(std::type_index(typeid(*node)));
+		if (it == m_nodeRegistry.end())
+			it = m_nodeRegistry.emplace(std::type_index(typeid(*node)), RegisteredNodes{referenced, std::vector<UaNode*>()}).first;
+		it->second.nodes.push_back(node);
+		Quasar::RegistrationJournal::note(&it->second.nodes, node);
+	}
+
+	void ASNodeManager::restoreRegistrationOrder( const Quasar::RegistrationJournal::Ranks& ranks )
+	{
+		std::lock_guard<std::mutex> lock (m_addNodesLock);
+		for (auto& registered : m_nodeRegistry)
+		{
+			const void* registry = &registered.second.nodes;
+			std::stable_sort(registered.second.nodes.begin(), registered.second.nodes.end(), [&](UaNode* a, UaNode* b)
+				{ return ranks.rankOf(registry, a) < ranks.rankOf(registry, b); });
+		}
+		m_unreferencedNodes.sort([&](UaNode* a, UaNode* b)
+			{ return ranks.rankOf(&m_unreferencedNodes, a) < ranks.rankOf(&m_unreferencedNodes, b); });
+	}
+
+	void ASNodeManager::registerAddedNode( UaReferenceLists* node )
+	{
+		UaNode* uaNode = dynamic_cast<UaNode*>(node);
+		if (uaNode)
+			registerNodeLocked(uaNode, /*referenced*/ true);
+	}
+
 }
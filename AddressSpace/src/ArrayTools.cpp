@@ -22,6 +22,8 @@
 
 #include <ArrayTools.h>
 #include <algorithm>
+#include <cstring>
+#include <type_traits>
 
 namespace AddressSpace
 {
@@ -29,7 +31,8 @@ namespace AddressSpace
 namespace ArrayTools
 {
 
-/** This templatized function is applicable to "simple types" like arrays of ints, where an assignment operator does well... */
+/** This templatized function is applicable to types which need per-element conversion (e.g. Boolean which in some backends is a bool and might be
+ * stored in a bit-packed std::vector) ... */
 template<typename Type, typename ArrayType>
 static void vectorToUaVariant( const std::vector<Type>& input, UaVariant& output, void (UaVariant::*setterFunction)(ArrayType& array, OpcUa_Boolean detach) )
 {
@@ -37,7 +40,19 @@ static void vectorToUaVariant( const std::vector<Type>& input, UaVariant& output
     array.create( input.size() );
     for (unsigned int i=0; i<input.size(); ++i)
         array[i] = input[i];
-    (output.*setterFunction)(array, /*detach*/ OpcUa_False); // TODO @pnikiel: one day we should switch to detach=true, after testing...
+    (output.*setterFunction)(array, /*detach*/ OpcUa_True);
+}
+
+/** ... and this one to plain numeric types whose stack representation is the C++ one: one bulk copy, and then the variant takes over the buffer. */
+template<typename Type, typename ArrayType>
+static void contiguousToUaVariant( const Type* input, size_t size, UaVariant& output, void (UaVariant::*setterFunction)(ArrayType& array, OpcUa_Boolean detach) )
+{
+    static_assert( std::is_arithmetic<Type>::value, "only for plain numeric types" );
+    ArrayType array;
+    array.create( size );
+    if (size > 0)
+        std::memcpy( &array[0], input, size * sizeof (Type) );
+    (output.*setterFunction)(array, /*detach*/ OpcUa_True);
 }
 
 /** This templatized function is applicable to "complex types" like arrays of UaByteString, where an assignment operator to the stack type is not defined... */
@@ -48,7 +63,7 @@ static void vectorToUaVariantByCopyTo( const std::vector<Type>& input, UaVariant
     array.create( input.size() );
     for (unsigned int i=0; i<input.size(); ++i)
         input[i].copyTo(&array[i]);
-    (output.*setterFunction)(array, /*detach*/ OpcUa_False); // TODO @pnikiel: one day we should switch to detach=true, after testing...
+    (output.*setterFunction)(array, /*detach*/ OpcUa_True);
 }
 
 void convertBooleanVectorToUaVariant( const std::vector<OpcUa_Boolean>& input, UaVariant& output )
@@ -58,57 +73,52 @@ void convertBooleanVectorToUaVariant( const std::vector<OpcUa_Boolean>& input, U
 
 void convertByteVectorToUaVariant( const std::vector <OpcUa_Byte>& input, UaVariant &output )
 {
-    UaByteArray array;
-    if (input.size() > 0)
-    {
-        array = UaByteArray( reinterpret_cast<const char*>(&input[0]), input.size() );
-    }
-    output.setByteArray(array, /*detach*/ OpcUa_False);
+    convertByteArrayToUaVariant (input.data(), input.size(), output);
 }
 
 void convertVectorToUaVariant( const std::vector <OpcUa_SByte>& input, UaVariant &output )
 {
-    vectorToUaVariant (input, output, &UaVariant::setSByteArray);
+    contiguousToUaVariant (input.data(), input.size(), output, &UaVariant::setSByteArray);
 }
 
 void convertVectorToUaVariant( const std::vector <OpcUa_Int16>& input, UaVariant &output )
 {
-    vectorToUaVariant (input, output, &UaVariant::setInt16Array);
+    contiguousToUaVariant (input.data(), input.size(), output, &UaVariant::setInt16Array);
 }
 
 void convertVectorToUaVariant( const std::vector <OpcUa_UInt16>& input, UaVariant &output )
 {
-    vectorToUaVariant (input, output, &UaVariant::setUInt16Array);
+    contiguousToUaVariant (input.data(), input.size(), output, &UaVariant::setUInt16Array);
 }
 
 void convertVectorToUaVariant( const std::vector <OpcUa_Int32>& input, UaVariant &output )
 {
-    vectorToUaVariant (input, output, &UaVariant::setInt32Array);
+    contiguousToUaVariant (input.data(), input.size(), output, &UaVariant::setInt32Array);
 }
 
 void convertVectorToUaVariant( const std::vector <OpcUa_UInt32>& input, UaVariant &output )
 {
-    vectorToUaVariant (input, output, &UaVariant::setUInt32Array);
+    contiguousToUaVariant (input.data(), input.size(), output, &UaVariant::setUInt32Array);
 }
 
 void convertVectorToUaVariant( const std::vector <OpcUa_Int64>& input, UaVariant &output )
 {
-    vectorToUaVariant (input, output, &UaVariant::setInt64Array);
+    contiguousToUaVariant (input.data(), input.size(), output, &UaVariant::setInt64Array);
 }
 
 void convertVectorToUaVariant( const std::vector <OpcUa_UInt64>& input, UaVariant &output  )
 {
-    vectorToUaVariant (input, output, &UaVariant::setUInt64Array);
+    contiguousToUaVariant (input.data(), input.size(), output, &UaVariant::setUInt64Array);
 }
 
 void convertVectorToUaVariant( const std::vector <OpcUa_Float>& input, UaVariant &output  )
 {
-    vectorToUaVariant (input, output, &UaVariant::setFloatArray);
+    contiguousToUaVariant (input.data(), input.size(), output, &UaVariant::setFloatArray);
 }
 
 void convertVectorToUaVariant( const std::vector <OpcUa_Double>& input, UaVariant &output )
 {
-    vectorToUaVariant (input, output, &UaVariant::setDoubleArray);
+    contiguousToUaVariant (input.data(), input.size(), output, &UaVariant::setDoubleArray);
 }
 
 void convertVectorToUaVariant( const std::vector< UaByteString>& input, UaVariant& output )
@@ -126,6 +136,70 @@ void convertVectorToUaVariant( const std::vector <UaString>& input, UaVariant& o
     vectorToUaVariantByCopyTo ( input, output, &UaVariant::setStringArray);
 }
 
+void convertBooleanArrayToUaVariant( const OpcUa_Boolean* input, size_t size, UaVariant& output )
+{
+    UaBooleanArray array;
+    array.create( size );
+    for (size_t i=0; i<size; ++i)
+        array[i] = input[i];
+    output.setBoolArray(array, /*detach*/ OpcUa_True);
+}
+
+void convertByteArrayToUaVariant( const OpcUa_Byte* input, size_t size, UaVariant& output )
+{
+    UaByteArray array;
+    if (size > 0)
+    {
+        array = UaByteArray( reinterpret_cast<const char*>(input), size );
+    }
+    output.setByteArray(array, /*detach*/ OpcUa_True);
+}
+
+void convertArrayToUaVariant( const OpcUa_SByte* input, size_t size, UaVariant& output )
+{
+    contiguousToUaVariant (input, size, output, &UaVariant::setSByteArray);
+}
+
+void convertArrayToUaVariant( const OpcUa_Int16* input, size_t size, UaVariant& output )
+{
+    contiguousToUaVariant (input, size, output, &UaVariant::setInt16Array);
+}
+
+void convertArrayToUaVariant( const OpcUa_UInt16* input, size_t size, UaVariant& output )
+{
+    contiguousToUaVariant (input, size, output, &UaVariant::setUInt16Array);
+}
+
+void convertArrayToUaVariant( const OpcUa_Int32* input, size_t size, UaVariant& output )
+{
+    contiguousToUaVariant (input, size, output, &UaVariant::setInt32Array);
+}
+
+void convertArrayToUaVariant( const OpcUa_UInt32* input, size_t size, UaVariant& output )
+{
+    contiguousToUaVariant (input, size, output, &UaVariant::setUInt32Array);
+}
+
+void convertArrayToUaVariant( const OpcUa_Int64* input, size_t size, UaVariant& output )
+{
+    contiguousToUaVariant (input, size, output, &UaVariant::setInt64Array);
+}
+
+void convertArrayToUaVariant( const OpcUa_UInt64* input, size_t size, UaVariant& output )
+{
+    contiguousToUaVariant (input, size, output, &UaVariant::setUInt64Array);
+}
+
+void convertArrayToUaVariant( const OpcUa_Float* input, size_t size, UaVariant& output )
+{
+    contiguousToUaVariant (input, size, output, &UaVariant::setFloatArray);
+}
+
+void convertArrayToUaVariant( const OpcUa_Double* input, size_t size, UaVariant& output )
+{
+    contiguousToUaVariant (input, size, output, &UaVariant::setDoubleArray);
+}
+
 template<typename Type, typename ArrayType>
 static  UaStatus uaVariantToVector( const UaVariant& input, std::vector<Type>& output, OpcUa_StatusCode (UaVariant::*getterFunction)(ArrayType& array) const )
 {
@@ -139,6 +213,32 @@ static  UaStatus uaVariantToVector( const UaVariant& input, std::vector<Type>& o
     return OpcUa_Good;
 }
 
+/** For plain numeric types. When the variant already holds an array of the requested type, its memory is copied directly into the vector
+ * (UA-SDK only, where the variant layout is known), otherwise it goes through the (converting) getter and one bulk copy. */
+template<typename Type, typename ArrayType>
+static  UaStatus uaVariantToContiguous( const UaVariant& input, std::vector<Type>& output, OpcUa_StatusCode (UaVariant::*getterFunction)(ArrayType& array) const, OpcUa_BuiltInType builtInType )
+{
+    static_assert( std::is_arithmetic<Type>::value, "only for plain numeric types" );
+#ifdef BACKEND_UATOOLKIT
+    const OpcUa_Variant* variant = input;
+    if (variant->ArrayType == OpcUa_VariantArrayType_Array && variant->Datatype == builtInType)
+    {
+        const Type* data = static_cast<const Type*>(variant->Value.Array.Value.Array);
+        output.assign( data, data + std::max<OpcUa_Int32>(variant->Value.Array.Length, 0) );
+        return OpcUa_Good;
+    }
+#endif
+    ArrayType array;
+    UaStatus status = (input.*getterFunction)(array);
+    if (!status.isGood())
+        return status;
+    if (array.length() > 0)
+        output.assign( &array[0], &array[0] + array.length() );
+    else
+        output.clear();
+    return OpcUa_Good;
+}
+
 UaStatus convertUaVariantToBooleanVector( const UaVariant& input, std::vector <OpcUa_Boolean> &output )
 {
     return uaVariantToVector(input, output, &UaVariant::toBoolArray);
@@ -157,47 +257,47 @@ UaStatus convertUaVariantToByteVector( const UaVariant& input, std::vector <OpcU
 
 UaStatus convertUaVariantToVector( const UaVariant& input, std::vector <OpcUa_SByte> &output )
 {
-    return uaVariantToVector(input, output, &UaVariant::toSByteArray);
+    return uaVariantToContiguous(input, output, &UaVariant::toSByteArray, OpcUaType_SByte);
 }
 
 UaStatus convertUaVariantToVector( const UaVariant& input, std::vector <OpcUa_Int16> &output )
 {
-    return uaVariantToVector(input, output, &UaVariant::toInt16Array);
+    return uaVariantToContiguous(input, output, &UaVariant::toInt16Array, OpcUaType_Int16);
 }
 
 UaStatus convertUaVariantToVector( const UaVariant& input, std::vector <OpcUa_UInt16> &output )
 {
-    return uaVariantToVector(input, output, &UaVariant::toUInt16Array);
+    return uaVariantToContiguous(input, output, &UaVariant::toUInt16Array, OpcUaType_UInt16);
 }
 
 UaStatus convertUaVariantToVector( const UaVariant& input, std::vector <OpcUa_Int32> &output )
 {
-    return uaVariantToVector(input, output, &UaVariant::toInt32Array);
+    return uaVariantToContiguous(input, output, &UaVariant::toInt32Array, OpcUaType_Int32);
 }
 
 UaStatus convertUaVariantToVector( const UaVariant& input, std::vector <OpcUa_UInt32> &output )
 {
-    return uaVariantToVector(input, output, &UaVariant::toUInt32Array);
+    return uaVariantToContiguous(input, output, &UaVariant::toUInt32Array, OpcUaType_UInt32);
 }
 
 UaStatus convertUaVariantToVector( const UaVariant& input, std::vector <OpcUa_Int64> &output )
 {
-    return uaVariantToVector(input, output, &UaVariant::toInt64Array);
+    return uaVariantToContiguous(input, output, &UaVariant::toInt64Array, OpcUaType_Int64);
 }
 
 UaStatus convertUaVariantToVector( const UaVariant& input, std::vector <OpcUa_UInt64> &output )
 {
-    return uaVariantToVector(input, output, &UaVariant::toUInt64Array);
+    return uaVariantToContiguous(input, output, &UaVariant::toUInt64Array, OpcUaType_UInt64);
 }
 
 UaStatus convertUaVariantToVector( const UaVariant& input, std::vector <OpcUa_Float> &output )
 {
-    return uaVariantToVector(input, output, &UaVariant::toFloatArray);
+    return uaVariantToContiguous(input, output, &UaVariant::toFloatArray, OpcUaType_Float);
 }
 
 UaStatus convertUaVariantToVector( const UaVariant& input, std::vector <OpcUa_Double> &output )
 {
-    return uaVariantToVector(input, output, &UaVariant::toDoubleArray);
+    return uaVariantToContiguous(input, output, &UaVariant::toDoubleArray, OpcUaType_Double);
 }
 
 UaStatus convertUaVariantToVector( const UaVariant& input, std::vector <UaString> &output )
@@ -0,0 +1,233 @@
+/* © Copyright CERN, 2026.  All rights not expressly granted are reserved.
+ * AsyncUpdateChannel.cpp
+ *
+ *  Created on: 19 Oct 2026
+ *
+ *  This file is part of Quasar.
+ *
+ *  Quasar is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU Lesser General Public Licence as published by
+ *  the Free Software Foundation, either version 3 of the Licence.
+ *
+ *  Quasar is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU Lesser General Public Licence for more details.
+ *
+ *  You should have received a copy of the GNU Lesser General Public License
+ *  along with Quasar.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <memory>
+#include <stdexcept>
+
+#include <LogIt.h>
+
+#include <AsyncUpdateChannel.h>
+#include <ASCommon.h>
+#include <ChangeNotifyingVariable.h>
+#include <BatchEvaluator.h>
+
+namespace AddressSpace
+{
+
+//! Max number of updates applied within one CalculatedVariables::BatchUpdate
+static const size_t s_publishBatchSize = 256;
+
+std::atomic<AsyncUpdateChannel*> AsyncUpdateChannel::s_instance (nullptr);
+
+//! Own the channels after shutdown(), so that whoever still holds the pointer from instance() finds a valid object
+static std::vector<std::unique_ptr<AsyncUpdateChannel>> s_stoppedChannels;
+
+static size_t roundUpToPowerOf2 (size_t n)
+{
+    size_t result = 2;
+    while (result < n)
+        result <<= 1;
+    return result;
+}
+
+void AsyncUpdateChannel::start (size_t capacity)
+{
+    if (instance())
+        throw std::logic_error("AsyncUpdateChannel is already started");
+    s_instance.store(new AsyncUpdateChannel(capacity), std::memory_order_release);
+}
+
+void AsyncUpdateChannel::shutdown ()
+{
+    AsyncUpdateChannel* channel = s_instance.exchange(nullptr);
+    if (!channel)
+        return;
+    // a post() that registered before the exchange enqueues into this channel: wait for it, so the update gets published
+    while (channel->m_numPosters.load() > 0)
+        std::this_thread::yield();
+    channel->stop();
+    s_stoppedChannels.emplace_back(channel);
+}
+
+static UaStatus applyUpdate (ChangeNotifyingVariable* variable, const UaDataValue& dataValue, bool skipUnchanged)
+{
+    if (skipUnchanged)
+    {
+        VariantView value (dataValue);
+        if (holdsValueAndStatus(variable->value(/*session*/ nullptr), *value, dataValue.statusCode()))
+            return OpcUa_Good; // nothing would change
+    }
+    return variable->setValue(/*session*/ nullptr, dataValue, /*check access*/ OpcUa_False);
+}
+
+bool AsyncUpdateChannel::post (ChangeNotifyingVariable* variable, const UaDataValue& dataValue, bool skipUnchanged)
+{
+    AsyncUpdateChannel* channel = nullptr;
+    while (true)
+    {
+        channel = instance();
+        if (!channel)
+            return applyUpdate(variable, dataValue, skipUnchanged).isGood();
+        // pairs with shutdown(): either it waits for us, or we see the channel is no longer the running one
+        channel->m_numPosters.fetch_add(1);
+        if (s_instance.load() == channel)
+            break;
+        channel->m_numPosters.fetch_sub(1);
+    }
+    PosterGuard guard (*channel);
+    if (!channel->tryEnqueue(variable, dataValue, skipUnchanged))
+    {
+        channel->m_numOverflows.fetch_add(1, std::memory_order_relaxed);
+        return false;
+    }
+    // pairs with the fence in publish(): either the publisher sees the update or we see it went to sleep
+    std::atomic_thread_fence(std::memory_order_seq_cst);
+    if (channel->m_publisherSleeping.load(std::memory_order_relaxed))
+    {
+        std::lock_guard<std::mutex> lock (channel->m_sleepLock);
+        channel->m_publisherSleeping.store(false, std::memory_order_relaxed);
+        channel->m_wakeUp.notify_one();
+    }
+    return true;
+}
+
+AsyncUpdateChannel::AsyncUpdateChannel (size_t capacity):
+        m_cells(roundUpToPowerOf2(capacity)),
+        m_mask(m_cells.size() - 1),
+        m_enqueuePosition(0),
+        m_dequeuePosition(0),
+        m_numOverflows(0),
+        m_numPublished(0),
+        m_maxDepth(0),
+        m_numPosters(0),
+        m_publisherSleeping(false),
+        m_quit(false)
+{
+    for (size_t i = 0; i < m_cells.size(); ++i)
+        m_cells[i].sequence.store(i, std::memory_order_relaxed);
+    m_publisher = std::thread(&AsyncUpdateChannel::publish, this);
+    LOG(Log::INF) << "Started the asynchronous update channel, capacity " << m_cells.size() << " updates";
+}
+
+AsyncUpdateChannel::~AsyncUpdateChannel ()
+{
+    stop();
+}
+
+void AsyncUpdateChannel::stop ()
+{
+    {
+        std::lock_guard<std::mutex> lock (m_sleepLock);
+        if (m_quit)
+            return;
+        m_quit = true;
+    }
+    m_wakeUp.notify_one();
+    m_publisher.join();
+    LOG(Log::INF) << "Stopped the asynchronous update channel: " << numPublished() << " updates published, " <<
+            numOverflows() << " dropped on overflow, max depth " << maxDepth();
+}
+
+size_t AsyncUpdateChannel::depth () const
+{
+    size_t enqueuePosition = m_enqueuePosition.load(std::memory_order_relaxed);
+    size_t dequeuePosition = m_dequeuePosition.load(std::memory_order_relaxed);
+    return enqueuePosition > dequeuePosition ? enqueuePosition - dequeuePosition : 0;
+}
+
+bool AsyncUpdateChannel::tryEnqueue (ChangeNotifyingVariable* variable, const UaDataValue& dataValue, bool skipUnchanged)
+{
+    size_t position = m_enqueuePosition.load(std::memory_order_relaxed);
+    while (true)
+    {
+        Cell& cell = m_cells[position & m_mask];
+        size_t sequence = cell.sequence.load(std::memory_order_acquire);
+        if (sequence == position)
+        {
+            if (m_enqueuePosition.compare_exchange_weak(position, position + 1, std::memory_order_relaxed))
+            {
+                cell.update.variable = variable;
+                cell.update.dataValue = dataValue;
+                cell.update.skipUnchanged = skipUnchanged;
+                cell.sequence.store(position + 1, std::memory_order_release);
+                return true;
+            }
+        }
+        else if (sequence < position)
+            return false; // the cell still holds an update from the previous lap: full
+        else
+            position = m_enqueuePosition.load(std::memory_order_relaxed);
+    }
+}
+
+//! Only called from the publisher thread
+bool AsyncUpdateChannel::tryDequeue (Update& update)
+{
+    size_t position = m_dequeuePosition.load(std::memory_order_relaxed);
+    Cell& cell = m_cells[position & m_mask];
+    if (cell.sequence.load(std::memory_order_acquire) != position + 1)
+        return false;
+    update.variable = cell.update.variable;
+    update.dataValue = cell.update.dataValue;
+    update.skipUnchanged = cell.update.skipUnchanged;
+    cell.update.dataValue = UaDataValue(); // don't keep the payload alive in the queue
+    m_dequeuePosition.store(position + 1, std::memory_order_relaxed);
+    cell.sequence.store(position + m_cells.size(), std::memory_order_release);
+    return true;
+}
+
+void AsyncUpdateChannel::publish ()
+{
+    Update update;
+    while (true)
+    {
+        size_t currentDepth = depth();
+        if (currentDepth > m_maxDepth.load(std::memory_order_relaxed))
+            m_maxDepth.store(currentDepth, std::memory_order_relaxed);
+        size_t numApplied = 0;
+        {
+            // Calculated Variables depending on several updated variables are evaluated once per batch
+            CalculatedVariables::BatchUpdate batchUpdate;
+            while (numApplied < s_publishBatchSize && tryDequeue(update))
+            {
+                UaStatus status = applyUpdate(update.variable, update.dataValue, update.skipUnchanged);
+                if (!status.isGood())
+                    LOG(Log::ERR) << "Asynchronous update of " << update.variable->nodeId().toString().toUtf8() << " failed: " << status.toString().toUtf8();
+                numApplied++;
+            }
+        }
+        update.dataValue = UaDataValue();
+        m_numPublished.fetch_add(numApplied, std::memory_order_relaxed);
+        if (numApplied > 0)
+            continue;
+
+        std::unique_lock<std::mutex> lock (m_sleepLock);
+        if (m_quit && depth() == 0)
+            return;
+        m_publisherSleeping.store(true, std::memory_order_relaxed);
+        std::atomic_thread_fence(std::memory_order_seq_cst);
+        if (depth() == 0 && !m_quit)
+            // the timeout is just a safety net, producers wake us up
+            m_wakeUp.wait_for(lock, std::chrono::milliseconds(100));
+        m_publisherSleeping.store(false, std::memory_order_relaxed);
+    }
+}
+
+}
@@ -56,16 +56,106 @@ UaStatus ChangeNotifyingVariable::setValue(
 {
     UaStatus status = OpcUa::BaseDataVariableType::setValue(pSession, dataValue, checkAccessLevel);
     if (status.isGood())
-        for (OnChangeListener& changeListener : m_changeListeners)
+    {
+        // the numeric value is decoded once, for the first numeric listener
+        bool decoded = false;
+        bool isNumeric = false;
+        OpcUa_Double numericValue = 0;
+        m_changeListeners.forEach([&](Listener& listener)
         {
-            changeListener(*this, dataValue);
-        }
+            if (listener.numeric)
+            {
+                if (!decoded)
+                {
+                    isNumeric = toNumeric(dataValue, numericValue);
+                    decoded = true;
+                }
+                listener.numeric->onChange(*this, dataValue, isNumeric, numericValue);
+            }
+            else
+                listener.function(*this, dataValue);
+        });
+    }
     return status;
 }
 
 void ChangeNotifyingVariable::addChangeListener (OnChangeListener onChangeListener)
 {
-    m_changeListeners.push_back(onChangeListener);
+    Listener listener;
+    listener.function = std::move(onChangeListener);
+    m_changeListeners.add(std::move(listener));
+}
+
+void ChangeNotifyingVariable::addChangeListener (std::unique_ptr<NumericChangeListener> numericChangeListener)
+{
+    Listener listener;
+    listener.numeric = std::move(numericChangeListener);
+    m_changeListeners.add(std::move(listener));
+}
+
+size_t ChangeNotifyingVariable::numericChangeListenerSize () const
+{
+    size_t size = 0;
+    m_changeListeners.forEach([&size](const Listener& listener)
+    {
+        if (listener.numeric)
+            size++;
+    });
+    return size;
+}
+
+void ChangeNotifyingVariable::removeAllNumericChangeListeners ()
+{
+    m_changeListeners.removeIf([](const Listener& listener){ return bool(listener.numeric); });
+}
+
+bool ChangeNotifyingVariable::toNumeric (const UaDataValue& dataValue, OpcUa_Double& value)
+{
+    const OpcUa_Variant* variant = dataValue.value();
+    if (!variant)
+        return false;
+#ifdef BACKEND_UATOOLKIT
+    // the UA-SDK variant is a plain tagged union which we can read in place
+    if (variant->ArrayType != OpcUa_VariantArrayType_Scalar)
+        return false;
+    switch (variant->Datatype)
+    {
+        case OpcUaType_Boolean: value = variant->Value.Boolean ? 1 : 0; return true;
+        case OpcUaType_SByte:   value = variant->Value.SByte; return true;
+        case OpcUaType_Byte:    value = variant->Value.Byte; return true;
+        case OpcUaType_Int16:   value = variant->Value.Int16; return true;
+        case OpcUaType_UInt16:  value = variant->Value.UInt16; return true;
+        case OpcUaType_Int32:   value = variant->Value.Int32; return true;
+        case OpcUaType_UInt32:  value = variant->Value.UInt32; return true;
+        case OpcUaType_Int64:   value = static_cast<OpcUa_Double>(variant->Value.Int64); return true;
+        case OpcUaType_UInt64:  value = static_cast<OpcUa_Double>(variant->Value.UInt64); return true;
+        case OpcUaType_Float:   value = variant->Value.Float; return true;
+        case OpcUaType_Double:  value = variant->Value.Double; return true;
+        default: return false;
+    }
+#else
+    // other backends don't expose the variant layout, so go through UaVariant
+    UaVariant asVariant (*variant);
+    if (asVariant.isArray())
+        return false;
+    switch (asVariant.type())
+    {
+        case OpcUaType_Boolean:
+        case OpcUaType_SByte:
+        case OpcUaType_Byte:
+        case OpcUaType_Int16:
+        case OpcUaType_UInt16:
+        case OpcUaType_Int32:
+        case OpcUaType_UInt32:
+        case OpcUaType_Int64:
+        case OpcUaType_UInt64:
+        case OpcUaType_Float:
+        case OpcUaType_Double:
+            return asVariant.toDouble(value) == OpcUa_Good;
+        default:
+            return false;
+    }
+#endif
 }
 
 }
@@ -28,6 +28,7 @@
 #include <FreeVariablesEngine.h>
 #include <ChangeNotifyingVariable.h>
 #include <Utils.h>
+#include <QuasarTimestampProvider.h>
 #include <CalculatedVariablesEngine.h>
 #include <LogIt.h>
 
@@ -193,7 +194,7 @@ void FreeVariablesEngine::instantiateFreeVariable(
         CalculatedVariables::Engine::registerVariableForCalculatedVariables(freeVariable);
 
     // set the initial value (important do it after registration for calc vars, not to lose the initial update)
-    freeVariable->setValue(/*session*/0, UaDataValue(initialValue, OpcUa_Good, UaDateTime::now(), UaDateTime::now()), /* check access*/ OpcUa_False);
+    freeVariable->setValue(/*session*/0, UaDataValue(initialValue, OpcUa_Good, Quasar::TimestampProvider::now(), Quasar::TimestampProvider::now()), /* check access*/ OpcUa_False);
 
     // access level
     switch(config.accessLevel())
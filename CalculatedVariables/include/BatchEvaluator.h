@@ -0,0 +1,114 @@
+/* © Copyright CERN, 2026.  All rights not expressly granted are reserved.
+ * BatchEvaluator.h
+ *
+ *  Created on: 19 Oct 2026
+ *
+ *  This file is part of Quasar.
+ *
+ *  Quasar is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU Lesser General Public Licence as published by
+ *  the Free Software Foundation, either version 3 of the Licence.
+ *
+ *  Quasar is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU Lesser General Public Licence for more details.
+ *
+ *  You should have received a copy of the GNU Lesser General Public License
+ *  along with Quasar.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#ifndef CALCULATEDVARIABLES_INCLUDE_BATCHEVALUATOR_H_
+#define CALCULATEDVARIABLES_INCLUDE_BATCHEVALUATOR_H_
+
+#include <string>
+#include <vector>
+#include <mutex>
+
+#include <muParser.h>
+
+namespace CalculatedVariables
+{
+
+class CalculatedVariable;
+class ParserVariable;
+
+/* Evaluates together all CalculatedVariables whose value formulas are identical up to the names of inputs
+ * (typically instances of the same generic formula), using muparser bulk mode over contiguous input columns.
+ * Only used for variables updated within a BatchUpdate scope, otherwise every variable uses its own parser.
+ */
+class BatchEvaluator
+{
+public:
+    //! An input of a member is either a ParserVariable or a constant (then variable is nullptr)
+    struct Input
+    {
+        ParserVariable* variable;
+        double constant;
+    };
+
+    //! normalizedFormula refers to inputs by inputName(i) for i in [0, numInputs)
+    BatchEvaluator (const std::string& normalizedFormula, size_t numInputs);
+
+    static std::string inputName (size_t i);
+
+    //! To be called before the first evaluate()
+    void addMember (CalculatedVariable* variable, const std::vector<Input>& inputs);
+    size_t numMembers () const { return m_members.size(); }
+
+    //! variables must be members of this evaluator
+    void evaluate (const std::vector<CalculatedVariable*>& variables);
+
+private:
+    struct Member
+    {
+        CalculatedVariable* variable;
+        std::vector<Input> inputs;
+    };
+
+    std::string m_normalizedFormula;
+    std::vector<Member> m_members;
+    bool m_compiled;
+    mu::Parser m_parser;
+
+    //! one column per input, one row per member evaluated in given batch
+    std::vector<std::vector<double>> m_columns;
+    std::vector<double> m_results;
+    std::vector<Member*> m_rows;
+
+    //! the columns and the parser are shared by all threads doing batch updates
+    std::mutex m_accessLock;
+
+    void compile ();
+    double inputValue (const Input& input) const;
+};
+
+/* While an object of this class lives, CalculatedVariables which can be evaluated in batches are only marked
+ * for recalculation (by the thread which owns the object) and get evaluated together when the (outermost) object
+ * is destroyed. Use it around code which updates many inputs at once, for example:
+ *
+ *   {
+ *       CalculatedVariables::BatchUpdate batchUpdate;
+ *       for (DChannel* channel : channels())
+ *           channel->getAddressSpaceLink()->setValue(readout[channel->id()], OpcUa_Good);
+ *   }
+ */
+class BatchUpdate
+{
+public:
+    BatchUpdate ();
+    ~BatchUpdate ();
+
+    BatchUpdate (const BatchUpdate& other) = delete;
+    BatchUpdate& operator= (const BatchUpdate& other) = delete;
+
+    static bool isActive ();
+    static void defer (CalculatedVariable* variable);
+
+private:
+    static void flush ();
+};
+
+} /* namespace CalculatedVariables */
+
+#endif /* CALCULATEDVARIABLES_INCLUDE_BATCHEVALUATOR_H_ */
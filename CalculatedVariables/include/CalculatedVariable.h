@@ -22,15 +22,19 @@
 #ifndef CALCULATEDVARIABLES_INCLUDE_CALCULATEDVARIABLE_H_
 #define CALCULATEDVARIABLES_INCLUDE_CALCULATEDVARIABLE_H_
 
+#include <atomic>
+#include <chrono>
+#include <mutex>
+
 #include <ChangeNotifyingVariable.h>
 #include <muParser.h>
 #include <ParserVariableRequestUserData.h>
+#include <ParserVariable.h>
+#include <BatchEvaluator.h>
 
 namespace CalculatedVariables
 {
 
-class ParserVariable;
-
 class CalculatedVariable: public AddressSpace::ChangeNotifyingVariable
 {
 public:
@@ -50,10 +54,20 @@ public:
     // Allows the user to enable or disable automatic updates of the calculated variable.
     // When automatic updates are disabled, the update() method will do nothing, and
     // the user must manually trigger updates by calling triggerRecalculation().
-    void setAutoUpdate(bool enabled) { m_autoUpdateEnabled = enabled; };
+    // Disabling ends the sharing of evaluation (see Engine::optimize()) with duplicates, for good.
+    void setAutoUpdate(bool enabled);
+    bool isAutoUpdateEnabled() const { return m_autoUpdateEnabled; }
     void triggerRecalculation();
     void update();
 
+    // Rate limiting: when non-zero, updates arriving sooner than the interval after the last
+    // calculation are folded into a single trailing calculation which uses the latest input values.
+    void setMinUpdateInterval(std::chrono::milliseconds interval) { m_minUpdateInterval = interval; }
+    std::chrono::milliseconds minUpdateInterval() const { return m_minUpdateInterval; }
+
+    // Called by the TrailingUpdateScheduler once the interval has elapsed.
+    void performTrailingUpdate();
+
     void addDependentVariableForValue(ParserVariable* variable);
     void addDependentVariableForStatus(ParserVariable* variable);
 
@@ -65,6 +79,39 @@ public:
 
     bool isConstant () const { return m_valueVariables.size() + m_statusVariables.size() == 0; }
 
+    const std::string& valueFormula() const { return m_valueParser.GetExpr(); }
+    std::string statusFormula() const { return m_hasStatusFormula ? m_statusParser.GetExpr() : std::string(); }
+    bool isBoolean() const { return m_isBoolean; }
+
+    /* Optimizations, see Engine::optimize() */
+
+    //! Substitutes the given (constant) input by its present value so that muparser can fold it. Returns false if it's not our input.
+    bool foldConstantInput(ParserVariable* variable);
+
+    //! Returns true if the value formula is just a copy of a single input, which will then be forwarded without evaluation.
+    bool setupForwardingIfPureCopy();
+
+    //! The duplicate (i.e. a variable with identical formulas) won't evaluate anymore and instead will receive our results.
+    void shareEvaluationWith(CalculatedVariable* duplicate);
+    bool isSharingEvaluation() const { return m_sharedEvaluationSource != nullptr; }
+    CalculatedVariable* sharedEvaluationSource() const { return m_sharedEvaluationSource; }
+    //! The duplicates, or the variable we share evaluation with, evaluate by themselves again.
+    void stopSharingEvaluation();
+    bool isForwarding() const { return m_forwardedVariable != nullptr; }
+
+    /* Batch evaluation */
+
+    //! Constant, forwarding, sharing and rate-limited variables are not worth evaluating in batches
+    bool isBatchable() const;
+    //! Value formula with inputs replaced by BatchEvaluator::inputName(i), inputs[i] telling which input it is.
+    std::string normalizedValueFormula(std::vector<BatchEvaluator::Input>& inputs) const;
+    void setBatchEvaluator(BatchEvaluator* evaluator, size_t index) { m_batchEvaluator = evaluator; m_batchIndex = index; }
+    BatchEvaluator* batchEvaluator() const { return m_batchEvaluator; }
+
+    /* Profiling */
+    uint64_t numEvaluations() const { return m_numEvaluations.load(); }
+    std::chrono::nanoseconds evaluationTime() const { return std::chrono::nanoseconds(m_evaluationTimeNs.load()); }
+
 private:
     void initializeParser(
             mu::Parser& parser,
@@ -87,12 +134,51 @@ private:
     // Keeping this reference is necessary to efficiently construct synchronization graph
     ParserVariable* m_notifiedVariable;
 
+    friend class BatchEvaluator;
+    friend class BatchUpdate;
+
     // Performs an update of the calculated variable. This method is called by update() and triggerRecalculation()
     void calculate();
 
+    // Parts of calculate(), also used by the BatchEvaluator
+    std::unique_lock<Synchronizer> lockSynchronizer();
+    bool publishIfInputsNotGood();
+    void publishResult(double updatedValue);
+    void accountEvaluation(std::chrono::nanoseconds duration);
+
+    // Publishes the result of calculate() in this variable and in all duplicates sharing our evaluation.
+    void publish(const UaDataValue& dataValue);
+
+    // When non-null, the value formula is a pure copy of this variable, no need to call muparser.
+    ParserVariable* m_forwardedVariable;
+
+    // Variables with identical formulas which are given our results instead of evaluating by themselves.
+    // All of them (and us) have automatic updates enabled, otherwise the sharing is stopped.
+    std::list<CalculatedVariable*> m_duplicates;
+    // atomic because it may be read when the graph is dumped while setAutoUpdate() stops the sharing
+    std::atomic<CalculatedVariable*> m_sharedEvaluationSource;
+
     // Flag to indicate whether automatic updates are enabled.
     bool m_autoUpdateEnabled;
 
+    /* Rate limiting part */
+    std::chrono::milliseconds m_minUpdateInterval;
+    std::chrono::steady_clock::time_point m_lastCalculation;
+    bool m_trailingUpdatePending;
+    // Guards the two fields above; update() and performTrailingUpdate() may run in different threads.
+    std::mutex m_rateLimitLock;
+
+    /* Profiling part: atomic because they are read when the graph is dumped */
+    std::atomic<uint64_t> m_numEvaluations;
+    // cumulative time spent in formula evaluation (i.e. excluding publishing the result)
+    std::atomic<uint64_t> m_evaluationTimeNs;
+
+    /* Batch evaluation part */
+    BatchEvaluator* m_batchEvaluator;
+    size_t m_batchIndex; // our member index within the BatchEvaluator
+    // Set when update() was deferred till the end of the BatchUpdate, so it's deferred only once
+    std::atomic<bool> m_deferredInBatch;
+
 };
 
 }
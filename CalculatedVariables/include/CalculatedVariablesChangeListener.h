@@ -22,26 +22,23 @@
 #ifndef CALCULATEDVARIABLES_INCLUDE_CALCULATEDVARIABLESCHANGELISTENER_H_
 #define CALCULATEDVARIABLES_INCLUDE_CALCULATEDVARIABLESCHANGELISTENER_H_
 
-class UaDataValue;
-
-namespace AddressSpace
-{
-class ChangeNotifyingVariable;
-}
+#include <ChangeNotifyingVariable.h>
 
 namespace CalculatedVariables
 {
 
 class ParserVariable;
 
-class ChangeListener
+class ChangeListener: public AddressSpace::NumericChangeListener
 {
 public:
     ChangeListener(ParserVariable& variable);
 
-    void operator()(
+    virtual void onChange(
             AddressSpace::ChangeNotifyingVariable& fromWhere,
-            const UaDataValue&                     newValue);
+            const UaDataValue&                     newValue,
+            bool                                   isNumeric,
+            OpcUa_Double                           numericValue);
 private:
     ParserVariable& m_variable;
 };
@@ -23,11 +23,16 @@
 #define CALCULATEDVARIABLES_INCLUDE_CALCULATEDVARIABLESENGINE_H_
 
 #include <list>
+#include <memory>
+#include <ostream>
 
 #include <uanodeid.h>
 
 #include <Configuration.hxx>
 #include <ParserVariable.h>
+#include <TrailingUpdateScheduler.h>
+#include <BatchEvaluator.h>
+#include <QuasarRegistrationJournal.h>
 
 // forward-decls
 namespace AddressSpace
@@ -39,11 +44,17 @@ class ChangeNotifyingVariable;
 namespace CalculatedVariables
 {
 
+class CalculatedVariable;
+
 class Engine
 {
 public:
     static void initialize();
 
+    //! Stops the machinery started during instantiation, e.g. trailing updates of rate-limited variables.
+    //! Call it only once nothing (device logic, source variables, I/O reactor, ...) can update variables anymore.
+    static void shutdown();
+
     static void instantiateCalculatedVariable(
             AddressSpace::ASNodeManager* nm,
             UaNodeId parentNodeId,
@@ -52,6 +63,8 @@ public:
 
     static ParserVariable& registerVariableForCalculatedVariables( AddressSpace::ChangeNotifyingVariable* variable);
     static void registerConstantForCalculatedVariables( const std::string& name, double value);
+    //! After the parallel configuration: puts the ParserVariables back in the order of the configuration file
+    static void restoreRegistrationOrder( const Quasar::RegistrationJournal::Ranks& ranks );
 
     //! userData should be the 'this' of a CalculatedVariable this is being requested
     static double* parserVariableRequestHandler(const char* name, void* userData);
@@ -62,6 +75,18 @@ public:
 
     static void optimize ();
 
+    enum class GraphFormat
+    {
+        Json,
+        Dot // graphviz
+    };
+
+    //! Writes the ParserVariable -> CalculatedVariable graph with fan-outs, synchronizer domains and evaluation statistics.
+    static void writeDependencyGraph (std::ostream& out, GraphFormat format);
+
+    //! Writes pathPrefix.json and pathPrefix.dot; can be called at any time after the configuration.
+    static void dumpDependencyGraph (const std::string& pathPrefix);
+
     //! Perform a dfs, each found node is bound to particular synchronization domain
     static void dfsAndSetSynchronizer(ParserVariable& pv, SharedSynchronizer& synchronizer);
 
@@ -78,12 +103,26 @@ public:
     static bool isConstantDefined (const std::string& id);
     static double getValueOfConstant (const std::string& id);
 
+    //! Returns false if there is no trailing update scheduler (no CalculatedVariable uses minUpdateInterval, or after shutdown)
+    static bool scheduleTrailingUpdate (CalculatedVariable* variable, TrailingUpdateScheduler::Clock::time_point deadline);
+
 private:
+    //! Substitutes inputs coming from constant variables by their values, repeated until no more inputs become constant.
+    static size_t foldConstantInputs ();
+    static size_t forwardPureCopies ();
+    static size_t shareEvaluationOfDuplicates ();
+    //! Groups variables with formulas identical up to input names (e.g. from generic formulas) for batch evaluation.
+    static size_t setupBatchEvaluation ();
+    static size_t removeUnusedParserVariables ();
+
     static std::list <ParserVariable> s_parserVariables;
+    static std::list <CalculatedVariable*> s_calculatedVariables;
+    static std::list <BatchEvaluator> s_batchEvaluators;
     static std::map <std::string, double> s_parserConstants;
     static size_t s_numSynchronizers;
     static size_t s_numCalculatedVariables;
     static std::map<std::string, std::string> s_genericFormulas;
+    static std::unique_ptr<TrailingUpdateScheduler> s_trailingUpdateScheduler;
 };
 
 } /* namespace CalculatedVariables */
@@ -63,6 +63,7 @@ public:
     std::string name() const;
 
     void addNotifiedVariable( CalculatedVariable* notifiedVariable );
+    void removeNotifiedVariable( CalculatedVariable* notifiedVariable );
     std::list<CalculatedVariable*> notifiedVariables() { return m_notifiedVariables; }
 
     AddressSpace::ChangeNotifyingVariable* notifyingVariable() { return m_notifyingVariable; }
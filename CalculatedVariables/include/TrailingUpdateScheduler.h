@@ -0,0 +1,62 @@
+/* © Copyright CERN, 2026.  All rights not expressly granted are reserved.
+ * TrailingUpdateScheduler.h
+ *
+ *  Created on: 19 Oct 2026
+ *
+ *  This file is part of Quasar.
+ *
+ *  Quasar is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU Lesser General Public Licence as published by
+ *  the Free Software Foundation, either version 3 of the Licence.
+ *
+ *  Quasar is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU Lesser General Public Licence for more details.
+ *
+ *  You should have received a copy of the GNU Lesser General Public License
+ *  along with Quasar.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#ifndef CALCULATEDVARIABLES_INCLUDE_TRAILINGUPDATESCHEDULER_H_
+#define CALCULATEDVARIABLES_INCLUDE_TRAILINGUPDATESCHEDULER_H_
+
+#include <chrono>
+#include <map>
+#include <mutex>
+#include <thread>
+#include <condition_variable>
+
+namespace CalculatedVariables
+{
+
+class CalculatedVariable;
+
+/* Runs the trailing evaluations of rate-limited CalculatedVariables (those with minUpdateInterval).
+ * A single thread sleeps until the earliest deadline and then recalculates the due variables,
+ * so the number of pending recalculations never exceeds the number of rate-limited variables.
+ */
+class TrailingUpdateScheduler
+{
+public:
+    typedef std::chrono::steady_clock Clock;
+
+    TrailingUpdateScheduler ();
+    ~TrailingUpdateScheduler ();
+
+    //! The caller guarantees that a given variable is scheduled at most once at a time.
+    void schedule (CalculatedVariable* variable, Clock::time_point deadline);
+
+private:
+    void work ();
+
+    std::mutex m_accessLock;
+    std::condition_variable m_conditionVariable;
+    std::multimap<Clock::time_point, CalculatedVariable*> m_pending;
+    bool m_quit;
+    std::thread m_worker;
+};
+
+} /* namespace CalculatedVariables */
+
+#endif /* CALCULATEDVARIABLES_INCLUDE_TRAILINGUPDATESCHEDULER_H_ */
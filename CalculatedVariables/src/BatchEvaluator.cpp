@@ -0,0 +1,194 @@
+/* © Copyright CERN, 2026.  All rights not expressly granted are reserved.
+ * BatchEvaluator.cpp
+ *
+ *  Created on: 19 Oct 2026
+ *
+ *  This file is part of Quasar.
+ *
+ *  Quasar is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU Lesser General Public Licence as published by
+ *  the Free Software Foundation, either version 3 of the Licence.
+ *
+ *  Quasar is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU Lesser General Public Licence for more details.
+ *
+ *  You should have received a copy of the GNU Lesser General Public License
+ *  along with Quasar.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <math.h>
+
+#include <map>
+
+#include <LogIt.h>
+#include <Utils.h>
+
+#include <BatchEvaluator.h>
+#include <CalculatedVariable.h>
+#include <CalculatedVariablesLogComponentId.h>
+#include <ParserVariable.h>
+
+namespace CalculatedVariables
+{
+
+BatchEvaluator::BatchEvaluator (const std::string& normalizedFormula, size_t numInputs):
+        m_normalizedFormula(normalizedFormula),
+        m_compiled(false),
+        m_columns(numInputs)
+{
+}
+
+std::string BatchEvaluator::inputName (size_t i)
+{
+    return "__batch_input_" + std::to_string(i) + "__";
+}
+
+void BatchEvaluator::addMember (CalculatedVariable* variable, const std::vector<Input>& inputs)
+{
+    if (m_compiled)
+        throw_runtime_error_with_origin("Can't add members to a BatchEvaluator which is already in use");
+    m_members.push_back({variable, inputs});
+}
+
+//! Columns have to be allocated to their final size before binding to the parser, as muparser keeps the pointers.
+void BatchEvaluator::compile ()
+{
+    m_results.resize(m_members.size());
+    m_rows.resize(m_members.size());
+    try
+    {
+        // same setup as CalculatedVariable::initializeParser
+        m_parser.DefineFun("pow", [](double x, double y){return pow(x, y);});
+        m_parser.DefineNameChars("0123456789_abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ.");
+        for (size_t i = 0; i < m_columns.size(); ++i)
+        {
+            m_columns[i].resize(m_members.size());
+            m_parser.DefineVar(inputName(i), m_columns[i].data());
+        }
+        m_parser.SetExpr(m_normalizedFormula);
+    }
+    catch (const mu::Parser::exception_type &e)
+    {
+        LOG(Log::ERR, logComponentId) << "Couldn't compile batch formula " << m_normalizedFormula << " : " << e.GetMsg();
+        throw std::runtime_error("Calculated item batch evaluation failed. Problem has been logged.");
+    }
+    m_compiled = true;
+}
+
+double BatchEvaluator::inputValue (const Input& input) const
+{
+    return input.variable ? input.variable->value() : input.constant;
+}
+
+void BatchEvaluator::evaluate (const std::vector<CalculatedVariable*>& variables)
+{
+    std::lock_guard<std::mutex> lock (m_accessLock);
+    if (!m_compiled)
+        compile();
+
+    // from now on a further change of inputs must defer the variable again
+    for (CalculatedVariable* variable : variables)
+        variable->m_deferredInBatch = false;
+
+    // 1st pass: gather inputs of all variables that can be evaluated
+    size_t numRows = 0;
+    for (CalculatedVariable* variable : variables)
+    {
+        Member& member = m_members.at(variable->m_batchIndex);
+        std::unique_lock<Synchronizer> synchronizerLock (variable->lockSynchronizer());
+        if (variable->publishIfInputsNotGood())
+            continue;
+        for (size_t i = 0; i < member.inputs.size(); ++i)
+            m_columns[i][numRows] = inputValue(member.inputs[i]);
+        m_rows[numRows++] = &member;
+    }
+    if (numRows == 0)
+        return;
+
+    std::chrono::steady_clock::time_point evaluationStart = std::chrono::steady_clock::now();
+    try
+    {
+        m_parser.Eval(m_results.data(), static_cast<int>(numRows));
+    }
+    catch (const mu::Parser::exception_type &e)
+    {
+        LOG(Log::ERR, logComponentId) << "Batch evaluation of " << m_normalizedFormula << " failed: " << e.GetMsg();
+        throw std::runtime_error("Calculated item batch evaluation failed. Problem has been logged.");
+    }
+    std::chrono::nanoseconds evaluationTimePerRow ((std::chrono::steady_clock::now() - evaluationStart) / numRows);
+
+    // 2nd pass: publish. An input might have changed since the 1st pass, then that variable gets recalculated on its own.
+    for (size_t row = 0; row < numRows; ++row)
+    {
+        CalculatedVariable* variable = m_rows[row]->variable;
+        std::unique_lock<Synchronizer> synchronizerLock (variable->lockSynchronizer());
+        bool inputsUnchanged = true;
+        for (size_t i = 0; i < m_rows[row]->inputs.size() && inputsUnchanged; ++i)
+            inputsUnchanged = m_columns[i][row] == inputValue(m_rows[row]->inputs[i]);
+        if (inputsUnchanged)
+        {
+            variable->accountEvaluation(evaluationTimePerRow);
+            variable->publishResult(m_results[row]);
+        }
+        else
+            variable->calculate();
+    }
+}
+
+/* Per-thread state of BatchUpdate */
+static thread_local unsigned int s_batchUpdateDepth = 0;
+static thread_local std::vector<CalculatedVariable*> s_deferredVariables;
+
+BatchUpdate::BatchUpdate ()
+{
+    s_batchUpdateDepth++;
+}
+
+BatchUpdate::~BatchUpdate ()
+{
+    if (s_batchUpdateDepth == 1)
+    {
+        try
+        {
+            flush(); // note: depth is still 1 so that dependent batchable variables join the next round
+        }
+        catch (const std::exception& e)
+        {
+            LOG(Log::ERR, logComponentId) << "Exception in batch update of Calculated Variables: " << e.what();
+            for (CalculatedVariable* variable : s_deferredVariables)
+                variable->m_deferredInBatch = false;
+            s_deferredVariables.clear();
+        }
+    }
+    s_batchUpdateDepth--;
+}
+
+bool BatchUpdate::isActive ()
+{
+    return s_batchUpdateDepth > 0;
+}
+
+void BatchUpdate::defer (CalculatedVariable* variable)
+{
+    s_deferredVariables.push_back(variable);
+}
+
+void BatchUpdate::flush ()
+{
+    while (!s_deferredVariables.empty())
+    {
+        std::map<BatchEvaluator*, std::vector<CalculatedVariable*>> variablesByEvaluator;
+        for (CalculatedVariable* variable : s_deferredVariables)
+            variablesByEvaluator[variable->batchEvaluator()].push_back(variable);
+        s_deferredVariables.clear();
+        for (std::pair<BatchEvaluator* const, std::vector<CalculatedVariable*>>& batch : variablesByEvaluator)
+        {
+            LOG(Log::TRC, logComponentId) << "Evaluating batch of " << batch.second.size() << " variables";
+            batch.first->evaluate(batch.second);
+        }
+    }
+}
+
+} /* namespace CalculatedVariables */
@@ -22,12 +22,17 @@
 #include <math.h>
 
 #include <algorithm>
+#include <cctype>
+#include <map>
 
 #include <CalculatedVariable.h>
 #include <LogIt.h>
 #include <CalculatedVariablesEngine.h>
 #include <CalculatedVariablesLogComponentId.h>
 #include <ParserVariableRequestUserData.h>
+#include <TrailingUpdateScheduler.h>
+#include <BatchEvaluator.h>
+#include <QuasarTimestampProvider.h>
 
 namespace CalculatedVariables
 {
@@ -54,13 +59,23 @@ CalculatedVariable::CalculatedVariable(
                     m_isBoolean(isBoolean),
                     m_hasStatusFormula(hasStatusFormula),
                     m_notifiedVariable(nullptr),
-                    m_autoUpdateEnabled(autoUpdateEnabled)
+                    m_forwardedVariable(nullptr),
+                    m_sharedEvaluationSource(nullptr),
+                    m_autoUpdateEnabled(autoUpdateEnabled),
+                    m_minUpdateInterval(0),
+                    m_trailingUpdatePending(false),
+                    m_numEvaluations(0),
+                    m_evaluationTimeNs(0),
+                    m_batchEvaluator(nullptr),
+                    m_batchIndex(0),
+                    m_deferredInBatch(false)
 {
     this->initializeParser(m_valueParser, formula, ParserVariableRequestUserData::Type::Value);
     if (m_hasStatusFormula)
         this->initializeParser(m_statusParser, statusFormula, ParserVariableRequestUserData::Type::Status);
 
-    UaDataValue dataValue(UaVariant(), OpcUa_BadWaitingForInitialData, UaDateTime::now(), UaDateTime::now());
+    UaDateTime now (Quasar::TimestampProvider::now());
+    UaDataValue dataValue(UaVariant(), OpcUa_BadWaitingForInitialData, now, now);
     this->setValue(nullptr, dataValue, OpcUa_False);
 
 }
@@ -68,6 +83,15 @@ CalculatedVariable::CalculatedVariable(
 // Performs an update of the calculated variable, regardless of whether automatic
 // updates are enabled. This allows the user to manually trigger a recalculation when
 // automatic updates are disabled.
+void CalculatedVariable::setAutoUpdate(bool enabled)
+{
+    // duplicates have the same inputs, hence the same synchronizer, which is held while publishing to them
+    std::unique_lock<Synchronizer> synchronizerLock (lockSynchronizer());
+    m_autoUpdateEnabled = enabled;
+    if (!enabled)
+        stopSharingEvaluation();
+}
+
 void CalculatedVariable::triggerRecalculation()
 {
     LOG(Log::TRC, logComponentId) << "triggerRecalculation() on " << this->nodeId().toString().toUtf8();
@@ -83,13 +107,74 @@ void CalculatedVariable::update()
     LOG(Log::TRC, logComponentId) << "update() on " << this->nodeId().toString().toUtf8();
 
     if (!m_autoUpdateEnabled) return;
+    if (m_sharedEvaluationSource) return; // our result will come from the variable we share evaluation with
+    if (m_minUpdateInterval.count() > 0)
+    {
+        std::lock_guard<std::mutex> lock (m_rateLimitLock);
+        if (m_trailingUpdatePending)
+            return; // the change will be picked up by the already scheduled trailing calculation
+        std::chrono::steady_clock::time_point earliestAllowed = m_lastCalculation + m_minUpdateInterval;
+        std::chrono::steady_clock::time_point now = std::chrono::steady_clock::now();
+        if (now < earliestAllowed)
+        {
+            // the scheduler might be gone already if we're shutting down
+            if (Engine::scheduleTrailingUpdate(this, earliestAllowed))
+                m_trailingUpdatePending = true;
+            return;
+        }
+        m_lastCalculation = now;
+    }
+    if (m_batchEvaluator && BatchUpdate::isActive())
+    {
+        if (!m_deferredInBatch.exchange(true))
+            BatchUpdate::defer(this);
+        return;
+    }
     calculate();
 }
 
+void CalculatedVariable::performTrailingUpdate()
+{
+    LOG(Log::TRC, logComponentId) << "performTrailingUpdate() on " << this->nodeId().toString().toUtf8();
+
+    std::unique_lock<Synchronizer> synchronizerLock (lockSynchronizer());
+    {
+        std::lock_guard<std::mutex> lock (m_rateLimitLock);
+        m_trailingUpdatePending = false;
+        m_lastCalculation = std::chrono::steady_clock::now();
+    }
+    calculate();
+}
+
+std::unique_lock<Synchronizer> CalculatedVariable::lockSynchronizer()
+{
+    // Same synchronization domain as the regular notification path, which runs with the synchronizer of the input held.
+    for (const std::list<ParserVariable*>* variables : {&m_valueVariables, &m_statusVariables})
+    {
+        for (ParserVariable* variable : *variables)
+        {
+            if (variable->synchronizer())
+                return std::unique_lock<Synchronizer>(*variable->synchronizer());
+        }
+    }
+    return std::unique_lock<Synchronizer>();
+}
+
 void CalculatedVariable::calculate()
 {
     LOG(Log::TRC, logComponentId) << "calculate() on " << this->nodeId().toString().toUtf8();
 
+    if (publishIfInputsNotGood())
+        return;
+    // so looks like every dependent value was good... can perform the value calculation.
+    std::chrono::steady_clock::time_point evaluationStart = std::chrono::steady_clock::now();
+    double updatedValue = m_forwardedVariable ? m_forwardedVariable->value() : m_valueParser.Eval();
+    accountEvaluation(std::chrono::steady_clock::now() - evaluationStart);
+    publishResult(updatedValue);
+}
+
+bool CalculatedVariable::publishIfInputsNotGood()
+{
     for (const ParserVariable* variable : m_valueVariables)
     {
         if (variable->state() != ParserVariable::State::Good)
@@ -104,13 +189,18 @@ void CalculatedVariable::calculate()
                 LOG(Log::ERR, logComponentId) << "Enum value not handled! Implement me! Or contact Piotr.";
                 statusCode = OpcUa_Bad;
             }
-            UaDataValue dataValue(UaVariant(), statusCode, UaDateTime::now(), UaDateTime::now());
-            this->setValue(/*session*/nullptr, dataValue, OpcUa_False);
-            return;
+            UaDateTime now (Quasar::TimestampProvider::now());
+            UaDataValue dataValue(UaVariant(), statusCode, now, now);
+            this->publish(dataValue);
+            return true;
         }
     }
-    // so looks like every dependent value was good... can perform the value calculation.
-    // now check what status formula (if used) evaluates to
+    return false;
+}
+
+void CalculatedVariable::publishResult(double updatedValue)
+{
+    // check what status formula (if used) evaluates to
     UaStatus finalStatus = OpcUa_Good;
     if (m_hasStatusFormula)
     {
@@ -119,15 +209,28 @@ void CalculatedVariable::calculate()
         finalStatus = (status != 0) ? OpcUa_Good : OpcUa_Bad; // conversion of double to OPC-UA status code
     }
 
-    double updatedValue = m_valueParser.Eval();
     UaVariant variant;
     if (m_isBoolean)
         variant.setBool(updatedValue != 0);
     else
         variant.setDouble(updatedValue);
-    UaDataValue dataValue (variant, finalStatus.statusCode(), UaDateTime::now(), UaDateTime::now());
+    UaDateTime now (Quasar::TimestampProvider::now()); // source and server timestamps are the same for a calculated value
+    UaDataValue dataValue (variant, finalStatus.statusCode(), now, now);
     LOG(Log::TRC, logComponentId) << finalStatus.toString().toUtf8();
+    this->publish(dataValue);
+}
+
+void CalculatedVariable::accountEvaluation(std::chrono::nanoseconds duration)
+{
+    m_evaluationTimeNs += duration.count();
+    m_numEvaluations++;
+}
+
+void CalculatedVariable::publish(const UaDataValue& dataValue)
+{
     this->setValue(/*session*/nullptr, dataValue, OpcUa_False);
+    for (CalculatedVariable* duplicate : m_duplicates)
+        duplicate->setValue(/*session*/nullptr, dataValue, OpcUa_False);
 }
 
 //! Initializes parser, handles potential muParser-relevant exceptions throwing std except in exchange
@@ -172,6 +275,129 @@ void CalculatedVariable::initializeParser(
     }
 }
 
+bool CalculatedVariable::foldConstantInput(ParserVariable* variable)
+{
+    bool folded = false;
+    auto foldInParser = [this, variable, &folded](mu::Parser& parser, std::list<ParserVariable*>& variables)
+    {
+        std::list<ParserVariable*>::iterator it = std::find(variables.begin(), variables.end(), variable);
+        if (it == variables.end())
+            return;
+        variables.erase(it);
+        try
+        {
+            parser.RemoveVar(variable->name());
+            parser.DefineConst(variable->name(), variable->value());
+            parser.Eval(); // recompiles the expression, so the bytecode optimizer can fold it
+        }
+        catch(const mu::Parser::exception_type &e)
+        {
+            LOG(Log::ERR, logComponentId) << "At CalculatedVariable " <<
+                    this->nodeId().toString().toUtf8() << " when folding constant " << variable->name() << " : "
+                    << e.GetExpr() << ": " << e.GetMsg();
+            throw std::runtime_error("Calculated item optimization failed. Problem has been logged.");
+        }
+        folded = true;
+    };
+    foldInParser(m_valueParser, m_valueVariables);
+    if (m_hasStatusFormula)
+        foldInParser(m_statusParser, m_statusVariables);
+    if (folded && m_forwardedVariable == variable)
+        m_forwardedVariable = nullptr;
+    return folded;
+}
+
+bool CalculatedVariable::setupForwardingIfPureCopy()
+{
+    if (m_valueVariables.size() != 1)
+        return false;
+    std::string formula (valueFormula());
+    // muparser appends a space to the formula, any other whitespace doesn't matter either.
+    formula.erase(std::remove_if(formula.begin(), formula.end(), ::isspace), formula.end());
+    if (formula != m_valueVariables.front()->name())
+        return false;
+    m_forwardedVariable = m_valueVariables.front();
+    return true;
+}
+
+void CalculatedVariable::shareEvaluationWith(CalculatedVariable* duplicate)
+{
+    duplicate->m_sharedEvaluationSource = this;
+    m_duplicates.push_back(duplicate);
+}
+
+void CalculatedVariable::stopSharingEvaluation()
+{
+    CalculatedVariable* source = m_sharedEvaluationSource;
+    if (source)
+    {
+        LOG(Log::TRC, logComponentId) << nodeId().toString().toUtf8() << " stops sharing evaluation with " <<
+                source->nodeId().toString().toUtf8();
+        source->m_duplicates.remove(this);
+        m_sharedEvaluationSource = nullptr;
+    }
+    for (CalculatedVariable* duplicate : m_duplicates)
+    {
+        LOG(Log::TRC, logComponentId) << duplicate->nodeId().toString().toUtf8() << " stops sharing evaluation with " <<
+                nodeId().toString().toUtf8();
+        duplicate->m_sharedEvaluationSource = nullptr;
+    }
+    m_duplicates.clear();
+}
+
+bool CalculatedVariable::isBatchable() const
+{
+    return !isConstant() && !m_forwardedVariable && !m_sharedEvaluationSource && m_minUpdateInterval.count() == 0;
+}
+
+std::string CalculatedVariable::normalizedValueFormula(std::vector<BatchEvaluator::Input>& inputs) const
+{
+    // Every identifier which is an input (a variable or a constant) is replaced by a positional name,
+    // so the formula gets identical for all instances of e.g. a generic formula.
+    const std::string validNameChars ("0123456789_abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ.");
+    const std::string& formula = valueFormula();
+    const mu::valmap_type& constants = m_valueParser.GetConst();
+    std::map<std::string, size_t> inputIndexes;
+    std::string normalized;
+    std::string::size_type pos = 0;
+    while (pos < formula.size())
+    {
+        std::string::size_type end = formula.find_first_not_of(validNameChars, pos);
+        if (end == pos)
+        {
+            normalized.push_back(formula[pos++]);
+            continue;
+        }
+        if (end == std::string::npos)
+            end = formula.size();
+        const std::string token = formula.substr(pos, end - pos);
+        pos = end;
+
+        BatchEvaluator::Input input {nullptr, 0};
+        std::list<ParserVariable*>::const_iterator variable = std::find_if(
+                m_valueVariables.begin(),
+                m_valueVariables.end(),
+                [&token](const ParserVariable* v){ return v->name() == token; });
+        if (variable != m_valueVariables.end())
+            input.variable = *variable;
+        else if (constants.count(token) > 0)
+            input.constant = constants.at(token);
+        else
+        {
+            normalized += token; // e.g. a function or a literal
+            continue;
+        }
+        std::map<std::string, size_t>::iterator it = inputIndexes.find(token);
+        if (it == inputIndexes.end())
+        {
+            it = inputIndexes.emplace(token, inputs.size()).first;
+            inputs.push_back(input);
+        }
+        normalized += BatchEvaluator::inputName(it->second);
+    }
+    return normalized;
+}
+
 void CalculatedVariable::addDependentVariableForValue(ParserVariable* variable)
 {
     /* Adding same variable twice wouldn't buy us anything */
@@ -35,13 +35,21 @@ ChangeListener::ChangeListener(ParserVariable& variable):
 {
 }
 
-void CalculatedVariables::ChangeListener::operator ()(
+void CalculatedVariables::ChangeListener::onChange(
         AddressSpace::ChangeNotifyingVariable& fromWhere,
-        const UaDataValue&                     newValue)
+        const UaDataValue&                     newValue,
+        bool                                   isNumeric,
+        OpcUa_Double                           numericValue)
 {
     LOG(Log::TRC, logComponentId) << "ChangeListener fired, fromWhere=" << fromWhere.nodeId().toString().toUtf8();
     if (newValue.statusCode() == OpcUa_BadWaitingForInitialData)
         m_variable.setValue(0, ParserVariable::WaitingInitialData);
+    else if (isNumeric)
+    {
+        // fast path: the value was decoded in place by the notifying variable
+        LOG(Log::TRC, logComponentId) << "new value is: " << numericValue;
+        m_variable.setValue(numericValue, ParserVariable::State::Good);
+    }
     else if (newValue.value())
     {
         UaVariant variant (*newValue.value());
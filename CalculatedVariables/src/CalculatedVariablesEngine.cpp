@@ -29,6 +29,12 @@
 #include <ParserVariableRequestUserData.h>
 
 #include <Utils.h>
+#include <QuasarTimestampProvider.h>
+
+#include <cstdio>
+#include <fstream>
+#include <mutex>
+#include <tuple>
 
 #include <boost/xpressive/xpressive.hpp>
 
@@ -50,25 +56,62 @@ std::string escapeSpecialCharactersInFormula (const std::string& inputFormula);
 std::string escapeSpecialCharactersInParserVariableName (const std::string& input);
 static std::string replaceAll (const std::string& input, const std::string& from, const std::string& to);
 
+//! Variables and constants may be registered by several threads in the parallel configuration mode
+static std::mutex s_registrationLock;
+//! Guards s_trailingUpdateScheduler, which is used by the updating threads and destroyed by shutdown()
+static std::mutex s_trailingUpdateSchedulerLock;
+
 void Engine::initialize()
 {
     logComponentId = Log::getComponentHandle("CalcVars");
 }
 
+void Engine::shutdown()
+{
+    std::unique_ptr<TrailingUpdateScheduler> scheduler;
+    {
+        std::lock_guard<std::mutex> lock (s_trailingUpdateSchedulerLock);
+        scheduler.swap(s_trailingUpdateScheduler);
+    }
+    // destroyed without the lock: its thread may still be recalculating, which can schedule further trailing updates
+    scheduler.reset();
+}
+
+bool Engine::scheduleTrailingUpdate (CalculatedVariable* variable, TrailingUpdateScheduler::Clock::time_point deadline)
+{
+    std::lock_guard<std::mutex> lock (s_trailingUpdateSchedulerLock);
+    if (!s_trailingUpdateScheduler)
+        return false;
+    s_trailingUpdateScheduler->schedule(variable, deadline);
+    return true;
+}
+
 ParserVariable& Engine::registerVariableForCalculatedVariables(AddressSpace::ChangeNotifyingVariable* variable)
 {
     LOG(Log::TRC, logComponentId) << "Putting on list of ParserVariables: " << variable->nodeId().toString().toUtf8();
+    std::lock_guard<std::mutex> lock (s_registrationLock);
     /* see if we have to do some substitutions of minus sign, etc. */
     s_parserVariables.emplace_back(
         variable,
         escapeSpecialCharactersInParserVariableName(variable->nodeId().toString().toUtf8())); // might be different from the variable name! (OPCUA-2456)
-    variable->addChangeListener(ChangeListener(s_parserVariables.back())); // using back() because we just added it a line above
+    variable->addChangeListener(std::unique_ptr<AddressSpace::NumericChangeListener>(
+            new ChangeListener(s_parserVariables.back()))); // using back() because we just added it a line above
+    Quasar::RegistrationJournal::note(&s_parserVariables, &s_parserVariables.back());
     return s_parserVariables.back();
 }
 
+void Engine::restoreRegistrationOrder( const Quasar::RegistrationJournal::Ranks& ranks )
+{
+    std::lock_guard<std::mutex> lock (s_registrationLock);
+    // list::sort only relinks the elements, so the references held by the variables' listeners stay valid
+    s_parserVariables.sort([&ranks](const ParserVariable& a, const ParserVariable& b)
+        { return ranks.rankOf(&s_parserVariables, &a) < ranks.rankOf(&s_parserVariables, &b); });
+}
+
 void Engine::registerConstantForCalculatedVariables( const std::string& name, double value)
 {
 	LOG(Log::TRC, logComponentId) << "Putting *const* on list of ParserVariables: " << name << ", value=" << value;
+    std::lock_guard<std::mutex> lock (s_registrationLock);
     s_parserConstants.emplace(name, value);
 }
 
@@ -298,18 +341,27 @@ void Engine::instantiateCalculatedVariable(
     pv.setIsConstant(calculatedVariable->isConstant());
     calculatedVariable->setNotifiedVariable(&pv);
 
+    if (config.minUpdateInterval().present() && *config.minUpdateInterval() > 0)
+    {
+        std::lock_guard<std::mutex> lock (s_trailingUpdateSchedulerLock);
+        if (!s_trailingUpdateScheduler)
+            s_trailingUpdateScheduler.reset(new TrailingUpdateScheduler());
+        calculatedVariable->setMinUpdateInterval(std::chrono::milliseconds(*config.minUpdateInterval()));
+    }
+
     if (config.initialValue().present())
     {
         UaVariant variant (*config.initialValue());
         calculatedVariable->setValue(
                 nullptr /*session*/,
-                UaDataValue(variant, OpcUa_Good, UaDateTime::now(), UaDateTime::now()),
+                UaDataValue(variant, OpcUa_Good, Quasar::TimestampProvider::now(), Quasar::TimestampProvider::now()),
                 OpcUa_False /*check access level*/
                 );
     }
     else
         calculatedVariable->update();
 
+    s_calculatedVariables.push_back(calculatedVariable);
     s_numCalculatedVariables++;
     LOG(Log::TRC, logComponentId) << "Instantiated Calculated Variable: " << calculatedVariable->nodeId().toString().toUtf8();
 }
@@ -328,10 +380,143 @@ void Engine::printInstantiationStatistics()
 
 /* This can be called at the end of instantiation step
  * (when no new CalculatedVariables are expected to be added).
- * It removes all ParserVariables that aren't used (and respective onChange callbacks)/
+ * It rewrites the calculation graph so that less evaluations happen on every update:
+ * - inputs which are constant are folded into the formulas (muparser then folds constant sub-expressions),
+ * - formulas which just copy an input forward its value without evaluation,
+ * - formulas identical to other formulas share a single evaluation.
+ * Finally it removes all ParserVariables that aren't used (and respective onChange callbacks).
  * It will likely boost performance and reduce memory usage.
  */
 void Engine::optimize()
+{
+    size_t numFolded = foldConstantInputs();
+    LOG(Log::INF, logComponentId) << "Optimized(folded) " << numFolded << " constant inputs of formulas.";
+
+    size_t numForwarded = forwardPureCopies();
+    LOG(Log::INF, logComponentId) << "Optimized(forwarded) " << numForwarded << " formulas which are pure copies of an input.";
+
+    size_t numShared = shareEvaluationOfDuplicates();
+    LOG(Log::INF, logComponentId) << "Optimized(shared) evaluation of " << numShared << " duplicate formulas.";
+
+    size_t numBatched = setupBatchEvaluation();
+    LOG(Log::INF, logComponentId) << "Optimized(batched) " << numBatched << " formulas into " << s_batchEvaluators.size() << " batch evaluation groups.";
+
+    size_t numOptimized = removeUnusedParserVariables();
+    LOG(Log::INF, logComponentId) << "Optimized(suppresed) " << numOptimized << " ParserVariables not used in any formulas.";
+}
+
+size_t Engine::foldConstantInputs()
+{
+    size_t numFolded = 0;
+    std::list<ParserVariable*> constants;
+    for (ParserVariable& pv : s_parserVariables)
+    {
+        if (pv.isConstant() && pv.state() == ParserVariable::State::Good)
+            constants.push_back(&pv);
+    }
+    while (!constants.empty())
+    {
+        ParserVariable* constant = constants.front();
+        constants.pop_front();
+        for (CalculatedVariable* cv : constant->notifiedVariables())
+        {
+            if (!cv->foldConstantInput(constant))
+                continue;
+            constant->removeNotifiedVariable(cv);
+            numFolded++;
+            LOG(Log::TRC, logComponentId) << "Folded constant " << constant->name() << "=" << constant->value() << " into " << cv->nodeId().toString().toUtf8();
+            if (cv->isConstant())
+            {
+                // all its inputs got folded so it will never change again, i.e. it can be folded too.
+                LOG(Log::TRC, logComponentId) << "Became constant: " << cv->nodeId().toString().toUtf8();
+                cv->triggerRecalculation();
+                ParserVariable* pv = cv->notifiedVariable();
+                if (pv)
+                {
+                    pv->setIsConstant(true);
+                    if (pv->state() == ParserVariable::State::Good)
+                        constants.push_back(pv);
+                }
+            }
+        }
+    }
+    return numFolded;
+}
+
+size_t Engine::forwardPureCopies()
+{
+    size_t numForwarded = 0;
+    for (CalculatedVariable* cv : s_calculatedVariables)
+    {
+        if (cv->setupForwardingIfPureCopy())
+        {
+            LOG(Log::TRC, logComponentId) << "Will forward without evaluation: " << cv->nodeId().toString().toUtf8();
+            numForwarded++;
+        }
+    }
+    return numForwarded;
+}
+
+size_t Engine::shareEvaluationOfDuplicates()
+{
+    size_t numShared = 0;
+    // (value formula, status formula, isBoolean, minUpdateInterval) identify the result
+    typedef std::tuple<std::string, std::string, bool, long long> FormulaKey;
+    std::map<FormulaKey, CalculatedVariable*> evaluatingVariables;
+    for (CalculatedVariable* cv : s_calculatedVariables)
+    {
+        // without automatic updates the variable would neither give its results nor take them when they come
+        if (cv->isConstant() || !cv->isAutoUpdateEnabled())
+            continue;
+        FormulaKey key (cv->valueFormula(), cv->statusFormula(), cv->isBoolean(), cv->minUpdateInterval().count());
+        auto inserted = evaluatingVariables.emplace(key, cv);
+        if (!inserted.second)
+        {
+            inserted.first->second->shareEvaluationWith(cv);
+            LOG(Log::TRC, logComponentId) << cv->nodeId().toString().toUtf8() << " shares evaluation with " <<
+                    inserted.first->second->nodeId().toString().toUtf8();
+            numShared++;
+        }
+    }
+    return numShared;
+}
+
+size_t Engine::setupBatchEvaluation()
+{
+    struct Candidate
+    {
+        CalculatedVariable* variable;
+        std::vector<BatchEvaluator::Input> inputs;
+    };
+    // normalized formula -> candidates, std::map so the grouping is deterministic
+    std::map<std::string, std::list<Candidate>> candidatesByFormula;
+    for (CalculatedVariable* cv : s_calculatedVariables)
+    {
+        if (!cv->isBatchable())
+            continue;
+        Candidate candidate {cv, {}};
+        std::string normalizedFormula = cv->normalizedValueFormula(candidate.inputs);
+        candidatesByFormula[normalizedFormula].push_back(candidate);
+    }
+    size_t numBatched = 0;
+    for (const std::pair<const std::string, std::list<Candidate>>& group : candidatesByFormula)
+    {
+        if (group.second.size() < 2)
+            continue; // nothing to gain
+        s_batchEvaluators.emplace_back(group.first, group.second.front().inputs.size());
+        BatchEvaluator& evaluator = s_batchEvaluators.back();
+        for (const Candidate& candidate : group.second)
+        {
+            candidate.variable->setBatchEvaluator(&evaluator, evaluator.numMembers());
+            evaluator.addMember(candidate.variable, candidate.inputs);
+            numBatched++;
+        }
+        LOG(Log::TRC, logComponentId) << "Batch evaluation group of " << evaluator.numMembers() << " variables for formula: " << group.first;
+    }
+    return numBatched;
+}
+
+size_t Engine::removeUnusedParserVariables()
 {
     size_t numOptimized = 0;
     decltype(s_parserVariables)::iterator it;
@@ -339,9 +524,10 @@ void Engine::optimize()
     {
         if (it->notifiedVariables().size() == 0) // i.e. there is no formula 
         {
-            if (it->notifyingVariable()->changeListenerSize() <= 1)
+            // our ChangeListener is the only numeric one; others (e.g. of native shadows) must stay
+            if (it->notifyingVariable()->numericChangeListenerSize() <= 1)
             {
-                it->notifyingVariable()->removeAllChangeListeners();
+                it->notifyingVariable()->removeAllNumericChangeListeners();
                 CalculatedVariable* cv = dynamic_cast<CalculatedVariable*> (it->notifyingVariable());
                 if (cv)
                     cv->setNotifiedVariable(nullptr);
@@ -355,8 +541,7 @@ void Engine::optimize()
         }
         it++;
     }
-    LOG(Log::INF, logComponentId) << "Optimized(suppresed) " << numOptimized << " ParserVariables not used in any formulas.";
-
+    return numOptimized;
 }
 
 void Engine::dfsAndSetSynchronizer(ParserVariable& pv, SharedSynchronizer& synchronizer)
@@ -417,6 +602,137 @@ void Engine::setupSynchronization()
     }
 }
 
+//! For the strings of both formats; control characters are not allowed raw in JSON strings
+static std::string escapeForGraph (const std::string& input)
+{
+    std::string output;
+    for (char c : input)
+    {
+        if (static_cast<unsigned char>(c) < 0x20)
+        {
+            char escaped[7];
+            std::snprintf(escaped, sizeof escaped, "\\u%04x", static_cast<unsigned int>(static_cast<unsigned char>(c)));
+            output += escaped;
+            continue;
+        }
+        if (c == '"' || c == '\\')
+            output.push_back('\\');
+        output.push_back(c);
+    }
+    return output;
+}
+
+void Engine::writeDependencyGraph (std::ostream& out, GraphFormat format)
+{
+    // numbering of nodes and synchronization domains for the output
+    std::map<const ParserVariable*, size_t> parserVariableIds;
+    std::map<const Synchronizer*, size_t> synchronizerIds;
+    std::map<size_t, size_t> synchronizerSizes;
+    for (ParserVariable& pv : s_parserVariables)
+    {
+        parserVariableIds.emplace(&pv, parserVariableIds.size());
+        if (pv.synchronizer())
+        {
+            size_t synchronizerId = synchronizerIds.emplace(pv.synchronizer().get(), synchronizerIds.size()).first->second;
+            synchronizerSizes[synchronizerId]++;
+        }
+    }
+    auto synchronizerOf = [&synchronizerIds](ParserVariable& pv)
+    {
+        return pv.synchronizer() ? std::to_string(synchronizerIds.at(pv.synchronizer().get())) : std::string("null");
+    };
+    auto microseconds = [](std::chrono::nanoseconds t) { return std::chrono::duration_cast<std::chrono::microseconds>(t).count(); };
+
+    if (format == GraphFormat::Json)
+    {
+        out << "{" << std::endl << "\"parserVariables\": [" << std::endl;
+        const char* separator = "";
+        for (ParserVariable& pv : s_parserVariables)
+        {
+            out << separator << "  {\"id\": " << parserVariableIds.at(&pv) <<
+                    ", \"name\": \"" << escapeForGraph(pv.name()) << "\"" <<
+                    ", \"isConstant\": " << (pv.isConstant() ? "true" : "false") <<
+                    ", \"synchronizer\": " << synchronizerOf(pv) <<
+                    ", \"fanOut\": " << pv.notifiedVariables().size() << "}";
+            separator = ",\n";
+        }
+        out << std::endl << "]," << std::endl << "\"calculatedVariables\": [" << std::endl;
+        separator = "";
+        for (CalculatedVariable* cv : s_calculatedVariables)
+        {
+            auto inputIds = [&parserVariableIds](const std::list<ParserVariable*>& variables)
+            {
+                std::string ids;
+                for (const ParserVariable* variable : variables)
+                    ids += (ids.empty() ? "" : ", ") + std::to_string(parserVariableIds.at(variable));
+                return "[" + ids + "]";
+            };
+            out << separator << "  {\"address\": \"" << escapeForGraph(cv->nodeId().toString().toUtf8()) << "\"" <<
+                    ", \"valueFormula\": \"" << escapeForGraph(cv->valueFormula()) << "\"" <<
+                    ", \"statusFormula\": \"" << escapeForGraph(cv->statusFormula()) << "\"" <<
+                    ", \"valueInputs\": " << inputIds(cv->valueVariables()) <<
+                    ", \"statusInputs\": " << inputIds(cv->statusVariables()) <<
+                    ", \"output\": " << (cv->notifiedVariable() ? std::to_string(parserVariableIds.at(cv->notifiedVariable())) : std::string("null")) <<
+                    ", \"isForwarding\": " << (cv->isForwarding() ? "true" : "false") <<
+                    ", \"sharesEvaluationWith\": " << (cv->sharedEvaluationSource() ?
+                            "\"" + escapeForGraph(cv->sharedEvaluationSource()->nodeId().toString().toUtf8()) + "\"" : std::string("null")) <<
+                    ", \"minUpdateIntervalMs\": " << cv->minUpdateInterval().count() <<
+                    ", \"numEvaluations\": " << cv->numEvaluations() <<
+                    ", \"evaluationTimeUs\": " << microseconds(cv->evaluationTime()) << "}";
+            separator = ",\n";
+        }
+        out << std::endl << "]," << std::endl << "\"synchronizers\": [" << std::endl;
+        separator = "";
+        for (const std::pair<const size_t, size_t>& synchronizer : synchronizerSizes)
+        {
+            out << separator << "  {\"id\": " << synchronizer.first << ", \"numParserVariables\": " << synchronizer.second << "}";
+            separator = ",\n";
+        }
+        out << std::endl << "]" << std::endl << "}" << std::endl;
+    }
+    else if (format == GraphFormat::Dot)
+    {
+        out << "digraph CalculatedVariables {" << std::endl << "rankdir=LR;" << std::endl;
+        for (ParserVariable& pv : s_parserVariables)
+        {
+            out << "pv" << parserVariableIds.at(&pv) << " [shape=ellipse, label=\"" << escapeForGraph(pv.name()) <<
+                    "\\nfanOut=" << pv.notifiedVariables().size() << " sync=" << synchronizerOf(pv) << "\"" <<
+                    (pv.isConstant() ? ", style=dashed" : "") << "];" << std::endl;
+        }
+        size_t cvId = 0;
+        for (CalculatedVariable* cv : s_calculatedVariables)
+        {
+            out << "cv" << cvId << " [shape=box, label=\"" << escapeForGraph(cv->nodeId().toString().toUtf8()) <<
+                    "\\n" << escapeForGraph(cv->valueFormula()) <<
+                    "\\nevaluations=" << cv->numEvaluations() << " time=" << microseconds(cv->evaluationTime()) << "us\"];" << std::endl;
+            for (const ParserVariable* variable : cv->valueVariables())
+                out << "pv" << parserVariableIds.at(variable) << " -> cv" << cvId << ";" << std::endl;
+            for (const ParserVariable* variable : cv->statusVariables())
+                out << "pv" << parserVariableIds.at(variable) << " -> cv" << cvId << " [style=dashed];" << std::endl;
+            if (cv->notifiedVariable())
+                out << "cv" << cvId << " -> pv" << parserVariableIds.at(cv->notifiedVariable()) << " [style=bold];" << std::endl;
+            cvId++;
+        }
+        out << "}" << std::endl;
+    }
+    else
+        throw_runtime_error_with_origin("Enum value not handled. Report to quasar-developers.");
+}
+
+void Engine::dumpDependencyGraph (const std::string& pathPrefix)
+{
+    for (const std::pair<GraphFormat, std::string>& output : {
+            std::make_pair(GraphFormat::Json, pathPrefix + ".json"),
+            std::make_pair(GraphFormat::Dot, pathPrefix + ".dot")})
+    {
+        std::ofstream file (output.second);
+        if (!file.is_open())
+            throw_runtime_error_with_origin("Can't open for writing: " + output.second);
+        writeDependencyGraph(file, output.first);
+        LOG(Log::INF, logComponentId) << "Dumped Calculated Variables dependency graph into " << output.second;
+    }
+}
+
 bool Engine::isConstantDefined (const std::string& id)
 {
     return s_parserConstants.count(id) > 0;
@@ -429,10 +745,13 @@ double Engine::getValueOfConstant (const std::string& id)
 
 Log::LogComponentHandle logComponentId = Log::INVALID_HANDLE;
 std::list <ParserVariable> Engine::s_parserVariables;
+std::list <CalculatedVariable*> Engine::s_calculatedVariables;
+std::list <BatchEvaluator> Engine::s_batchEvaluators;
 std::map <std::string, double> Engine::s_parserConstants;
 size_t Engine::s_numSynchronizers = 0;
 size_t Engine::s_numCalculatedVariables = 0;
 std::map<std::string, std::string> Engine::s_genericFormulas;
+std::unique_ptr<TrailingUpdateScheduler> Engine::s_trailingUpdateScheduler;
 
 
 } /* namespace CalculatedVariables */
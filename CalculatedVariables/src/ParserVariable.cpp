@@ -86,6 +86,12 @@ void ParserVariable::addNotifiedVariable(CalculatedVariable* notifiedVariable)
 
 }
 
+void ParserVariable::removeNotifiedVariable(CalculatedVariable* notifiedVariable)
+{
+    LOG(Log::TRC, logComponentId) << "From ParseVariable bound to: " << name() << " removing notified variable: " << notifiedVariable->nodeId().toString().toUtf8();
+    m_notifiedVariables.remove(notifiedVariable);
+}
+
 
 
 } /* namespace CalculatedVariables */
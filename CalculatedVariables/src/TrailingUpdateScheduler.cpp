@@ -0,0 +1,85 @@
+/* © Copyright CERN, 2026.  All rights not expressly granted are reserved.
+ * TrailingUpdateScheduler.cpp
+ *
+ *  Created on: 19 Oct 2026
+ *
+ *  This file is part of Quasar.
+ *
+ *  Quasar is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU Lesser General Public Licence as published by
+ *  the Free Software Foundation, either version 3 of the Licence.
+ *
+ *  Quasar is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU Lesser General Public Licence for more details.
+ *
+ *  You should have received a copy of the GNU Lesser General Public License
+ *  along with Quasar.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <LogIt.h>
+
+#include <CalculatedVariable.h>
+#include <CalculatedVariablesLogComponentId.h>
+#include <TrailingUpdateScheduler.h>
+
+namespace CalculatedVariables
+{
+
+TrailingUpdateScheduler::TrailingUpdateScheduler ():
+        m_quit(false),
+        m_worker(&TrailingUpdateScheduler::work, this)
+{
+    LOG(Log::INF, logComponentId) << "Started the trailing update thread for rate-limited Calculated Variables";
+}
+
+TrailingUpdateScheduler::~TrailingUpdateScheduler ()
+{
+    {
+        std::lock_guard<std::mutex> lock (m_accessLock);
+        m_quit = true;
+    }
+    m_conditionVariable.notify_one();
+    m_worker.join();
+    LOG(Log::INF, logComponentId) << "Stopped the trailing update thread, " << m_pending.size() << " trailing updates were dropped";
+}
+
+void TrailingUpdateScheduler::schedule (CalculatedVariable* variable, Clock::time_point deadline)
+{
+    bool isEarliest;
+    {
+        std::lock_guard<std::mutex> lock (m_accessLock);
+        auto it = m_pending.emplace(deadline, variable);
+        isEarliest = it == m_pending.begin();
+    }
+    if (isEarliest)
+        m_conditionVariable.notify_one();
+}
+
+void TrailingUpdateScheduler::work ()
+{
+    std::unique_lock<std::mutex> lock (m_accessLock);
+    while (!m_quit)
+    {
+        if (m_pending.empty())
+        {
+            m_conditionVariable.wait(lock);
+            continue;
+        }
+        auto earliest = m_pending.begin();
+        if (Clock::now() < earliest->first)
+        {
+            m_conditionVariable.wait_until(lock, earliest->first);
+            continue;
+        }
+        CalculatedVariable* variable = earliest->second;
+        m_pending.erase(earliest);
+        // the recalculation takes synchronizers which the notifying threads hold while calling schedule()
+        lock.unlock();
+        variable->performTrailingUpdate();
+        lock.lock();
+    }
+}
+
+} /* namespace CalculatedVariables */
@@ -0,0 +1,96 @@
+/* © Copyright CERN, 2026.  All rights not expressly granted are reserved.
+ * QuasarIoReactor.h
+ *
+ *  Created on: 19 Oct 2026
+ *
+ *  This file is part of Quasar.
+ *
+ *  Quasar is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU Lesser General Public Licence as published by
+ *  the Free Software Foundation, either version 3 of the Licence.
+ *
+ *  Quasar is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU Lesser General Public Licence for more details.
+ *
+ *  You should have received a copy of the GNU Lesser General Public License
+ *  along with Quasar.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#ifndef COMMON_INCLUDE_QUASARIOREACTOR_H_
+#define COMMON_INCLUDE_QUASARIOREACTOR_H_
+
+#include <atomic>
+#include <chrono>
+#include <functional>
+#include <memory>
+#include <thread>
+#include <vector>
+
+#include <boost/asio/io_context.hpp>
+#include <boost/asio/executor_work_guard.hpp>
+
+namespace Quasar
+{
+
+/* The event loop shared by the device logic: an io_context (epoll on Linux) run by a fixed number of threads.
+ * Instead of dedicating a thread to every socket, serial port or timer, device logic can register
+ * file descriptors and timers here, or use context() directly with any Boost.Asio I/O object.
+ * The reactor is started from the Meta configuration (StandardMetaData.IoReactor) and stopped by the server
+ * at shutdown, after the device logic's shutdown() and before the device objects get unlinked.
+ * Callbacks run in the reactor threads, so they must not block.
+ */
+class IoReactor
+{
+public:
+    //! Cancels the watch or timer when destroyed; after cancel() returns, the callback is not running and won't be called again.
+    class Registration
+    {
+    public:
+        virtual ~Registration () {}
+        virtual void cancel () = 0;
+    };
+    typedef std::unique_ptr<Registration> RegistrationPtr;
+
+    enum class Readiness {Read, Write};
+
+    static void start (unsigned int numThreads);
+    //! Stops and joins the reactor threads; the io_context stays alive so registrations can still be cancelled.
+    static void shutdown ();
+    //! Is nullptr when the reactor is not started
+    static IoReactor* instance () { return s_instance.load(std::memory_order_acquire); }
+
+    boost::asio::io_context& context () { return m_context; }
+    unsigned int numThreads () const { return m_threads.size(); }
+
+#ifndef _WIN32
+    //! Calls onReady every time fd becomes readable (or writable). The fd stays owned (and closed) by the caller.
+    RegistrationPtr watchFd (int fd, Readiness readiness, const std::function<void()>& onReady);
+    //! Calls onSignal every time the process gets signalNumber (e.g. SIGUSR1), in a reactor thread, i.e. not in a signal handler.
+    RegistrationPtr watchSignal (int signalNumber, const std::function<void()>& onSignal);
+#endif // _WIN32
+    //! Calls onExpiry every period, the deadlines are absolute so the timer doesn't drift.
+    RegistrationPtr addPeriodicTimer (std::chrono::milliseconds period, const std::function<void()>& onExpiry);
+    //! Calls onExpiry once, after delay.
+    RegistrationPtr addOneShotTimer (std::chrono::milliseconds delay, const std::function<void()>& onExpiry);
+
+    explicit IoReactor (unsigned int numThreads);
+    ~IoReactor ();
+
+    IoReactor (const IoReactor& other) = delete;
+    IoReactor& operator= (const IoReactor& other) = delete;
+
+private:
+    void stop ();
+
+    boost::asio::io_context m_context;
+    boost::asio::executor_work_guard<boost::asio::io_context::executor_type> m_workGuard;
+    std::vector<std::thread> m_threads;
+
+    static std::atomic<IoReactor*> s_instance;
+};
+
+} /* namespace Quasar */
+
+#endif /* COMMON_INCLUDE_QUASARIOREACTOR_H_ */
@@ -0,0 +1,109 @@
+/* © Copyright CERN, 2026.  All rights not expressly granted are reserved.
+ * QuasarPollingScheduler.h
+ *
+ *  Created on: 19 Oct 2026
+ *
+ *  This file is part of Quasar.
+ *
+ *  Quasar is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU Lesser General Public Licence as published by
+ *  the Free Software Foundation, either version 3 of the Licence.
+ *
+ *  Quasar is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU Lesser General Public Licence for more details.
+ *
+ *  You should have received a copy of the GNU Lesser General Public License
+ *  along with Quasar.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#ifndef COMMON_INCLUDE_QUASARPOLLINGSCHEDULER_H_
+#define COMMON_INCLUDE_QUASARPOLLINGSCHEDULER_H_
+
+#include <atomic>
+#include <chrono>
+#include <condition_variable>
+#include <functional>
+#include <memory>
+#include <mutex>
+#include <string>
+#include <thread>
+#include <vector>
+
+#include <QuasarThreadPool.h>
+
+namespace Quasar
+{
+
+/* Calls periodic polling hooks (see pollPeriod in the Design) from a shared pool of worker threads.
+ * The due hooks are found by a hashed timer wheel ticking at the greatest common divisor of all periods,
+ * and the deadlines are absolute, so the timing doesn't drift with the duration of the hooks.
+ * A hook still running when it is due again is not started twice; this is counted as an overrun.
+ */
+class PollingScheduler
+{
+public:
+    struct Statistics
+    {
+        std::string description;
+        std::chrono::milliseconds period;
+        size_t numCalls;
+        size_t numOverruns;
+        std::chrono::microseconds maxDuration;
+        std::chrono::microseconds maxLateness; //! between the deadline and the start of the call
+    };
+
+    explicit PollingScheduler (unsigned int numThreads);
+    //! Stops the timer and waits for the hooks being executed.
+    ~PollingScheduler ();
+
+    PollingScheduler (const PollingScheduler& other) = delete;
+    PollingScheduler& operator= (const PollingScheduler& other) = delete;
+
+    //! Only before start()
+    void addHook (std::chrono::milliseconds period, const std::function<void()>& hook, const std::string& description);
+    void start ();
+
+    size_t numHooks () const { return m_hooks.size(); }
+    std::vector<Statistics> statistics () const;
+
+private:
+    typedef std::chrono::steady_clock Clock;
+
+    struct Hook
+    {
+        std::function<void()> function;
+        std::string description;
+        std::chrono::milliseconds period;
+        size_t periodInTicks;
+        size_t remainingRounds; //! full turns of the wheel before the hook is due
+        Clock::time_point deadline;
+        std::atomic<bool> running;
+        std::atomic<size_t> numCalls;
+        std::atomic<size_t> numOverruns;
+        std::atomic<long long> maxDurationUs;
+        std::atomic<long long> maxLatenessUs;
+    };
+
+    void schedule (size_t hookIndex, size_t fromTick);
+    void tick ();
+    void dispatch (Hook& hook);
+
+    std::vector<std::unique_ptr<Hook>> m_hooks;
+    std::vector<std::vector<size_t>> m_wheel; //! hook indices per slot
+    std::chrono::milliseconds m_tickPeriod;
+    size_t m_currentTick;
+    Clock::time_point m_startTime;
+
+    const unsigned int m_numThreads;
+    std::unique_ptr<ThreadPool> m_workers; //! created by start()
+    std::mutex m_accessLock;
+    std::condition_variable m_conditionVariable;
+    bool m_quit;
+    std::thread m_timer;
+};
+
+} /* namespace Quasar */
+
+#endif /* COMMON_INCLUDE_QUASARPOLLINGSCHEDULER_H_ */
@@ -0,0 +1,80 @@
+/* © Copyright CERN, 2026.  All rights not expressly granted are reserved.
+ * QuasarRegistrationJournal.h
+ *
+ *  Created on: 19 Oct 2026
+ *
+ *  This file is part of Quasar.
+ *
+ *  Quasar is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU Lesser General Public Licence as published by
+ *  the Free Software Foundation, either version 3 of the Licence.
+ *
+ *  Quasar is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU Lesser General Public Licence for more details.
+ *
+ *  You should have received a copy of the GNU Lesser General Public License
+ *  along with Quasar.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#ifndef COMMON_INCLUDE_QUASARREGISTRATIONJOURNAL_H_
+#define COMMON_INCLUDE_QUASARREGISTRATIONJOURNAL_H_
+
+#include <cstddef>
+#include <functional>
+#include <unordered_map>
+#include <utility>
+#include <vector>
+
+namespace Quasar
+{
+
+/* Keeps the registries filled while the configuration is loaded (node registry, ParserVariables, objects of
+ * Device Logic classes, ...) in the order of the configuration file in the parallel configuration mode too,
+ * where several threads register at once.
+ * Each part of the configuration done by one thread has its journal, made current for that thread. A registry
+ * adds to its container as usual and note()s the addition. Once everything is configured, the journals are
+ * walked in the order of the configuration file, which ranks all additions, and each registry restores that
+ * order from the Ranks. Without a current journal note() does nothing.
+ */
+class RegistrationJournal
+{
+public:
+    class Ranks
+    {
+    public:
+        void add (const RegistrationJournal& journal);
+        //! The additions made before any journal was current come first
+        size_t rankOf (const void* registry, const void* item) const;
+        bool empty () const { return m_ranks.empty(); }
+    private:
+        struct KeyHash
+        {
+            size_t operator() (const std::pair<const void*, const void*>& key) const
+            {
+                return std::hash<const void*>()(key.first) ^ (std::hash<const void*>()(key.second) << 1);
+            }
+        };
+        std::unordered_map<std::pair<const void*, const void*>, size_t, KeyHash> m_ranks;
+    };
+
+    //! registry identifies the container (its address, typically), item what was added to it
+    static void note (const void* registry, const void* item)
+    {
+        if (s_current)
+            s_current->m_additions.emplace_back(registry, item);
+    }
+
+    //! Makes journal current for the calling thread; returns the previous one (may be nullptr)
+    static RegistrationJournal* makeCurrent (RegistrationJournal* journal);
+
+private:
+    std::vector<std::pair<const void*, const void*>> m_additions;
+
+    static thread_local RegistrationJournal* s_current;
+};
+
+} /* namespace Quasar */
+
+#endif /* COMMON_INCLUDE_QUASARREGISTRATIONJOURNAL_H_ */
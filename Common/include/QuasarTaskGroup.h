@@ -0,0 +1,68 @@
+/* © Copyright CERN, 2026.  All rights not expressly granted are reserved.
+ * QuasarTaskGroup.h
+ *
+ *  Created on: 19 Oct 2026
+ *
+ *  This file is part of Quasar.
+ *
+ *  Quasar is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU Lesser General Public Licence as published by
+ *  the Free Software Foundation, either version 3 of the Licence.
+ *
+ *  Quasar is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU Lesser General Public Licence for more details.
+ *
+ *  You should have received a copy of the GNU Lesser General Public License
+ *  along with Quasar.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#ifndef COMMON_INCLUDE_QUASARTASKGROUP_H_
+#define COMMON_INCLUDE_QUASARTASKGROUP_H_
+
+#include <condition_variable>
+#include <deque>
+#include <exception>
+#include <functional>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+namespace Quasar
+{
+
+/* Runs a batch of tasks on a fixed number of threads and waits for all of them; tasks may add further tasks.
+ * Unlike ThreadPool there is no limit on queued tasks and exceptions are passed to the waiting thread:
+ * after a task has thrown, the tasks not started yet are dropped and wait() rethrows the first exception.
+ */
+class TaskGroup
+{
+public:
+    explicit TaskGroup (unsigned int numThreads);
+    //! Waits for the running tasks, drops the others
+    ~TaskGroup ();
+
+    TaskGroup (const TaskGroup& other) = delete;
+    TaskGroup& operator= (const TaskGroup& other) = delete;
+
+    void run (const std::function<void()>& task);
+    //! Returns when all tasks (including the ones added meanwhile) are done
+    void wait ();
+
+private:
+    void work ();
+
+    std::mutex m_lock;
+    std::condition_variable m_taskAvailable;
+    std::condition_variable m_allDone;
+    std::deque<std::function<void()>> m_tasks;
+    size_t m_numUnfinished; //! queued and running
+    std::exception_ptr m_firstException;
+    bool m_quit;
+    std::vector<std::thread> m_threads;
+};
+
+} /* namespace Quasar */
+
+#endif /* COMMON_INCLUDE_QUASARTASKGROUP_H_ */
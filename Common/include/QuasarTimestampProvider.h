@@ -0,0 +1,70 @@
+/* © Copyright CERN, 2026.  All rights not expressly granted are reserved.
+ * QuasarTimestampProvider.h
+ *
+ *  Created on: 19 Oct 2026
+ *
+ *  This file is part of Quasar.
+ *
+ *  Quasar is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU Lesser General Public Licence as published by
+ *  the Free Software Foundation, either version 3 of the Licence.
+ *
+ *  Quasar is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU Lesser General Public Licence for more details.
+ *
+ *  You should have received a copy of the GNU Lesser General Public License
+ *  along with Quasar.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#ifndef COMMON_INCLUDE_QUASARTIMESTAMPPROVIDER_H_
+#define COMMON_INCLUDE_QUASARTIMESTAMPPROVIDER_H_
+
+#include <atomic>
+#include <chrono>
+
+#include <uadatetime.h>
+
+namespace Quasar
+{
+
+/* Source of the timestamps put by quasar on values of variables (generated AddressSpace setters,
+ * source variables, calculated variables).
+ * In the Precise mode (default) every call reads the system clock.
+ * In the Coarse mode a background thread refreshes a cached timestamp every resolution period
+ * and now() only does an atomic load; it is meant for servers updating very many variables at high rates,
+ * where the clock reads become visible in profiles and a timestamp precision of few ms is good enough.
+ */
+class TimestampProvider
+{
+public:
+    enum class Mode
+    {
+        Precise,
+        Coarse
+    };
+
+    //! Can be called multiple times, e.g. to change the resolution. The resolution is ignored in the Precise mode.
+    static void configure (Mode mode, std::chrono::milliseconds resolution);
+
+    //! Stops the refreshing thread (if running) and goes back to the Precise mode.
+    static void shutdown ();
+
+    static Mode mode () { return s_coarse.load(std::memory_order_relaxed) ? Mode::Coarse : Mode::Precise; }
+
+    static UaDateTime now ()
+    {
+        if (s_coarse.load(std::memory_order_relaxed))
+            return UaDateTime(s_cachedTimestamp.load(std::memory_order_relaxed));
+        return UaDateTime::now();
+    }
+
+private:
+    static std::atomic<bool> s_coarse;
+    static std::atomic<OpcUa_DateTime> s_cachedTimestamp;
+};
+
+} /* namespace Quasar */
+
+#endif /* COMMON_INCLUDE_QUASARTIMESTAMPPROVIDER_H_ */
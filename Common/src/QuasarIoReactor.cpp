@@ -0,0 +1,302 @@
+/* © Copyright CERN, 2026.  All rights not expressly granted are reserved.
+ * QuasarIoReactor.cpp
+ *
+ *  Created on: 19 Oct 2026
+ *
+ *  This file is part of Quasar.
+ *
+ *  Quasar is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU Lesser General Public Licence as published by
+ *  the Free Software Foundation, either version 3 of the Licence.
+ *
+ *  Quasar is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU Lesser General Public Licence for more details.
+ *
+ *  You should have received a copy of the GNU Lesser General Public License
+ *  along with Quasar.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <mutex>
+#include <stdexcept>
+
+#include <boost/asio/steady_timer.hpp>
+#ifndef _WIN32
+#include <boost/asio/posix/stream_descriptor.hpp>
+#include <boost/asio/signal_set.hpp>
+#endif // _WIN32
+
+#include <LogIt.h>
+
+#include <QuasarIoReactor.h>
+
+namespace Quasar
+{
+
+std::atomic<IoReactor*> IoReactor::s_instance (nullptr);
+
+//! Owns the reactor after shutdown(), so that registrations cancelled late still find their io_context
+static std::unique_ptr<IoReactor> s_stoppedReactor;
+
+static void invokeCallback (const std::function<void()>& callback, const char* what)
+{
+    try
+    {
+        callback();
+    }
+    catch (const std::exception& e)
+    {
+        LOG(Log::ERR) << "IoReactor: " << what << " callback has thrown: " << e.what();
+    }
+}
+
+/* The pending asynchronous operation keeps the state alive through a shared_ptr. The callback runs with
+ * the state's lock held, so cancel() waits for a running callback; the lock is recursive so that
+ * a callback may cancel its own registration.
+ */
+class TimerRegistration: public IoReactor::Registration
+{
+public:
+    TimerRegistration (boost::asio::io_context& context, std::chrono::milliseconds period, bool periodic, const std::function<void()>& onExpiry):
+        m_state(std::make_shared<State>(context, period, periodic, onExpiry))
+    {
+        std::lock_guard<std::recursive_mutex> lock (m_state->lock);
+        m_state->timer.expires_after(period);
+        arm(m_state);
+    }
+
+    ~TimerRegistration () { cancel(); }
+
+    virtual void cancel () override
+    {
+        std::lock_guard<std::recursive_mutex> lock (m_state->lock);
+        m_state->cancelled = true;
+        m_state->timer.cancel();
+    }
+
+private:
+    struct State
+    {
+        State (boost::asio::io_context& context, std::chrono::milliseconds period, bool periodic, const std::function<void()>& onExpiry):
+            timer(context), period(period), periodic(periodic), onExpiry(onExpiry), cancelled(false) {}
+        boost::asio::steady_timer timer;
+        const std::chrono::milliseconds period;
+        const bool periodic;
+        const std::function<void()> onExpiry;
+        std::recursive_mutex lock;
+        bool cancelled;
+    };
+
+    static void arm (const std::shared_ptr<State>& state)
+    {
+        state->timer.async_wait([state](const boost::system::error_code& error)
+        {
+            std::lock_guard<std::recursive_mutex> lock (state->lock);
+            if (error || state->cancelled)
+                return;
+            invokeCallback(state->onExpiry, "timer");
+            if (state->periodic && !state->cancelled)
+            {
+                state->timer.expires_at(state->timer.expiry() + state->period);
+                arm(state);
+            }
+        });
+    }
+
+    std::shared_ptr<State> m_state;
+};
+
+#ifndef _WIN32
+class FdRegistration: public IoReactor::Registration
+{
+public:
+    FdRegistration (boost::asio::io_context& context, int fd, IoReactor::Readiness readiness, const std::function<void()>& onReady):
+        m_state(std::make_shared<State>(context, fd, readiness, onReady))
+    {
+        std::lock_guard<std::recursive_mutex> lock (m_state->lock);
+        arm(m_state);
+    }
+
+    ~FdRegistration () { cancel(); }
+
+    virtual void cancel () override
+    {
+        std::lock_guard<std::recursive_mutex> lock (m_state->lock);
+        if (m_state->cancelled)
+            return;
+        m_state->cancelled = true;
+        m_state->descriptor.cancel();
+        m_state->descriptor.release(); // the fd belongs to the caller, don't close it
+    }
+
+private:
+    struct State
+    {
+        State (boost::asio::io_context& context, int fd, IoReactor::Readiness readiness, const std::function<void()>& onReady):
+            descriptor(context, fd),
+            waitType(readiness == IoReactor::Readiness::Read ?
+                boost::asio::posix::stream_descriptor::wait_read : boost::asio::posix::stream_descriptor::wait_write),
+            onReady(onReady),
+            cancelled(false) {}
+        boost::asio::posix::stream_descriptor descriptor;
+        const boost::asio::posix::stream_descriptor::wait_type waitType;
+        const std::function<void()> onReady;
+        std::recursive_mutex lock;
+        bool cancelled;
+    };
+
+    static void arm (const std::shared_ptr<State>& state)
+    {
+        state->descriptor.async_wait(state->waitType, [state](const boost::system::error_code& error)
+        {
+            std::lock_guard<std::recursive_mutex> lock (state->lock);
+            if (state->cancelled)
+                return;
+            if (error)
+            {
+                LOG(Log::ERR) << "IoReactor: waiting for fd " << state->descriptor.native_handle() << " failed: " << error.message();
+                return;
+            }
+            invokeCallback(state->onReady, "fd");
+            if (!state->cancelled)
+                arm(state);
+        });
+    }
+
+    std::shared_ptr<State> m_state;
+};
+
+class SignalRegistration: public IoReactor::Registration
+{
+public:
+    SignalRegistration (boost::asio::io_context& context, int signalNumber, const std::function<void()>& onSignal):
+        m_state(std::make_shared<State>(context, signalNumber, onSignal))
+    {
+        std::lock_guard<std::recursive_mutex> lock (m_state->lock);
+        arm(m_state);
+    }
+
+    ~SignalRegistration () { cancel(); }
+
+    virtual void cancel () override
+    {
+        std::lock_guard<std::recursive_mutex> lock (m_state->lock);
+        if (m_state->cancelled)
+            return;
+        m_state->cancelled = true;
+        boost::system::error_code ignored;
+        m_state->signals.cancel(ignored);
+        m_state->signals.clear(ignored); // back to the default disposition of the signal
+    }
+
+private:
+    struct State
+    {
+        State (boost::asio::io_context& context, int signalNumber, const std::function<void()>& onSignal):
+            signals(context, signalNumber), onSignal(onSignal), cancelled(false) {}
+        boost::asio::signal_set signals;
+        const std::function<void()> onSignal;
+        std::recursive_mutex lock;
+        bool cancelled;
+    };
+
+    static void arm (const std::shared_ptr<State>& state)
+    {
+        state->signals.async_wait([state](const boost::system::error_code& error, int)
+        {
+            std::lock_guard<std::recursive_mutex> lock (state->lock);
+            if (error || state->cancelled)
+                return;
+            invokeCallback(state->onSignal, "signal");
+            if (!state->cancelled)
+                arm(state);
+        });
+    }
+
+    std::shared_ptr<State> m_state;
+};
+#endif // _WIN32
+
+void IoReactor::start (unsigned int numThreads)
+{
+    if (instance() || s_stoppedReactor)
+        throw std::logic_error("IoReactor can only be started once");
+    if (numThreads < 1)
+        throw std::runtime_error("IoReactor needs at least 1 thread");
+    s_instance.store(new IoReactor(numThreads), std::memory_order_release);
+}
+
+void IoReactor::shutdown ()
+{
+    IoReactor* reactor = s_instance.exchange(nullptr);
+    if (!reactor)
+        return;
+    reactor->stop();
+    s_stoppedReactor.reset(reactor);
+}
+
+IoReactor::IoReactor (unsigned int numThreads):
+        m_workGuard(boost::asio::make_work_guard(m_context))
+{
+    for (unsigned int i = 0; i < numThreads; ++i)
+        m_threads.emplace_back([this]()
+        {
+            while (true)
+            {
+                try
+                {
+                    m_context.run();
+                    return;
+                }
+                catch (const std::exception& e)
+                {
+                    LOG(Log::ERR) << "IoReactor: handler has thrown: " << e.what();
+                }
+            }
+        });
+    LOG(Log::INF) << "Started the I/O reactor with " << numThreads << " threads";
+}
+
+IoReactor::~IoReactor ()
+{
+    stop();
+}
+
+void IoReactor::stop ()
+{
+    if (m_threads.empty())
+        return;
+    m_workGuard.reset();
+    m_context.stop();
+    for (std::thread& thread : m_threads)
+        thread.join();
+    LOG(Log::INF) << "Stopped the I/O reactor";
+    m_threads.clear();
+}
+
+#ifndef _WIN32
+IoReactor::RegistrationPtr IoReactor::watchFd (int fd, Readiness readiness, const std::function<void()>& onReady)
+{
+    return RegistrationPtr(new FdRegistration(m_context, fd, readiness, onReady));
+}
+
+IoReactor::RegistrationPtr IoReactor::watchSignal (int signalNumber, const std::function<void()>& onSignal)
+{
+    return RegistrationPtr(new SignalRegistration(m_context, signalNumber, onSignal));
+}
+#endif // _WIN32
+
+IoReactor::RegistrationPtr IoReactor::addPeriodicTimer (std::chrono::milliseconds period, const std::function<void()>& onExpiry)
+{
+    if (period.count() < 1)
+        throw std::runtime_error("IoReactor: timer period has to be at least 1 ms");
+    return RegistrationPtr(new TimerRegistration(m_context, period, /*periodic*/ true, onExpiry));
+}
+
+IoReactor::RegistrationPtr IoReactor::addOneShotTimer (std::chrono::milliseconds delay, const std::function<void()>& onExpiry)
+{
+    return RegistrationPtr(new TimerRegistration(m_context, delay, /*periodic*/ false, onExpiry));
+}
+
+} /* namespace Quasar */
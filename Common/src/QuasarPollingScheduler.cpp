@@ -0,0 +1,204 @@
+/* © Copyright CERN, 2026.  All rights not expressly granted are reserved.
+ * QuasarPollingScheduler.cpp
+ *
+ *  Created on: 19 Oct 2026
+ *
+ *  This file is part of Quasar.
+ *
+ *  Quasar is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU Lesser General Public Licence as published by
+ *  the Free Software Foundation, either version 3 of the Licence.
+ *
+ *  Quasar is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU Lesser General Public Licence for more details.
+ *
+ *  You should have received a copy of the GNU Lesser General Public License
+ *  along with Quasar.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <stdexcept>
+
+#include <LogIt.h>
+
+#include <QuasarPollingScheduler.h>
+
+namespace Quasar
+{
+
+static const size_t s_wheelSize = 256;
+//! Upper limit of queued hook calls, in practice there is at most one per hook
+static const unsigned int s_maxJobs = 100000;
+
+static long long gcd (long long a, long long b)
+{
+    while (b != 0)
+    {
+        long long t = a % b;
+        a = b;
+        b = t;
+    }
+    return a;
+}
+
+static void storeMax (std::atomic<long long>& maximum, long long value)
+{
+    long long current = maximum.load(std::memory_order_relaxed);
+    while (value > current && !maximum.compare_exchange_weak(current, value, std::memory_order_relaxed))
+        ;
+}
+
+PollingScheduler::PollingScheduler (unsigned int numThreads):
+        m_wheel(s_wheelSize),
+        m_tickPeriod(0),
+        m_currentTick(0),
+        m_numThreads(numThreads),
+        m_quit(false)
+{
+}
+
+PollingScheduler::~PollingScheduler ()
+{
+    {
+        std::lock_guard<std::mutex> lock (m_accessLock);
+        m_quit = true;
+    }
+    m_conditionVariable.notify_one();
+    if (m_timer.joinable())
+        m_timer.join();
+    m_workers.reset(); // waits for the hooks still running
+    for (const Statistics& hook : statistics())
+        LOG(Log::INF) << "Polling hook " << hook.description << " (every " << hook.period.count() << " ms): " <<
+            hook.numCalls << " calls, " << hook.numOverruns << " overruns, max duration " << hook.maxDuration.count() <<
+            " us, max lateness " << hook.maxLateness.count() << " us";
+}
+
+void PollingScheduler::addHook (std::chrono::milliseconds period, const std::function<void()>& hook, const std::string& description)
+{
+    if (m_timer.joinable())
+        throw std::logic_error("PollingScheduler: can't add hooks after start()");
+    if (period.count() < 1)
+        throw std::runtime_error("PollingScheduler: period of " + description + " has to be at least 1 ms");
+    std::unique_ptr<Hook> newHook (new Hook);
+    newHook->function = hook;
+    newHook->description = description;
+    newHook->period = period;
+    newHook->periodInTicks = 0;
+    newHook->remainingRounds = 0;
+    newHook->running = false;
+    newHook->numCalls = 0;
+    newHook->numOverruns = 0;
+    newHook->maxDurationUs = 0;
+    newHook->maxLatenessUs = 0;
+    m_hooks.push_back(std::move(newHook));
+}
+
+void PollingScheduler::start ()
+{
+    if (m_hooks.empty())
+        return;
+    long long tickMs = m_hooks.front()->period.count();
+    for (const std::unique_ptr<Hook>& hook : m_hooks)
+        tickMs = gcd(tickMs, hook->period.count());
+    m_tickPeriod = std::chrono::milliseconds(tickMs);
+    m_workers.reset(new ThreadPool(m_numThreads, s_maxJobs));
+    m_startTime = Clock::now();
+    for (size_t i = 0; i < m_hooks.size(); ++i)
+    {
+        m_hooks[i]->periodInTicks = m_hooks[i]->period.count() / tickMs;
+        schedule(i, 0);
+    }
+    LOG(Log::INF) << "Starting the polling scheduler: " << m_hooks.size() << " hooks, tick " << tickMs << " ms";
+    m_timer = std::thread([this]()
+    {
+        std::unique_lock<std::mutex> lock (m_accessLock);
+        while (!m_quit)
+        {
+            Clock::time_point nextTick = m_startTime + m_tickPeriod * (m_currentTick + 1);
+            if (m_conditionVariable.wait_until(lock, nextTick, [this](){ return m_quit; }))
+                break;
+            m_currentTick++;
+            tick();
+        }
+    });
+}
+
+//! The hook gets due periodInTicks after fromTick; its slot is visited remainingRounds times before that.
+void PollingScheduler::schedule (size_t hookIndex, size_t fromTick)
+{
+    Hook& hook = *m_hooks[hookIndex];
+    size_t dueTick = fromTick + hook.periodInTicks;
+    hook.remainingRounds = (hook.periodInTicks - 1) / s_wheelSize;
+    hook.deadline = m_startTime + m_tickPeriod * dueTick;
+    m_wheel[dueTick % s_wheelSize].push_back(hookIndex);
+}
+
+void PollingScheduler::tick ()
+{
+    std::vector<size_t> slot;
+    slot.swap(m_wheel[m_currentTick % s_wheelSize]);
+    for (size_t hookIndex : slot)
+    {
+        Hook& hook = *m_hooks[hookIndex];
+        if (hook.remainingRounds > 0)
+        {
+            hook.remainingRounds--;
+            m_wheel[m_currentTick % s_wheelSize].push_back(hookIndex);
+        }
+        else
+        {
+            dispatch(hook);
+            schedule(hookIndex, m_currentTick);
+        }
+    }
+}
+
+void PollingScheduler::dispatch (Hook& hook)
+{
+    if (hook.running.exchange(true))
+    {
+        hook.numOverruns++;
+        LOG(Log::DBG) << "Polling hook " << hook.description << " is still running, skipping this period";
+        return;
+    }
+    Hook* hookPtr = &hook;
+    Clock::time_point deadline = hook.deadline;
+    UaStatus status = m_workers->addJob([hookPtr, deadline]()
+    {
+        Clock::time_point start = Clock::now();
+        storeMax(hookPtr->maxLatenessUs, std::chrono::duration_cast<std::chrono::microseconds>(start - deadline).count());
+        try
+        {
+            hookPtr->function();
+        }
+        catch (const std::exception& e)
+        {
+            LOG(Log::ERR) << "Polling hook " << hookPtr->description << " has thrown: " << e.what();
+        }
+        storeMax(hookPtr->maxDurationUs, std::chrono::duration_cast<std::chrono::microseconds>(Clock::now() - start).count());
+        hookPtr->numCalls++;
+        hookPtr->running = false;
+    }, hook.description);
+    if (!status.isGood())
+    {
+        hook.numOverruns++;
+        hook.running = false;
+    }
+}
+
+std::vector<PollingScheduler::Statistics> PollingScheduler::statistics () const
+{
+    std::vector<Statistics> result;
+    for (const std::unique_ptr<Hook>& hook : m_hooks)
+        result.push_back({
+            hook->description,
+            hook->period,
+            hook->numCalls.load(),
+            hook->numOverruns.load(),
+            std::chrono::microseconds(hook->maxDurationUs.load()),
+            std::chrono::microseconds(hook->maxLatenessUs.load())});
+    return result;
+}
+
+} /* namespace Quasar */
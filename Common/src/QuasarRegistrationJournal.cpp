@@ -0,0 +1,47 @@
+/* © Copyright CERN, 2026.  All rights not expressly granted are reserved.
+ * QuasarRegistrationJournal.cpp
+ *
+ *  Created on: 19 Oct 2026
+ *
+ *  This file is part of Quasar.
+ *
+ *  Quasar is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU Lesser General Public Licence as published by
+ *  the Free Software Foundation, either version 3 of the Licence.
+ *
+ *  Quasar is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU Lesser General Public Licence for more details.
+ *
+ *  You should have received a copy of the GNU Lesser General Public License
+ *  along with Quasar.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <QuasarRegistrationJournal.h>
+
+namespace Quasar
+{
+
+thread_local RegistrationJournal* RegistrationJournal::s_current (nullptr);
+
+void RegistrationJournal::Ranks::add (const RegistrationJournal& journal)
+{
+    for (const std::pair<const void*, const void*>& addition : journal.m_additions)
+        m_ranks.emplace(addition, m_ranks.size() + 1); // an item added again keeps its first rank
+}
+
+size_t RegistrationJournal::Ranks::rankOf (const void* registry, const void* item) const
+{
+    auto it = m_ranks.find(std::make_pair(registry, item));
+    return it != m_ranks.end() ? it->second : 0;
+}
+
+RegistrationJournal* RegistrationJournal::makeCurrent (RegistrationJournal* journal)
+{
+    RegistrationJournal* previous = s_current;
+    s_current = journal;
+    return previous;
+}
+
+} /* namespace Quasar */
@@ -0,0 +1,103 @@
+/* © Copyright CERN, 2026.  All rights not expressly granted are reserved.
+ * QuasarTaskGroup.cpp
+ *
+ *  Created on: 19 Oct 2026
+ *
+ *  This file is part of Quasar.
+ *
+ *  Quasar is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU Lesser General Public Licence as published by
+ *  the Free Software Foundation, either version 3 of the Licence.
+ *
+ *  Quasar is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU Lesser General Public Licence for more details.
+ *
+ *  You should have received a copy of the GNU Lesser General Public License
+ *  along with Quasar.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <stdexcept>
+
+#include <QuasarTaskGroup.h>
+
+namespace Quasar
+{
+
+TaskGroup::TaskGroup (unsigned int numThreads):
+        m_numUnfinished(0),
+        m_quit(false)
+{
+    if (numThreads < 1)
+        throw std::runtime_error("TaskGroup needs at least 1 thread");
+    for (unsigned int i = 0; i < numThreads; ++i)
+        m_threads.emplace_back(&TaskGroup::work, this);
+}
+
+TaskGroup::~TaskGroup ()
+{
+    {
+        std::lock_guard<std::mutex> lock (m_lock);
+        m_quit = true;
+        m_numUnfinished -= m_tasks.size();
+        m_tasks.clear();
+    }
+    m_taskAvailable.notify_all();
+    for (std::thread& thread : m_threads)
+        thread.join();
+}
+
+void TaskGroup::run (const std::function<void()>& task)
+{
+    {
+        std::lock_guard<std::mutex> lock (m_lock);
+        if (m_firstException)
+            return; // the group failed already, no point in starting more
+        m_tasks.push_back(task);
+        m_numUnfinished++;
+    }
+    m_taskAvailable.notify_one();
+}
+
+void TaskGroup::wait ()
+{
+    std::unique_lock<std::mutex> lock (m_lock);
+    m_allDone.wait(lock, [this](){ return m_numUnfinished == 0; });
+    if (m_firstException)
+        std::rethrow_exception(m_firstException);
+}
+
+void TaskGroup::work ()
+{
+    std::unique_lock<std::mutex> lock (m_lock);
+    while (true)
+    {
+        m_taskAvailable.wait(lock, [this](){ return m_quit || !m_tasks.empty(); });
+        if (m_tasks.empty())
+            return; // quit
+        std::function<void()> task (std::move(m_tasks.front()));
+        m_tasks.pop_front();
+        lock.unlock();
+        std::exception_ptr exception;
+        try
+        {
+            task();
+        }
+        catch (...)
+        {
+            exception = std::current_exception();
+        }
+        lock.lock();
+        if (exception && !m_firstException)
+        {
+            m_firstException = exception;
+            m_numUnfinished -= m_tasks.size();
+            m_tasks.clear();
+        }
+        if (--m_numUnfinished == 0)
+            m_allDone.notify_all();
+    }
+}
+
+} /* namespace Quasar */
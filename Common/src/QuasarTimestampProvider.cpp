@@ -0,0 +1,95 @@
+/* © Copyright CERN, 2026.  All rights not expressly granted are reserved.
+ * QuasarTimestampProvider.cpp
+ *
+ *  Created on: 19 Oct 2026
+ *
+ *  This file is part of Quasar.
+ *
+ *  Quasar is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU Lesser General Public Licence as published by
+ *  the Free Software Foundation, either version 3 of the Licence.
+ *
+ *  Quasar is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU Lesser General Public Licence for more details.
+ *
+ *  You should have received a copy of the GNU Lesser General Public License
+ *  along with Quasar.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <mutex>
+#include <thread>
+#include <condition_variable>
+#include <type_traits>
+
+#include <LogIt.h>
+
+#include <QuasarTimestampProvider.h>
+
+namespace Quasar
+{
+
+// std::atomic needs it, and OpcUa_DateTime is defined differently by each OPC UA backend
+static_assert(std::is_trivially_copyable<OpcUa_DateTime>::value, "OpcUa_DateTime must be trivially copyable to be held in a std::atomic");
+
+std::atomic<bool> TimestampProvider::s_coarse (false);
+std::atomic<OpcUa_DateTime> TimestampProvider::s_cachedTimestamp;
+
+/* State of the refreshing thread, only touched under s_accessLock */
+static std::mutex s_accessLock;
+static std::condition_variable s_conditionVariable;
+static std::thread s_refresher;
+static std::chrono::milliseconds s_resolution (1);
+static bool s_quit (false);
+
+static void refresh (std::atomic<OpcUa_DateTime>& cachedTimestamp)
+{
+    std::unique_lock<std::mutex> lock (s_accessLock);
+    while (!s_quit)
+    {
+        cachedTimestamp.store(UaDateTime::now(), std::memory_order_relaxed);
+        s_conditionVariable.wait_for(lock, s_resolution);
+    }
+}
+
+void TimestampProvider::configure (Mode mode, std::chrono::milliseconds resolution)
+{
+    if (mode == Mode::Precise)
+    {
+        shutdown();
+        LOG(Log::INF) << "Timestamps: precise mode (system clock read for every update)";
+        return;
+    }
+    if (resolution.count() < 1)
+        throw std::runtime_error("Timestamps: resolution of the coarse mode has to be at least 1 ms");
+    {
+        std::lock_guard<std::mutex> lock (s_accessLock);
+        s_resolution = resolution;
+        s_cachedTimestamp.store(UaDateTime::now(), std::memory_order_relaxed);
+        if (!s_refresher.joinable())
+        {
+            s_quit = false;
+            s_refresher = std::thread(refresh, std::ref(s_cachedTimestamp));
+        }
+    }
+    s_conditionVariable.notify_one();
+    s_coarse.store(true, std::memory_order_relaxed);
+    LOG(Log::INF) << "Timestamps: coarse mode, resolution " << resolution.count() << " ms";
+}
+
+void TimestampProvider::shutdown ()
+{
+    s_coarse.store(false, std::memory_order_relaxed);
+    std::thread refresher;
+    {
+        std::lock_guard<std::mutex> lock (s_accessLock);
+        s_quit = true;
+        refresher.swap(s_refresher);
+    }
+    s_conditionVariable.notify_one();
+    if (refresher.joinable())
+        refresher.join();
+}
+
+} /* namespace Quasar */
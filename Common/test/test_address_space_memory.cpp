@@ -0,0 +1,166 @@
+/* © Copyright CERN, 2026.  All rights not expressly granted are reserved.
+ * test_address_space_memory.cpp
+ *
+ *  Created on: 19 Oct 2026
+ *
+ *  This file is part of Quasar.
+ *
+ *  Quasar is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU Lesser General Public Licence as published by
+ *  the Free Software Foundation, either version 3 of the Licence.
+ *
+ *  Quasar is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU Lesser General Public Licence for more details.
+ *
+ *  You should have received a copy of the GNU Lesser General Public License
+ *  along with Quasar.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+/* Measures the per-node memory of quasar's own address-space structures, as figures printed by the tests:
+ * the heap of the registry of Device Logic objects by full name (keyed by copies of the names, as before,
+ * and by references to them, as now) and the size and heap of a ChangeNotifyingVariable with its listeners.
+ * The heap is measured as mallinfo deltas, so only with glibc. The end-to-end resident memory per node of a
+ * real server is what configure() logs.
+ */
+
+#include <functional>
+#include <iostream>
+#include <string>
+#include <unordered_map>
+#include <vector>
+
+#ifdef __GLIBC__
+#include <malloc.h>
+#endif
+
+#include <gtest/gtest.h>
+
+#include <ChangeNotifyingVariable.h>
+
+using AddressSpace::ChangeNotifyingVariable;
+
+//! Bytes allocated on the heap and not freed yet; -1 when it can't be known
+static long long heapInUse ()
+{
+#if defined(__GLIBC__) && __GLIBC_PREREQ(2, 33)
+    return static_cast<long long>(mallinfo2().uordblks);
+#elif defined(__GLIBC__)
+    return static_cast<long long>(mallinfo().uordblks);
+#else
+    return -1;
+#endif
+}
+
+static void report (const std::string& what, double value, const std::string& unit)
+{
+    std::cout << "[ MEMORY   ] " << what << ": " << value << " " << unit << std::endl;
+    ::testing::Test::RecordProperty(what, std::to_string(value));
+}
+
+//! Full names of a config of 10 crates x 20 boards x 50 channels (the crates and boards included)
+static std::vector<std::string> makeFullNames ()
+{
+    std::vector<std::string> names;
+    for (int crate = 0; crate < 10; ++crate)
+    {
+        const std::string crateName ("crate" + std::to_string(crate));
+        names.push_back(crateName);
+        for (int board = 0; board < 20; ++board)
+        {
+            const std::string boardName (crateName + ".board" + std::to_string(board));
+            names.push_back(boardName);
+            for (int channel = 0; channel < 50; ++channel)
+                names.push_back(boardName + ".channel" + std::to_string(channel));
+        }
+    }
+    return names;
+}
+
+//! Heap per object of the registry filled with given names (which belong to the objects, so are not counted)
+template<typename Registry>
+static double registryHeapPerObject (const std::vector<std::string>& names)
+{
+    const long long before = heapInUse();
+    double perObject = 0;
+    {
+        Registry registry;
+        for (const std::string& name : names)
+            registry.emplace(std::cref(name), nullptr);
+        perObject = double(heapInUse() - before) / names.size();
+    }
+    return perObject;
+}
+
+TEST(AddressSpaceMemory, registryOfObjectsByFullName)
+{
+    if (heapInUse() < 0)
+        return; // not measurable here
+    const std::vector<std::string> names (makeFullNames());
+    size_t totalLength = 0;
+    for (const std::string& name : names)
+        totalLength += name.size();
+
+    // as generated before, and as generated now by designToDeviceBaseHeader.jinja
+    typedef std::unordered_map<std::string, void*> ByCopiedName;
+    typedef std::unordered_map<std::reference_wrapper<const std::string>, void*, std::hash<std::string>, std::equal_to<std::string>> ByReferencedName;
+    const double byCopies = registryHeapPerObject<ByCopiedName>(names);
+    const double byReferences = registryHeapPerObject<ByReferencedName>(names);
+
+    report("objects", names.size(), "");
+    report("mean full name length", double(totalLength) / names.size(), "characters");
+    report("registry keyed by copied names, heap per object", byCopies, "B");
+    report("registry keyed by referenced names, heap per object", byReferences, "B");
+    EXPECT_LT(byReferences, byCopies);
+}
+
+class AddressSpaceMemoryTest: public ::testing::Test
+{
+protected:
+    static const size_t s_numVariables = 10000;
+
+    virtual void SetUp () override
+    {
+        UaVariant value;
+        value.setDouble(0);
+        for (size_t i = 0; i < s_numVariables; ++i)
+            m_variables.push_back(new ChangeNotifyingVariable(
+                    UaNodeId(std::to_string(i).c_str(), 2),
+                    "variable",
+                    2,
+                    value,
+                    OpcUa_AccessLevels_CurrentReadOrWrite,
+                    /*node manager config*/ nullptr));
+    }
+
+    virtual void TearDown () override
+    {
+        for (ChangeNotifyingVariable* variable : m_variables)
+            variable->releaseReference();
+    }
+
+    //! Heap per variable taken by adding one more listener to each variable
+    double addListenerToEach ()
+    {
+        const long long before = heapInUse();
+        for (ChangeNotifyingVariable* variable : m_variables)
+            variable->addChangeListener([variable](ChangeNotifyingVariable&, const UaDataValue&){});
+        return double(heapInUse() - before) / m_variables.size();
+    }
+
+    std::vector<ChangeNotifyingVariable*> m_variables;
+};
+
+TEST_F(AddressSpaceMemoryTest, changeNotifyingVariable)
+{
+    report("ChangeNotifyingVariable size over its base class",
+            double(sizeof(ChangeNotifyingVariable) - sizeof(OpcUa::BaseDataVariableType)), "B");
+    if (heapInUse() < 0)
+        return; // not measurable here
+    const double firstListener = addListenerToEach();
+    const double secondListener = addListenerToEach();
+    report("heap per variable for the first listener", firstListener, "B");
+    report("heap per variable for the second listener", secondListener, "B");
+    EXPECT_LT(firstListener, 1.0) << "the first listener should be held inline";
+}
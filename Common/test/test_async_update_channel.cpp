@@ -0,0 +1,262 @@
+/* © Copyright CERN, 2026.  All rights not expressly granted are reserved.
+ * test_async_update_channel.cpp
+ *
+ *  Created on: 19 Oct 2026
+ *
+ *  This file is part of Quasar.
+ *
+ *  Quasar is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU Lesser General Public Licence as published by
+ *  the Free Software Foundation, either version 3 of the Licence.
+ *
+ *  Quasar is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU Lesser General Public Licence for more details.
+ *
+ *  You should have received a copy of the GNU Lesser General Public License
+ *  along with Quasar.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+/* The variables are created without a node manager: the channel only calls their setValue(). */
+
+#include <atomic>
+#include <chrono>
+#include <future>
+#include <memory>
+#include <stdexcept>
+#include <string>
+#include <thread>
+#include <vector>
+
+#include <gtest/gtest.h>
+
+#include <LogIt.h>
+#include <AsyncUpdateChannel.h>
+#include <ChangeNotifyingVariable.h>
+
+using AddressSpace::AsyncUpdateChannel;
+using AddressSpace::ChangeNotifyingVariable;
+using std::chrono::milliseconds;
+
+class AsyncUpdateChannelTest: public ::testing::Test
+{
+protected:
+    static void SetUpTestCase ()
+    {
+        Log::initializeLogging(Log::WRN);
+    }
+
+    virtual void TearDown () override
+    {
+        AsyncUpdateChannel::shutdown();
+        for (ChangeNotifyingVariable* variable : m_variables)
+            variable->releaseReference();
+    }
+
+    //! The variable holds initialValue and counts its changes in numChanges
+    ChangeNotifyingVariable* makeVariable (const std::string& name, double initialValue, std::atomic<int>& numChanges)
+    {
+        UaVariant value;
+        value.setDouble(initialValue);
+        ChangeNotifyingVariable* variable = new ChangeNotifyingVariable(
+                UaNodeId(name.c_str(), 2),
+                name.c_str(),
+                2,
+                value,
+                OpcUa_AccessLevels_CurrentReadOrWrite,
+                /*node manager config*/ nullptr);
+        m_variables.push_back(variable);
+        variable->addChangeListener([&numChanges](ChangeNotifyingVariable&, const UaDataValue&){ numChanges++; });
+        return variable;
+    }
+
+    static bool post (ChangeNotifyingVariable* variable, double value, bool skipUnchanged = false)
+    {
+        UaVariant variant;
+        variant.setDouble(value);
+        return AsyncUpdateChannel::post(variable, UaDataValue(variant, OpcUa_Good, UaDateTime::now(), UaDateTime::now()), skipUnchanged);
+    }
+
+    static double valueOf (ChangeNotifyingVariable* variable)
+    {
+        OpcUa_Double value;
+        if (!ChangeNotifyingVariable::toNumeric(variable->value(/*session*/ nullptr), value))
+            throw std::runtime_error("no numeric value");
+        return value;
+    }
+
+    //! Returns false on timeout
+    static bool waitForPublished (size_t numPublished)
+    {
+        for (int i = 0; i < 500; ++i)
+        {
+            if (AsyncUpdateChannel::instance()->numPublished() >= numPublished)
+                return true;
+            std::this_thread::sleep_for(milliseconds(10));
+        }
+        return false;
+    }
+
+private:
+    std::vector<ChangeNotifyingVariable*> m_variables;
+};
+
+TEST_F(AsyncUpdateChannelTest, storesDirectlyWhenNotStarted)
+{
+    std::atomic<int> numChanges (0);
+    ChangeNotifyingVariable* variable = makeVariable("direct", -1, numChanges);
+    ASSERT_EQ(nullptr, AsyncUpdateChannel::instance());
+    EXPECT_TRUE(post(variable, 42));
+    EXPECT_EQ(42, valueOf(variable));
+    EXPECT_EQ(1, numChanges.load());
+}
+
+TEST_F(AsyncUpdateChannelTest, startsOnce)
+{
+    AsyncUpdateChannel::start(1000);
+    ASSERT_NE(nullptr, AsyncUpdateChannel::instance());
+    EXPECT_EQ(1024u, AsyncUpdateChannel::instance()->capacity());
+    EXPECT_THROW(AsyncUpdateChannel::start(1000), std::logic_error);
+    AsyncUpdateChannel::shutdown();
+    EXPECT_EQ(nullptr, AsyncUpdateChannel::instance());
+}
+
+TEST_F(AsyncUpdateChannelTest, appliesTheUpdatesOfEveryVariableInOrder)
+{
+    const int numProducers = 4;
+    const int numUpdates = 5000;
+    std::vector<ChangeNotifyingVariable*> variables;
+    std::vector<std::atomic<int>> numChanges (numProducers);
+    std::vector<std::atomic<bool>> outOfOrder (numProducers);
+    for (int i = 0; i < numProducers; ++i)
+    {
+        numChanges[i] = 0;
+        outOfOrder[i] = false;
+        variables.push_back(makeVariable("producer" + std::to_string(i), 0, numChanges[i]));
+        std::atomic<bool>& flag = outOfOrder[i];
+        std::shared_ptr<double> last (new double(0));
+        variables.back()->addChangeListener([&flag, last](ChangeNotifyingVariable&, const UaDataValue& dataValue)
+        {
+            OpcUa_Double value = 0;
+            ChangeNotifyingVariable::toNumeric(dataValue, value);
+            if (value <= *last)
+                flag = true;
+            *last = value; // only the publisher thread updates the variable
+        });
+    }
+
+    AsyncUpdateChannel::start(256);
+    std::vector<std::thread> producers;
+    for (int i = 0; i < numProducers; ++i)
+        producers.emplace_back([i, &variables]()
+        {
+            for (int n = 1; n <= numUpdates; ++n)
+                while (!post(variables[i], n)) // full: the update was dropped, post it again
+                    std::this_thread::yield();
+        });
+    for (std::thread& producer : producers)
+        producer.join();
+    ASSERT_TRUE(waitForPublished(numProducers * numUpdates));
+    EXPECT_LE(AsyncUpdateChannel::instance()->maxDepth(), 256u);
+    EXPECT_EQ(0u, AsyncUpdateChannel::instance()->depth());
+
+    for (int i = 0; i < numProducers; ++i)
+    {
+        EXPECT_EQ(numUpdates, valueOf(variables[i]));
+        EXPECT_EQ(numUpdates, numChanges[i].load());
+        EXPECT_FALSE(outOfOrder[i].load()) << "updates of producer" << i << " applied out of order";
+    }
+}
+
+TEST_F(AsyncUpdateChannelTest, shutdownAppliesWhatIsQueued)
+{
+    std::atomic<int> numChanges (0);
+    ChangeNotifyingVariable* variable = makeVariable("queued", 0, numChanges);
+    AsyncUpdateChannel::start(1024);
+    for (int n = 1; n <= 1000; ++n)
+        ASSERT_TRUE(post(variable, n));
+    AsyncUpdateChannel::shutdown();
+    EXPECT_EQ(1000, valueOf(variable));
+    EXPECT_EQ(1000, numChanges.load());
+}
+
+TEST_F(AsyncUpdateChannelTest, skipsUnchangedValuesWhenApplied)
+{
+    std::atomic<int> numChanges (0);
+    ChangeNotifyingVariable* variable = makeVariable("skipping", -1, numChanges);
+
+    // directly
+    EXPECT_TRUE(post(variable, 1, /*skipUnchanged*/ true));
+    EXPECT_TRUE(post(variable, 1, /*skipUnchanged*/ true));
+    EXPECT_EQ(1, numChanges.load());
+
+    // through the channel: a value posted twice is compared with what the first post stored
+    AsyncUpdateChannel::start(16);
+    EXPECT_TRUE(post(variable, 2, /*skipUnchanged*/ true));
+    EXPECT_TRUE(post(variable, 2, /*skipUnchanged*/ true));
+    EXPECT_TRUE(post(variable, 2, /*skipUnchanged*/ false));
+    EXPECT_TRUE(post(variable, 1, /*skipUnchanged*/ true));
+    ASSERT_TRUE(waitForPublished(4));
+    EXPECT_EQ(1 + 3, numChanges.load());
+    EXPECT_EQ(1, valueOf(variable));
+}
+
+TEST_F(AsyncUpdateChannelTest, dropsUpdatesWhenFull)
+{
+    std::atomic<int> numChanges (0);
+    ChangeNotifyingVariable* variable = makeVariable("blocking", 0, numChanges);
+    std::promise<void> publisherBlocked;
+    std::promise<void> release;
+    std::shared_future<void> released (release.get_future());
+    variable->addChangeListener([&](ChangeNotifyingVariable&, const UaDataValue&)
+    {
+        if (numChanges == 1)
+        {
+            publisherBlocked.set_value();
+            released.wait();
+        }
+    });
+
+    AsyncUpdateChannel::start(2);
+    ASSERT_TRUE(post(variable, 1));
+    publisherBlocked.get_future().wait(); // the first update left the queue
+    EXPECT_TRUE(post(variable, 2));
+    EXPECT_TRUE(post(variable, 3));
+    EXPECT_FALSE(post(variable, 4));
+    EXPECT_EQ(1u, AsyncUpdateChannel::instance()->numOverflows());
+    release.set_value();
+    ASSERT_TRUE(waitForPublished(3));
+    EXPECT_EQ(3, valueOf(variable));
+    EXPECT_EQ(3, numChanges.load());
+}
+
+TEST_F(AsyncUpdateChannelTest, postingWhileShuttingDownLosesNothing)
+{
+    const int numProducers = 4;
+    const int numUpdates = 2000;
+    std::atomic<int> numChanges (0);
+    std::vector<ChangeNotifyingVariable*> variables;
+    for (int i = 0; i < numProducers; ++i)
+        variables.push_back(makeVariable("late" + std::to_string(i), 0, numChanges));
+
+    AsyncUpdateChannel::start(256);
+    AsyncUpdateChannel* channel = AsyncUpdateChannel::instance();
+    std::atomic<int> numDropped (0);
+    std::vector<std::thread> producers;
+    for (int i = 0; i < numProducers; ++i)
+        producers.emplace_back([i, &variables, &numDropped]()
+        {
+            for (int n = 1; n <= numUpdates; ++n)
+                if (!post(variables[i], n))
+                    numDropped++;
+        });
+    std::this_thread::sleep_for(milliseconds(1));
+    AsyncUpdateChannel::shutdown(); // while the producers still post: the later updates are stored directly
+    for (std::thread& producer : producers)
+        producer.join();
+
+    EXPECT_EQ(numProducers * numUpdates, numChanges.load() + numDropped.load());
+    EXPECT_EQ(size_t(numDropped.load()), channel->numOverflows()); // the stopped channel stays readable
+    EXPECT_EQ(0u, channel->depth());
+}
@@ -0,0 +1,125 @@
+/* © Copyright CERN, 2026.  All rights not expressly granted are reserved.
+ * test_change_notifying_variable.cpp
+ *
+ *  Created on: 19 Oct 2026
+ *
+ *  This file is part of Quasar.
+ *
+ *  Quasar is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU Lesser General Public Licence as published by
+ *  the Free Software Foundation, either version 3 of the Licence.
+ *
+ *  Quasar is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU Lesser General Public Licence for more details.
+ *
+ *  You should have received a copy of the GNU Lesser General Public License
+ *  along with Quasar.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+/* The variables are created without a node manager, as in test_async_update_channel.cpp. */
+
+#include <memory>
+#include <string>
+#include <vector>
+
+#include <gtest/gtest.h>
+
+#include <ChangeNotifyingVariable.h>
+
+using AddressSpace::ChangeNotifyingVariable;
+using AddressSpace::NumericChangeListener;
+
+class RecordingListener: public NumericChangeListener
+{
+public:
+    RecordingListener (std::vector<std::string>& calls, const std::string& name): m_calls(calls), m_name(name) {}
+
+    virtual void onChange (ChangeNotifyingVariable&, const UaDataValue&, bool isNumeric, OpcUa_Double numericValue) override
+    {
+        m_calls.push_back(m_name + (isNumeric ? "=" + std::to_string(int(numericValue)) : "=?"));
+    }
+
+private:
+    std::vector<std::string>& m_calls;
+    const std::string m_name;
+};
+
+class ChangeNotifyingVariableTest: public ::testing::Test
+{
+protected:
+    virtual void SetUp () override
+    {
+        UaVariant value;
+        value.setDouble(0);
+        m_variable = new ChangeNotifyingVariable(
+                UaNodeId("variable", 2),
+                "variable",
+                2,
+                value,
+                OpcUa_AccessLevels_CurrentReadOrWrite,
+                /*node manager config*/ nullptr);
+    }
+
+    virtual void TearDown () override
+    {
+        m_variable->releaseReference();
+    }
+
+    void set (double value)
+    {
+        UaVariant variant;
+        variant.setDouble(value);
+        ASSERT_TRUE(m_variable->setValue(nullptr, UaDataValue(variant, OpcUa_Good, UaDateTime::now(), UaDateTime::now()), OpcUa_False).isGood());
+    }
+
+    void addFunction (const std::string& name)
+    {
+        std::vector<std::string>& calls = m_calls;
+        m_variable->addChangeListener([&calls, name](ChangeNotifyingVariable&, const UaDataValue&){ calls.push_back(name); });
+    }
+
+    void addNumeric (const std::string& name)
+    {
+        m_variable->addChangeListener(std::unique_ptr<NumericChangeListener>(new RecordingListener(m_calls, name)));
+    }
+
+    ChangeNotifyingVariable* m_variable;
+    std::vector<std::string> m_calls;
+};
+
+TEST_F(ChangeNotifyingVariableTest, callsTheListenersInTheOrderTheyWereAdded)
+{
+    addFunction("a");
+    addNumeric("b");
+    addFunction("c");
+    addNumeric("d");
+    EXPECT_EQ(4u, m_variable->changeListenerSize());
+    EXPECT_EQ(2u, m_variable->numericChangeListenerSize());
+    set(7);
+    EXPECT_EQ((std::vector<std::string>{"a", "b=7", "c", "d=7"}), m_calls);
+}
+
+TEST_F(ChangeNotifyingVariableTest, removingTheNumericListenersKeepsTheOrderOfTheOthers)
+{
+    addNumeric("a");
+    addFunction("b");
+    addNumeric("c");
+    addFunction("d");
+    m_variable->removeAllNumericChangeListeners();
+    EXPECT_EQ(2u, m_variable->changeListenerSize());
+    EXPECT_EQ(0u, m_variable->numericChangeListenerSize());
+    addNumeric("e");
+    set(1);
+    EXPECT_EQ((std::vector<std::string>{"b", "d", "e=1"}), m_calls);
+}
+
+TEST_F(ChangeNotifyingVariableTest, passesNonNumericValuesToNumericListeners)
+{
+    addNumeric("a");
+    UaVariant variant;
+    variant.setString("text");
+    ASSERT_TRUE(m_variable->setValue(nullptr, UaDataValue(variant, OpcUa_Good, UaDateTime::now(), UaDateTime::now()), OpcUa_False).isGood());
+    EXPECT_EQ((std::vector<std::string>{"a=?"}), m_calls);
+}
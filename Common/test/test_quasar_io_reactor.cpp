@@ -0,0 +1,182 @@
+/* © Copyright CERN, 2026.  All rights not expressly granted are reserved.
+ * test_quasar_io_reactor.cpp
+ *
+ *  Created on: 19 Oct 2026
+ *
+ *  This file is part of Quasar.
+ *
+ *  Quasar is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU Lesser General Public Licence as published by
+ *  the Free Software Foundation, either version 3 of the Licence.
+ *
+ *  Quasar is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU Lesser General Public Licence for more details.
+ *
+ *  You should have received a copy of the GNU Lesser General Public License
+ *  along with Quasar.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <atomic>
+#include <chrono>
+#include <future>
+#include <stdexcept>
+#include <thread>
+
+#ifndef _WIN32
+#include <csignal>
+#include <unistd.h>
+#endif // _WIN32
+
+#include <gtest/gtest.h>
+
+#include <LogIt.h>
+#include <QuasarIoReactor.h>
+
+using Quasar::IoReactor;
+using std::chrono::milliseconds;
+
+/* Every test runs its own reactor; only startAndShutdown uses the instance of the server, which can be started
+ * once per process. */
+class IoReactorTest: public ::testing::Test
+{
+protected:
+    static void SetUpTestCase ()
+    {
+        Log::initializeLogging(Log::WRN);
+    }
+
+    IoReactorTest (): m_reactor(2) {}
+
+    IoReactor m_reactor;
+};
+
+TEST_F(IoReactorTest, periodicTimerFiresEveryPeriod)
+{
+    std::atomic<int> numExpiries (0);
+    IoReactor::RegistrationPtr timer (m_reactor.addPeriodicTimer(milliseconds(20), [&numExpiries](){ numExpiries++; }));
+    std::this_thread::sleep_for(milliseconds(410));
+    timer->cancel();
+    int numAtCancel = numExpiries.load();
+    EXPECT_GE(numAtCancel, 15);
+    EXPECT_LE(numAtCancel, 20);
+    std::this_thread::sleep_for(milliseconds(60));
+    EXPECT_EQ(numAtCancel, numExpiries.load());
+}
+
+TEST_F(IoReactorTest, periodicTimerRejectsPeriodsBelow1ms)
+{
+    EXPECT_THROW(m_reactor.addPeriodicTimer(milliseconds(0), [](){}), std::runtime_error);
+}
+
+TEST_F(IoReactorTest, oneShotTimerFiresOnce)
+{
+    std::atomic<int> numExpiries (0);
+    IoReactor::RegistrationPtr timer (m_reactor.addOneShotTimer(milliseconds(10), [&numExpiries](){ numExpiries++; }));
+    std::this_thread::sleep_for(milliseconds(100));
+    EXPECT_EQ(1, numExpiries.load());
+}
+
+TEST_F(IoReactorTest, destroyingTheRegistrationCancelsIt)
+{
+    std::atomic<int> numExpiries (0);
+    m_reactor.addOneShotTimer(milliseconds(50), [&numExpiries](){ numExpiries++; }); // the registration is dropped at once
+    std::this_thread::sleep_for(milliseconds(100));
+    EXPECT_EQ(0, numExpiries.load());
+}
+
+TEST_F(IoReactorTest, callbackCanCancelItsOwnRegistration)
+{
+    std::atomic<int> numExpiries (0);
+    std::atomic<IoReactor::Registration*> self (nullptr);
+    IoReactor::RegistrationPtr timer (m_reactor.addPeriodicTimer(milliseconds(5), [&]()
+    {
+        if (++numExpiries == 3)
+            self.load()->cancel();
+    }));
+    self = timer.get();
+    std::this_thread::sleep_for(milliseconds(100));
+    EXPECT_EQ(3, numExpiries.load());
+}
+
+TEST_F(IoReactorTest, cancelWaitsForTheRunningCallback)
+{
+    std::promise<void> started;
+    std::atomic<bool> finished (false);
+    IoReactor::RegistrationPtr timer (m_reactor.addOneShotTimer(milliseconds(1), [&]()
+    {
+        started.set_value();
+        std::this_thread::sleep_for(milliseconds(100));
+        finished = true;
+    }));
+    started.get_future().wait();
+    timer->cancel();
+    EXPECT_TRUE(finished.load());
+}
+
+TEST_F(IoReactorTest, throwingCallbackDoesNotStopTheReactor)
+{
+    std::atomic<int> numExpiries (0);
+    IoReactor::RegistrationPtr throwing (m_reactor.addPeriodicTimer(milliseconds(5), [](){ throw std::runtime_error("device gone"); }));
+    IoReactor::RegistrationPtr counting (m_reactor.addPeriodicTimer(milliseconds(5), [&numExpiries](){ numExpiries++; }));
+    std::this_thread::sleep_for(milliseconds(100));
+    EXPECT_GT(numExpiries.load(), 5);
+}
+
+#ifndef _WIN32
+TEST_F(IoReactorTest, watchFdCallsBackOnEveryReadiness)
+{
+    int pipeFds[2];
+    ASSERT_EQ(0, pipe(pipeFds));
+    std::atomic<int> numRead (0);
+    IoReactor::RegistrationPtr watch (m_reactor.watchFd(pipeFds[0], IoReactor::Readiness::Read, [&]()
+    {
+        char c;
+        if (read(pipeFds[0], &c, 1) == 1)
+            numRead++;
+    }));
+    for (int i = 0; i < 5; ++i)
+    {
+        ASSERT_EQ(1, write(pipeFds[1], "x", 1));
+        std::this_thread::sleep_for(milliseconds(10));
+    }
+    std::this_thread::sleep_for(milliseconds(50));
+    watch->cancel();
+    EXPECT_EQ(5, numRead.load());
+    // the fd still belongs to the caller
+    EXPECT_EQ(0, close(pipeFds[0]));
+    EXPECT_EQ(0, close(pipeFds[1]));
+}
+
+TEST_F(IoReactorTest, watchSignalCallsBackOutsideTheSignalHandler)
+{
+    std::promise<std::thread::id> caughtBy;
+    IoReactor::RegistrationPtr watch (m_reactor.watchSignal(SIGUSR1, [&caughtBy](){ caughtBy.set_value(std::this_thread::get_id()); }));
+    ASSERT_EQ(0, kill(getpid(), SIGUSR1));
+    std::future<std::thread::id> caught (caughtBy.get_future());
+    ASSERT_EQ(std::future_status::ready, caught.wait_for(std::chrono::seconds(2)));
+    EXPECT_NE(std::this_thread::get_id(), caught.get());
+}
+#endif // _WIN32
+
+TEST_F(IoReactorTest, startAndShutdown)
+{
+    EXPECT_EQ(nullptr, IoReactor::instance());
+    IoReactor::start(1);
+    ASSERT_NE(nullptr, IoReactor::instance());
+    EXPECT_EQ(1u, IoReactor::instance()->numThreads());
+    EXPECT_THROW(IoReactor::start(1), std::logic_error);
+
+    std::atomic<int> numExpiries (0);
+    IoReactor::RegistrationPtr timer (IoReactor::instance()->addPeriodicTimer(milliseconds(5), [&numExpiries](){ numExpiries++; }));
+    std::this_thread::sleep_for(milliseconds(50));
+    IoReactor::shutdown();
+    EXPECT_EQ(nullptr, IoReactor::instance());
+    int numAtShutdown = numExpiries.load();
+    EXPECT_GT(numAtShutdown, 0);
+    std::this_thread::sleep_for(milliseconds(20));
+    EXPECT_EQ(numAtShutdown, numExpiries.load());
+    timer.reset(); // cancelled after shutdown(), as done by the device objects
+    EXPECT_THROW(IoReactor::start(1), std::logic_error);
+}
@@ -0,0 +1,153 @@
+/* © Copyright CERN, 2026.  All rights not expressly granted are reserved.
+ * test_quasar_polling_scheduler.cpp
+ *
+ *  Created on: 19 Oct 2026
+ *
+ *  This file is part of Quasar.
+ *
+ *  Quasar is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU Lesser General Public Licence as published by
+ *  the Free Software Foundation, either version 3 of the Licence.
+ *
+ *  Quasar is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU Lesser General Public Licence for more details.
+ *
+ *  You should have received a copy of the GNU Lesser General Public License
+ *  along with Quasar.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <atomic>
+#include <chrono>
+#include <stdexcept>
+#include <thread>
+#include <vector>
+
+#include <gtest/gtest.h>
+
+#include <LogIt.h>
+#include <QuasarPollingScheduler.h>
+
+using Quasar::PollingScheduler;
+using std::chrono::milliseconds;
+
+/* The timing checks leave a generous margin, the tests also run on loaded CI machines. */
+class PollingSchedulerTest: public ::testing::Test
+{
+protected:
+    static void SetUpTestCase ()
+    {
+        Log::initializeLogging(Log::WRN);
+        Log::registerLoggingComponent("ThreadPool", Log::WRN); // done by the server otherwise
+    }
+};
+
+static void storeMax (std::atomic<int>& maximum, int value)
+{
+    int current = maximum.load();
+    while (value > current && !maximum.compare_exchange_weak(current, value))
+        ;
+}
+
+TEST_F(PollingSchedulerTest, startsNothingWithoutHooks)
+{
+    PollingScheduler scheduler (2);
+    scheduler.start();
+    EXPECT_EQ(0u, scheduler.numHooks());
+    EXPECT_TRUE(scheduler.statistics().empty());
+}
+
+TEST_F(PollingSchedulerTest, rejectsPeriodsBelow1ms)
+{
+    PollingScheduler scheduler (1);
+    EXPECT_THROW(scheduler.addHook(milliseconds(0), [](){}, "zero"), std::runtime_error);
+}
+
+TEST_F(PollingSchedulerTest, rejectsHooksAfterStart)
+{
+    PollingScheduler scheduler (1);
+    scheduler.addHook(milliseconds(10), [](){}, "first");
+    scheduler.start();
+    EXPECT_THROW(scheduler.addHook(milliseconds(10), [](){}, "second"), std::logic_error);
+}
+
+TEST_F(PollingSchedulerTest, callsHooksAtTheirPeriods)
+{
+    std::atomic<int> fast (0), slow (0);
+    {
+        PollingScheduler scheduler (2);
+        scheduler.addHook(milliseconds(20), [&fast](){ fast++; }, "fast");
+        scheduler.addHook(milliseconds(60), [&slow](){ slow++; }, "slow");
+        scheduler.start();
+        std::this_thread::sleep_for(milliseconds(610));
+    }
+    // 30 and 10 calls when on time; the deadlines are absolute, so a late tick doesn't add up
+    EXPECT_GE(fast.load(), 20);
+    EXPECT_LE(fast.load(), 31);
+    EXPECT_GE(slow.load(), 7);
+    EXPECT_LE(slow.load(), 11);
+}
+
+TEST_F(PollingSchedulerTest, hooksLongerThanTheWheelGoRound)
+{
+    // with a tick of 1 ms, the period of 300 ticks is more than one turn of the wheel
+    std::atomic<int> slow (0);
+    std::atomic<long long> firstCallAfterMs (-1);
+    {
+        PollingScheduler scheduler (2);
+        const std::chrono::steady_clock::time_point startTime = std::chrono::steady_clock::now();
+        scheduler.addHook(milliseconds(1), [](){}, "tick");
+        scheduler.addHook(milliseconds(300), [&]()
+        {
+            if (slow++ == 0)
+                firstCallAfterMs = std::chrono::duration_cast<milliseconds>(std::chrono::steady_clock::now() - startTime).count();
+        }, "slow");
+        scheduler.start();
+        std::this_thread::sleep_for(milliseconds(700));
+    }
+    // not called at the first turn of the wheel; the count depends on how late the ticks are on a loaded machine
+    EXPECT_GE(firstCallAfterMs.load(), 290);
+    EXPECT_GE(slow.load(), 1);
+    EXPECT_LE(slow.load(), 3);
+}
+
+TEST_F(PollingSchedulerTest, skipsPeriodsOfHooksStillRunning)
+{
+    std::atomic<int> running (0), maxRunning (0);
+    std::vector<PollingScheduler::Statistics> statistics;
+    {
+        PollingScheduler scheduler (4);
+        scheduler.addHook(milliseconds(10), [&]()
+        {
+            storeMax(maxRunning, ++running);
+            std::this_thread::sleep_for(milliseconds(35));
+            running--;
+        }, "slow hook");
+        scheduler.start();
+        std::this_thread::sleep_for(milliseconds(300));
+        statistics = scheduler.statistics();
+    }
+    EXPECT_EQ(1, maxRunning.load()); // never called concurrently with itself, even with free threads
+    ASSERT_EQ(1u, statistics.size());
+    EXPECT_EQ("slow hook", statistics[0].description);
+    EXPECT_GT(statistics[0].numOverruns, 0u);
+    EXPECT_GT(statistics[0].numCalls, 0u);
+    EXPECT_GE(statistics[0].maxDuration.count(), 35000);
+}
+
+TEST_F(PollingSchedulerTest, keepsCallingHooksWhichThrow)
+{
+    std::atomic<int> numCalls (0);
+    {
+        PollingScheduler scheduler (1);
+        scheduler.addHook(milliseconds(10), [&numCalls]()
+        {
+            numCalls++;
+            throw std::runtime_error("device not responding");
+        }, "throwing hook");
+        scheduler.start();
+        std::this_thread::sleep_for(milliseconds(200));
+    }
+    EXPECT_GT(numCalls.load(), 1);
+}
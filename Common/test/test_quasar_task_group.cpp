@@ -0,0 +1,110 @@
+/* © Copyright CERN, 2026.  All rights not expressly granted are reserved.
+ * test_quasar_task_group.cpp
+ *
+ *  Created on: 19 Oct 2026
+ *
+ *  This file is part of Quasar.
+ *
+ *  Quasar is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU Lesser General Public Licence as published by
+ *  the Free Software Foundation, either version 3 of the Licence.
+ *
+ *  Quasar is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU Lesser General Public Licence for more details.
+ *
+ *  You should have received a copy of the GNU Lesser General Public License
+ *  along with Quasar.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <atomic>
+#include <chrono>
+#include <functional>
+#include <mutex>
+#include <set>
+#include <stdexcept>
+#include <thread>
+
+#include <gtest/gtest.h>
+
+#include <QuasarTaskGroup.h>
+
+using Quasar::TaskGroup;
+
+TEST(TaskGroupTest, needsAtLeastOneThread)
+{
+    EXPECT_THROW(TaskGroup(0), std::runtime_error);
+}
+
+TEST(TaskGroupTest, runsAllTasks)
+{
+    TaskGroup tasks (4);
+    std::atomic<int> numDone (0);
+    for (int i = 0; i < 1000; ++i)
+        tasks.run([&numDone](){ numDone++; });
+    tasks.wait();
+    EXPECT_EQ(1000, numDone.load());
+}
+
+TEST(TaskGroupTest, waitsForTasksAddedByTasks)
+{
+    TaskGroup tasks (3);
+    std::atomic<int> numDone (0);
+    // a binary tree of depth 8, every task adds its children
+    std::function<void(int)> node = [&](int depth)
+    {
+        if (depth > 0)
+        {
+            tasks.run([&node, depth](){ node(depth - 1); });
+            tasks.run([&node, depth](){ node(depth - 1); });
+        }
+        numDone++;
+    };
+    tasks.run([&node](){ node(8); });
+    tasks.wait();
+    EXPECT_EQ(511, numDone.load());
+}
+
+TEST(TaskGroupTest, runsTasksInParallel)
+{
+    TaskGroup tasks (4);
+    std::mutex lock;
+    std::set<std::thread::id> threads;
+    for (int i = 0; i < 8; ++i)
+        tasks.run([&]()
+        {
+            std::this_thread::sleep_for(std::chrono::milliseconds(20));
+            std::lock_guard<std::mutex> guard (lock);
+            threads.insert(std::this_thread::get_id());
+        });
+    tasks.wait();
+    EXPECT_GT(threads.size(), 1u);
+    EXPECT_LE(threads.size(), 4u);
+}
+
+TEST(TaskGroupTest, waitRethrowsTheFirstException)
+{
+    TaskGroup tasks (2);
+    tasks.run([](){ throw std::runtime_error("configuration error"); });
+    try
+    {
+        tasks.wait();
+        FAIL() << "wait() should have thrown";
+    }
+    catch (const std::runtime_error& e)
+    {
+        EXPECT_STREQ("configuration error", e.what());
+    }
+}
+
+TEST(TaskGroupTest, doesNotStartTasksAfterFailure)
+{
+    TaskGroup tasks (1);
+    tasks.run([](){ throw std::runtime_error("configuration error"); });
+    EXPECT_THROW(tasks.wait(), std::runtime_error);
+    std::atomic<bool> started (false);
+    tasks.run([&started](){ started = true; });
+    EXPECT_THROW(tasks.wait(), std::runtime_error);
+    EXPECT_FALSE(started.load());
+}
@@ -0,0 +1,103 @@
+/* © Copyright CERN, 2026.  All rights not expressly granted are reserved.
+ * test_quasar_timestamp_provider.cpp
+ *
+ *  Created on: 19 Oct 2026
+ *
+ *  This file is part of Quasar.
+ *
+ *  Quasar is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU Lesser General Public Licence as published by
+ *  the Free Software Foundation, either version 3 of the Licence.
+ *
+ *  Quasar is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU Lesser General Public Licence for more details.
+ *
+ *  You should have received a copy of the GNU Lesser General Public License
+ *  along with Quasar.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <chrono>
+#include <set>
+#include <stdexcept>
+#include <string>
+#include <thread>
+
+#include <gtest/gtest.h>
+
+#include <LogIt.h>
+#include <QuasarTimestampProvider.h>
+
+using Quasar::TimestampProvider;
+using std::chrono::milliseconds;
+
+class TimestampProviderTest: public ::testing::Test
+{
+protected:
+    static void SetUpTestCase ()
+    {
+        Log::initializeLogging(Log::WRN);
+    }
+
+    virtual void TearDown () override
+    {
+        TimestampProvider::shutdown();
+    }
+
+    //! Timestamps are compared in their printed form, which has the same meaning with every backend
+    static std::string now ()
+    {
+        return TimestampProvider::now().toString().toUtf8();
+    }
+};
+
+TEST_F(TimestampProviderTest, isPreciseByDefault)
+{
+    EXPECT_EQ(TimestampProvider::Mode::Precise, TimestampProvider::mode());
+}
+
+TEST_F(TimestampProviderTest, coarseModeRejectsResolutionBelow1ms)
+{
+    EXPECT_THROW(TimestampProvider::configure(TimestampProvider::Mode::Coarse, milliseconds(0)), std::runtime_error);
+    EXPECT_EQ(TimestampProvider::Mode::Precise, TimestampProvider::mode());
+}
+
+TEST_F(TimestampProviderTest, coarseModeReturnsTheCachedTimestamp)
+{
+    TimestampProvider::configure(TimestampProvider::Mode::Coarse, milliseconds(200));
+    EXPECT_EQ(TimestampProvider::Mode::Coarse, TimestampProvider::mode());
+    std::set<std::string> timestamps;
+    for (int i = 0; i < 1000; ++i)
+        timestamps.insert(now());
+    EXPECT_LE(timestamps.size(), 2u); // the refresher may have ticked once meanwhile
+}
+
+TEST_F(TimestampProviderTest, coarseModeRefreshesTheTimestamp)
+{
+    TimestampProvider::configure(TimestampProvider::Mode::Coarse, milliseconds(10));
+    std::string first = now();
+    std::this_thread::sleep_for(milliseconds(100));
+    EXPECT_NE(first, now());
+}
+
+TEST_F(TimestampProviderTest, canBeReconfigured)
+{
+    TimestampProvider::configure(TimestampProvider::Mode::Coarse, milliseconds(1000));
+    std::string first = now();
+    TimestampProvider::configure(TimestampProvider::Mode::Coarse, milliseconds(10));
+    std::this_thread::sleep_for(milliseconds(100));
+    EXPECT_NE(first, now()); // the new resolution applies without waiting for the old period
+
+    TimestampProvider::configure(TimestampProvider::Mode::Precise, milliseconds(0));
+    EXPECT_EQ(TimestampProvider::Mode::Precise, TimestampProvider::mode());
+}
+
+TEST_F(TimestampProviderTest, shutdownGoesBackToPreciseMode)
+{
+    TimestampProvider::configure(TimestampProvider::Mode::Coarse, milliseconds(10));
+    TimestampProvider::shutdown();
+    EXPECT_EQ(TimestampProvider::Mode::Precise, TimestampProvider::mode());
+    TimestampProvider::configure(TimestampProvider::Mode::Coarse, milliseconds(10)); // and can be started again
+    EXPECT_EQ(TimestampProvider::Mode::Coarse, TimestampProvider::mode());
+}
@@ -25,7 +25,7 @@
 #define CONFIGURATOR_H_
 
 #include <string>
-#include <set>
+#include <vector>
 #include <numeric>
 #include <functional>
 
@@ -37,7 +37,9 @@ namespace Configuration{ class Configuration; }
 typedef std::function<bool (Configuration::Configuration&)> ConfigXmlDecoratorFunction;
 bool configure (std::string fileName,
         AddressSpace::ASNodeManager *nm, ConfigXmlDecoratorFunction
-        configXmlDecoratorFunction = ConfigXmlDecoratorFunction()); // 'empty' function by default.
+        configXmlDecoratorFunction = ConfigXmlDecoratorFunction(), // 'empty' function by default.
+        unsigned int numThreads = 0, // more than 1 enables the parallel configuration mode
+        const std::string& snapshotPath = ""); // if not empty, the parsed configuration is cached there
 
 /*
 * Implementation where children is an optional (0/1)
@@ -73,28 +75,28 @@ template<typename TParent, typename TChildren, typename TChildTypeId>
 auto validateContentOrderImpl(const TParent& parent, const TChildren& children, const TChildTypeId childTypeId)
   -> decltype(children.size(), void()) // children type needs method size()
 {
-  std::set<size_t> validChildIndices;
-  for(size_t i=0; i<children.size(); validChildIndices.insert(i++));
-
+  // one pass over content_order: each child has to be referenced exactly once
+  std::vector<bool> isChildRegistered (children.size(), false);
+  size_t numRegisteredChildren = 0;
   for(const auto& orderedIter : parent.content_order())
   {
     const auto xmlIndex = orderedIter.index;
     if(orderedIter.id == childTypeId)
     {
-      auto pos = std::find(std::begin(validChildIndices), std::end(validChildIndices), xmlIndex);
-      if(pos == std::end(validChildIndices))
+      if(xmlIndex >= children.size() || isChildRegistered[xmlIndex])
       {
         std::ostringstream msg;
         msg<<__FUNCTION__<<" ERROR content child type id ["<<childTypeId<<"] order index ["<<xmlIndex<<"] invalid. Valid={0.."<<children.size()<<"}";
         throw std::range_error(msg.str());
       }
-      validChildIndices.erase(pos);
+      isChildRegistered[xmlIndex] = true;
+      numRegisteredChildren++;
     }
   }
-  if(!validChildIndices.empty())
+  if(numRegisteredChildren != children.size())
   {
     std::ostringstream msg;
-    msg<<__FUNCTION__<<" ERROR parent has ["<<validChildIndices.size()<<"] child objects unregistered in content order";
+    msg<<__FUNCTION__<<" ERROR parent has ["<<children.size() - numRegisteredChildren<<"] child objects unregistered in content order";
     throw std::range_error(msg.str());
   }
 }
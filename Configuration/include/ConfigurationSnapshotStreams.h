@@ -0,0 +1,237 @@
+/* © Copyright CERN, 2026.  All rights not expressly granted are reserved.
+ * ConfigurationSnapshotStreams.h
+ *
+ *  Created on: 19 Oct 2026
+ *
+ *  This file is part of Quasar.
+ *
+ *  Quasar is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU Lesser General Public Licence as published by
+ *  the Free Software Foundation, either version 3 of the Licence.
+ *
+ *  Quasar is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU Lesser General Public Licence for more details.
+ *
+ *  You should have received a copy of the GNU Lesser General Public License
+ *  along with Quasar.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+/* Binary streams for the xsdcxx insertion/extraction of the configuration object tree
+ * (see --generate-insertion/--generate-extraction in Configuration/CMakeLists.txt).
+ * This header is the prologue of the generated Configuration.hxx.
+ * The representation is the native one (byte order, sizes): a snapshot is meant to be read back
+ * by the same server build on the same machine, not to be exchanged.
+ */
+
+#ifndef CONFIGURATION_SNAPSHOT_STREAMS_H_
+#define CONFIGURATION_SNAPSHOT_STREAMS_H_
+
+#include <cstdint>
+#include <istream>
+#include <ostream>
+#include <stdexcept>
+#include <string>
+
+#include <xsd/cxx/tree/buffer.hxx>
+#include <xsd/cxx/tree/ostream.hxx>
+#include <xsd/cxx/tree/istream.hxx>
+
+namespace Configuration
+{
+
+class SnapshotOutputStream
+{
+public:
+  explicit SnapshotOutputStream (std::ostream& stream): m_stream(stream) {}
+
+  template<typename T>
+  void write (T value) { writeBytes(&value, sizeof value); }
+
+  void writeBytes (const void* data, size_t size)
+  {
+    if (!m_stream.write(static_cast<const char*>(data), size))
+      throw std::runtime_error("Configuration snapshot: write failed");
+  }
+
+private:
+  std::ostream& m_stream;
+};
+
+class SnapshotInputStream
+{
+public:
+  explicit SnapshotInputStream (std::istream& stream): m_stream(stream) {}
+
+  template<typename T>
+  T read () { T value; readBytes(&value, sizeof value); return value; }
+
+  void readBytes (void* data, size_t size)
+  {
+    if (!m_stream.read(static_cast<char*>(data), size))
+      throw std::runtime_error("Configuration snapshot: truncated");
+  }
+
+  //! Strings and buffers are length-prefixed; a corrupted length must not make us allocate the world
+  uint64_t readSize ()
+  {
+    uint64_t size = read<uint64_t>();
+    if (size > s_maxSize)
+      throw std::runtime_error("Configuration snapshot: corrupted (implausible size)");
+    return size;
+  }
+
+private:
+  static const uint64_t s_maxSize = uint64_t(1) << 32;
+  std::istream& m_stream;
+};
+
+} /* namespace Configuration */
+
+namespace xsd
+{
+namespace cxx
+{
+namespace tree
+{
+
+// insertion
+
+template<typename T>
+inline ostream<Configuration::SnapshotOutputStream>& operator<< (ostream<Configuration::SnapshotOutputStream>& s, ostream_common::as_size<T> x)
+{ s.impl().write(static_cast<uint64_t>(x.x_)); return s; }
+
+template<typename T>
+inline ostream<Configuration::SnapshotOutputStream>& operator<< (ostream<Configuration::SnapshotOutputStream>& s, ostream_common::as_int8<T> x)
+{ s.impl().write(static_cast<int8_t>(x.x_)); return s; }
+
+template<typename T>
+inline ostream<Configuration::SnapshotOutputStream>& operator<< (ostream<Configuration::SnapshotOutputStream>& s, ostream_common::as_uint8<T> x)
+{ s.impl().write(static_cast<uint8_t>(x.x_)); return s; }
+
+template<typename T>
+inline ostream<Configuration::SnapshotOutputStream>& operator<< (ostream<Configuration::SnapshotOutputStream>& s, ostream_common::as_int16<T> x)
+{ s.impl().write(static_cast<int16_t>(x.x_)); return s; }
+
+template<typename T>
+inline ostream<Configuration::SnapshotOutputStream>& operator<< (ostream<Configuration::SnapshotOutputStream>& s, ostream_common::as_uint16<T> x)
+{ s.impl().write(static_cast<uint16_t>(x.x_)); return s; }
+
+template<typename T>
+inline ostream<Configuration::SnapshotOutputStream>& operator<< (ostream<Configuration::SnapshotOutputStream>& s, ostream_common::as_int32<T> x)
+{ s.impl().write(static_cast<int32_t>(x.x_)); return s; }
+
+template<typename T>
+inline ostream<Configuration::SnapshotOutputStream>& operator<< (ostream<Configuration::SnapshotOutputStream>& s, ostream_common::as_uint32<T> x)
+{ s.impl().write(static_cast<uint32_t>(x.x_)); return s; }
+
+template<typename T>
+inline ostream<Configuration::SnapshotOutputStream>& operator<< (ostream<Configuration::SnapshotOutputStream>& s, ostream_common::as_int64<T> x)
+{ s.impl().write(static_cast<int64_t>(x.x_)); return s; }
+
+template<typename T>
+inline ostream<Configuration::SnapshotOutputStream>& operator<< (ostream<Configuration::SnapshotOutputStream>& s, ostream_common::as_uint64<T> x)
+{ s.impl().write(static_cast<uint64_t>(x.x_)); return s; }
+
+template<typename T>
+inline ostream<Configuration::SnapshotOutputStream>& operator<< (ostream<Configuration::SnapshotOutputStream>& s, ostream_common::as_bool<T> x)
+{ s.impl().write(static_cast<uint8_t>(x.x_ ? 1 : 0)); return s; }
+
+template<typename T>
+inline ostream<Configuration::SnapshotOutputStream>& operator<< (ostream<Configuration::SnapshotOutputStream>& s, ostream_common::as_float32<T> x)
+{ s.impl().write(static_cast<float>(x.x_)); return s; }
+
+template<typename T>
+inline ostream<Configuration::SnapshotOutputStream>& operator<< (ostream<Configuration::SnapshotOutputStream>& s, ostream_common::as_float64<T> x)
+{ s.impl().write(static_cast<double>(x.x_)); return s; }
+
+template<typename C>
+inline ostream<Configuration::SnapshotOutputStream>& operator<< (ostream<Configuration::SnapshotOutputStream>& s, const std::basic_string<C>& x)
+{
+  s.impl().write(static_cast<uint64_t>(x.size()));
+  s.impl().writeBytes(x.data(), x.size() * sizeof(C));
+  return s;
+}
+
+template<typename C>
+inline ostream<Configuration::SnapshotOutputStream>& operator<< (ostream<Configuration::SnapshotOutputStream>& s, const buffer<C>& x)
+{
+  s.impl().write(static_cast<uint64_t>(x.size()));
+  s.impl().writeBytes(x.data(), x.size());
+  return s;
+}
+
+// extraction
+
+template<typename T>
+inline istream<Configuration::SnapshotInputStream>& operator>> (istream<Configuration::SnapshotInputStream>& s, istream_common::as_size<T>& x)
+{ x.x_ = static_cast<T>(s.impl().readSize()); return s; }
+
+template<typename T>
+inline istream<Configuration::SnapshotInputStream>& operator>> (istream<Configuration::SnapshotInputStream>& s, istream_common::as_int8<T>& x)
+{ x.x_ = static_cast<T>(s.impl().read<int8_t>()); return s; }
+
+template<typename T>
+inline istream<Configuration::SnapshotInputStream>& operator>> (istream<Configuration::SnapshotInputStream>& s, istream_common::as_uint8<T>& x)
+{ x.x_ = static_cast<T>(s.impl().read<uint8_t>()); return s; }
+
+template<typename T>
+inline istream<Configuration::SnapshotInputStream>& operator>> (istream<Configuration::SnapshotInputStream>& s, istream_common::as_int16<T>& x)
+{ x.x_ = static_cast<T>(s.impl().read<int16_t>()); return s; }
+
+template<typename T>
+inline istream<Configuration::SnapshotInputStream>& operator>> (istream<Configuration::SnapshotInputStream>& s, istream_common::as_uint16<T>& x)
+{ x.x_ = static_cast<T>(s.impl().read<uint16_t>()); return s; }
+
+template<typename T>
+inline istream<Configuration::SnapshotInputStream>& operator>> (istream<Configuration::SnapshotInputStream>& s, istream_common::as_int32<T>& x)
+{ x.x_ = static_cast<T>(s.impl().read<int32_t>()); return s; }
+
+template<typename T>
+inline istream<Configuration::SnapshotInputStream>& operator>> (istream<Configuration::SnapshotInputStream>& s, istream_common::as_uint32<T>& x)
+{ x.x_ = static_cast<T>(s.impl().read<uint32_t>()); return s; }
+
+template<typename T>
+inline istream<Configuration::SnapshotInputStream>& operator>> (istream<Configuration::SnapshotInputStream>& s, istream_common::as_int64<T>& x)
+{ x.x_ = static_cast<T>(s.impl().read<int64_t>()); return s; }
+
+template<typename T>
+inline istream<Configuration::SnapshotInputStream>& operator>> (istream<Configuration::SnapshotInputStream>& s, istream_common::as_uint64<T>& x)
+{ x.x_ = static_cast<T>(s.impl().read<uint64_t>()); return s; }
+
+template<typename T>
+inline istream<Configuration::SnapshotInputStream>& operator>> (istream<Configuration::SnapshotInputStream>& s, istream_common::as_bool<T>& x)
+{ x.x_ = s.impl().read<uint8_t>() != 0; return s; }
+
+template<typename T>
+inline istream<Configuration::SnapshotInputStream>& operator>> (istream<Configuration::SnapshotInputStream>& s, istream_common::as_float32<T>& x)
+{ x.x_ = static_cast<T>(s.impl().read<float>()); return s; }
+
+template<typename T>
+inline istream<Configuration::SnapshotInputStream>& operator>> (istream<Configuration::SnapshotInputStream>& s, istream_common::as_float64<T>& x)
+{ x.x_ = static_cast<T>(s.impl().read<double>()); return s; }
+
+template<typename C>
+inline istream<Configuration::SnapshotInputStream>& operator>> (istream<Configuration::SnapshotInputStream>& s, std::basic_string<C>& x)
+{
+  x.resize(s.impl().readSize());
+  if (!x.empty())
+    s.impl().readBytes(&x[0], x.size() * sizeof(C));
+  return s;
+}
+
+template<typename C>
+inline istream<Configuration::SnapshotInputStream>& operator>> (istream<Configuration::SnapshotInputStream>& s, buffer<C>& x)
+{
+  x.size(s.impl().readSize());
+  if (x.size() > 0)
+    s.impl().readBytes(x.data(), x.size());
+  return s;
+}
+
+} /* namespace tree */
+} /* namespace cxx */
+} /* namespace xsd */
+
+#endif /* CONFIGURATION_SNAPSHOT_STREAMS_H_ */
@@ -36,6 +36,7 @@ from lxml import etree, objectify
 from colorama import Fore, Style
 from lxml.objectify import ObjectifiedDataElement
 from copy import deepcopy
+import hashlib
 import logging
 
 DEBUG = False
@@ -66,6 +67,11 @@ class DesignInspector():
         matching the signature of ObjectifiedElement.xpath()"""
         return object.xpath(xpath_expression, namespaces=QUASAR_NAMESPACES)
 
+    def design_fingerprint(self):
+        """Returns a hash of the canonicalized design, e.g. to tell whether data
+        derived from the design (like configuration snapshots) is still valid"""
+        return hashlib.sha1(etree.tostring(self.tree, method='c14n')).hexdigest()
+
     def get_names_of_all_classes(self, only_with_device_logic=False):
         """Returns a list of names of all classes from the design.
         Unless only_with_device_logic is True, returns classes with and without
@@ -244,6 +250,32 @@ class DesignInspector():
         the_class = self.objectify_class(class_name)
         return the_class.get('singleVariableNode') == 'true'
 
+    def cache_variable_skips_unchanged(self, class_name, cache_variable):
+        """Returns True if setters of given cache variable (objectified) shall skip unchanged
+           values, either by its own skipUnchanged or by the one of its class"""
+        if cache_variable.get('skipUnchanged') is not None:
+            return cache_variable.get('skipUnchanged') in ['true', '1']
+        return self.objectify_class(class_name).get('skipUnchanged') in ['true', '1']
+
+    def config_entry_has_property(self, class_name, config_entry):
+        """Returns True if given config entry (objectified) shall be exposed as a property node,
+           either by its own addressSpaceProperty or by the one of its class (true by default)"""
+        if config_entry.get('addressSpaceProperty') is not None:
+            return config_entry.get('addressSpaceProperty') in ['true', '1']
+        return self.objectify_class(class_name).get('addressSpaceProperty') not in ['false', '0']
+
+    def get_poll_hooks(self, class_name):
+        """Returns a list of tuples(hook_name, period_ms) of polling hooks of given class: poll
+           for the pollPeriod of the class and poll<Name> for every cache variable with pollPeriod"""
+        hooks = []
+        the_class = self.objectify_class(class_name)
+        if the_class.get('pollPeriod') is not None:
+            hooks.append(('poll', int(the_class.get('pollPeriod'))))
+        for cache_variable in self.objectify_cache_variables(class_name, '[@pollPeriod]'):
+            name = cache_variable.get('name')
+            hooks.append(('poll' + name[0].upper() + name[1:], int(cache_variable.get('pollPeriod'))))
+        return hooks
+
     def get_restrictions(self, class_name, name, what):
         """Returns a list of tuples(type, value) where type is one of [enumeration, pattern,
            minExclusive, minInclusive, maxInclusive, maxExclusive] and value is plug'n'play value
@@ -40,6 +40,7 @@ validate_second_stage. Running validate will invoke both stages.
 '''
 
 import io
+import math
 from colorama import Fore, Style
 from lxml import etree
 from quasarExceptions import DesignFlaw
@@ -169,6 +170,8 @@ class DesignValidator():
                     raise DesignFlaw(("class is singleVariableNode but has {0} hasobjects, should"
                                       "have none. (at: {1})").format(
                                           str(len(has_objects_count)), stringify_locator(locator)))
+            if cls.get('pollPeriod') is not None and not self.design_inspector.class_has_device_logic(class_name):
+                raise DesignFlaw(f'pollPeriod can only be used with device logic (at class {class_name})')
             if self.design_inspector.get_class_default_instance_name(class_name) is not None:
                 if not self.design_inspector.is_class_always_singleton(class_name):
                     raise DesignFlaw(("defaultInstanceName can only be used with singleton "
@@ -203,6 +206,32 @@ class DesignValidator():
                                             'when array', locator)
                     assert_attribute_absent(cache_variable, 'defaultConfigInitializerValue',
                                             'when array', locator)
+                if cache_variable.get('nativeShadow') == 'true':
+                    if count_children(cache_variable, 'array') > 0 or not (
+                            cache_variable.get('dataType') in Oracle.NumericDataTypes or
+                            cache_variable.get('dataType') == 'OpcUa_Boolean'):
+                        raise DesignFlaw(('nativeShadow can only be used with scalar numeric or boolean '
+                                          'cache variables (at: {0})').format(stringify_locator(locator)))
+                    assert_attribute_equal(cache_variable, 'nullPolicy', 'nullForbidden',
+                                           'when nativeShadow is used', locator)
+                if cache_variable.get('deadbandType') in ['absolute', 'percent']:
+                    if (count_children(cache_variable, 'array') > 0 or
+                            cache_variable.get('dataType') not in Oracle.NumericDataTypes):
+                        raise DesignFlaw(('deadband can only be used with scalar numeric cache '
+                                          'variables (at: {0})').format(stringify_locator(locator)))
+                    assert_attribute_present(cache_variable, 'deadbandValue',
+                                             'when deadbandType is absolute or percent', locator)
+                    deadband_value = float(cache_variable.get('deadbandValue'))
+                    if deadband_value < 0 or math.isinf(deadband_value) or math.isnan(deadband_value):
+                        raise DesignFlaw('deadbandValue must be a finite, non-negative number (at: {0})'.format(
+                            stringify_locator(locator)))
+                else:
+                    assert_attribute_absent(cache_variable, 'deadbandValue',
+                                            'without deadbandType', locator)
+                if (cache_variable.get('pollPeriod') is not None and
+                        not self.design_inspector.class_has_device_logic(class_name)):
+                    raise DesignFlaw('pollPeriod can only be used with device logic (at: {0})'.format(
+                        stringify_locator(locator)))
                 if cache_variable.get('dataType') in ['UaVariant', 'UaByteString']:
                     assert_attribute_equal(cache_variable, 'initializeWith', 'valueAndStatus',
                                            'when data type is UaVariant', locator)
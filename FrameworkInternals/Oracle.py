@@ -194,7 +194,7 @@ class Oracle():
             """
         source_time_stamp = 'const UaDateTime& srcTime'
         if for_header:
-            source_time_stamp += '= UaDateTime::now()'
+            source_time_stamp += '= Quasar::TimestampProvider::now()'
         if quasar_data_type in Oracle.PassByValueDataTypes:
             return f'{quasar_data_type} value, OpcUa_StatusCode statusCode, {source_time_stamp}'
         elif quasar_data_type is None:  # formerly null
@@ -216,11 +216,31 @@ class Oracle():
         else:
             return f'set{cap_first(name)}({self.get_cache_variable_setter_args(quasar_data_type, for_header, new_style_null)})'
 
+    MoveAwareDataTypes = ['UaByteString', 'UaVariant'] # scalar types which get an additional setter taking an rvalue
+
+    def get_cache_variable_setter_move(self, name, quasar_data_type, for_header):
+        """Returns the move-aware setter of SCALAR cache variable, the value is taken over instead of copied."""
+        source_time_stamp = 'const UaDateTime& srcTime'
+        if for_header:
+            source_time_stamp += '= Quasar::TimestampProvider::now()'
+        return f'set{cap_first(name)}({quasar_data_type}&& value, OpcUa_StatusCode statusCode, {source_time_stamp})'
+
+    def get_cache_variable_bulk_setter(self, name, quasar_data_type, for_header):
+        """Returns the setter of SCALAR cache variable in AS<Class>::BulkUpdate.
+           The timestamp is not there, it is common for the whole update."""
+        status_code = 'OpcUa_StatusCode statusCode'
+        if for_header:
+            status_code += ' = OpcUa_Good'
+        if quasar_data_type in Oracle.PassByValueDataTypes:
+            return f'set{cap_first(name)}({quasar_data_type} value, {status_code})'
+        else:
+            return f'set{cap_first(name)}(const {quasar_data_type}& value, {status_code})'
+
     def get_cache_variable_setter_array(self, name, quasar_data_type, for_header, new_style_null=False):
         """ TODO: description """
         source_time_stamp = 'const UaDateTime& srcTime'
         if for_header:
-            source_time_stamp += '= UaDateTime::now()'
+            source_time_stamp += '= Quasar::TimestampProvider::now()'
         if quasar_data_type is None:
             if new_style_null:
                 return ('set{0}( QuasarNullDataType null, '
@@ -337,6 +357,25 @@ class Oracle():
         else:
             return 'ArrayTools::convertVectorToUaVariant'
 
+    def array_to_uavariant_function(self, quasar_data_type):
+        """Returns the name of function from ArrayTools which converts
+           pointer+length of numeric (or boolean) data"""
+        if quasar_data_type == 'OpcUa_Byte':
+            return 'ArrayTools::convertByteArrayToUaVariant'
+        elif quasar_data_type == 'OpcUa_Boolean':
+            return 'ArrayTools::convertBooleanArrayToUaVariant'
+        else:
+            return 'ArrayTools::convertArrayToUaVariant'
+
+    def get_cache_variable_setter_array_view(self, name, quasar_data_type, for_header):
+        """Returns the setter of array cache variable taking a non-owning
+           pointer+length (only for numeric and boolean types)"""
+        source_time_stamp = 'const UaDateTime& srcTime'
+        if for_header:
+            source_time_stamp += '= Quasar::TimestampProvider::now()'
+        return (f'set{cap_first(name)}(const {quasar_data_type}* data, size_t size, '
+                f'OpcUa_StatusCode statusCode, {source_time_stamp})')
+
     def wrap_literal(self, quasar_data_type, literal):
         """For string constants wraps in the double-quotes as C++ literals"""
         if quasar_data_type == 'UaString':
@@ -0,0 +1,70 @@
+
+/*  © Copyright CERN, 2015. All rights not expressly granted are reserved.
+
+    The stub of this file was generated by quasar (https://github.com/quasar-team/quasar/)
+
+    Quasar is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Lesser General Public Licence as published by
+    the Free Software Foundation, either version 3 of the Licence.
+    Quasar is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Lesser General Public Licence for more details.
+
+    You should have received a copy of the GNU Lesser General Public License
+    along with Quasar.  If not, see <http://www.gnu.org/licenses/>.
+
+
+ */
+
+
+#ifndef __DAsyncUpdateChannel__H__
+#define __DAsyncUpdateChannel__H__
+
+#include <Base_DAsyncUpdateChannel.h>
+
+namespace Device
+{
+
+class
+    DAsyncUpdateChannel
+    : public Base_DAsyncUpdateChannel
+{
+
+public:
+    /* sample constructor */
+    explicit DAsyncUpdateChannel (
+        const Configuration::AsyncUpdateChannel& config,
+        Parent_DAsyncUpdateChannel* parent
+    ) ;
+    /* sample dtr */
+    ~DAsyncUpdateChannel ();
+
+    /* delegators for
+    cachevariables and sourcevariables */
+
+    /* delegators for methods */
+
+private:
+    /* Delete copy constructor and assignment operator */
+    DAsyncUpdateChannel( const DAsyncUpdateChannel& other );
+    DAsyncUpdateChannel& operator=(const DAsyncUpdateChannel& other);
+
+    // ----------------------------------------------------------------------- *
+    // -     CUSTOM CODE STARTS BELOW THIS COMMENT.                            *
+    // -     Don't change this comment, otherwise merge tool may be troubled.  *
+    // ----------------------------------------------------------------------- *
+
+public:
+    //! Refreshes the statistics of the channel; Meta::registerPollingHooks() calls it periodically while the channel runs
+    static void poll (const std::vector<DAsyncUpdateChannel*>& objects);
+
+private:
+
+
+
+};
+
+}
+
+#endif // __DAsyncUpdateChannel__H__
\ No newline at end of file
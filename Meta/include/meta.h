@@ -29,25 +29,28 @@
 #include <LogIt.h>
 #include <ASNodeQueries.h>
 
+namespace Quasar { class PollingScheduler; }
+
 namespace Meta
 {
 	void initializeMeta(AddressSpace::ASNodeManager *nm);
 	void configureMeta(Configuration::Configuration & config);
+	// only for what runs in this server, so that the meta data alone don't start the polling threads
+	void registerPollingHooks(Quasar::PollingScheduler& scheduler);
 
 	template<typename AddressSpaceType>
 	AddressSpaceType* findStandardMetaDataChildObject(AddressSpace::ASNodeManager *nm, const std::string& childName)
 	{
 		const std::string fullChildName = "StandardMetaData."+childName;
-		std::vector<AddressSpaceType*> children;
-		AddressSpace::findAllObjectsByPatternInNodeManager(nm, fullChildName, children);
+		AddressSpaceType* child = AddressSpace::findByStringId<AddressSpaceType>(nm, fullChildName);
 
-		if(children.size() != 1)
+		if(!child)
 		{
-			LOG(Log::ERR) << __FUNCTION__ << " searched AS for objects matching ["<<fullChildName<<"] found ["<<children.size()<<"] expected exactly [1], this is a configuration error - exiting!";
+			LOG(Log::ERR) << __FUNCTION__ << " searched AS for object ["<<fullChildName<<"] of the expected type but found none, this is a configuration error - exiting!";
 			std::exit(1);
 		}
 
-		return children[0];
+		return child;
 	};
 } // namespace Meta
 
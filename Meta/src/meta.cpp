@@ -28,6 +28,9 @@
 #include <ASQuasar.h>
 #include <ASServer.h>
 #include <ASSourceVariableThreadPool.h>
+#include <DAsyncUpdateChannel.h>
+#include <AsyncUpdateChannel.h>
+#include <QuasarPollingScheduler.h>
 #include "MetaBuildInfo.h"
 #include "QuasarVersion.h"
 #include "metaBackwardsCompatibilityUtils.h"
@@ -71,6 +74,19 @@ void Meta::initializeMeta(AddressSpace::ASNodeManager *nm)
     initializeServer(nm);
 }
 
+void Meta::registerPollingHooks(Quasar::PollingScheduler& scheduler)
+{
+    if (AddressSpace::AsyncUpdateChannel::instance())
+    {
+        scheduler.addHook(
+            std::chrono::milliseconds(1000),
+            [](){ Device::DAsyncUpdateChannel::poll(Device::DAsyncUpdateChannel::allObjects()); },
+            "DAsyncUpdateChannel::poll");
+    }
+    else
+        Device::DAsyncUpdateChannel::poll(Device::DAsyncUpdateChannel::allObjects()); // once, to tell it's not running
+}
+
 Configuration::StandardMetaData& getStandardMetaData(Configuration::Configuration & parent)
 {
     if(!parent.StandardMetaData().present())
@@ -110,6 +126,30 @@ Configuration::SourceVariableThreadPool& getSourceVariableThreadPool(Configurati
     return parent.SourceVariableThreadPool().front();
 }
 
+Configuration::IoReactor& getIoReactor(Configuration::StandardMetaData& parent)
+{
+    if(parent.IoReactor().empty())
+    {
+        LOG(Log::INF) << __FUNCTION__ << " parent does not contain an IoReactor element; adding one";
+        Configuration::IoReactor ioReactor;
+        ioReactor.name("IoReactor");
+        Configuration::DecorationUtils::push_back(parent, parent.IoReactor(), ioReactor, Configuration::StandardMetaData::IoReactor_id);
+    }
+    return parent.IoReactor().front();
+}
+
+Configuration::AsyncUpdateChannel& getAsyncUpdateChannel(Configuration::StandardMetaData& parent)
+{
+    if(parent.AsyncUpdateChannel().empty())
+    {
+        LOG(Log::INF) << __FUNCTION__ << " parent does not contain an AsyncUpdateChannel element; adding one";
+        Configuration::AsyncUpdateChannel asyncUpdateChannel;
+        asyncUpdateChannel.name("AsyncUpdateChannel");
+        Configuration::DecorationUtils::push_back(parent, parent.AsyncUpdateChannel(), asyncUpdateChannel, Configuration::StandardMetaData::AsyncUpdateChannel_id);
+    }
+    return parent.AsyncUpdateChannel().front();
+}
+
 Configuration::LogLevel& getGeneralLogLevel(Configuration::Log& parent)
 {
     if(parent.LogLevel().empty())
@@ -260,11 +300,23 @@ void configureSourceVariableThreadPool(Configuration::StandardMetaData& parent)
     getSourceVariableThreadPool(parent);
 }
 
+void configureIoReactor(Configuration::StandardMetaData& parent)
+{
+    getIoReactor(parent);
+}
+
+void configureAsyncUpdateChannel(Configuration::StandardMetaData& parent)
+{
+    getAsyncUpdateChannel(parent);
+}
+
 void configureStandardMetaData(Configuration::Configuration & parent)
 {
     auto& standardMetaData = getStandardMetaData(parent);
     configureLog(standardMetaData);
     configureSourceVariableThreadPool(standardMetaData);
+    configureIoReactor(standardMetaData);
+    configureAsyncUpdateChannel(standardMetaData);
 }
 
 void Meta::configureMeta(Configuration::Configuration & config)
@@ -23,6 +23,7 @@
 #ifndef __BaseQuasarServer__H__
 #define __BaseQuasarServer__H__
 #include <string>
+#include <memory>
 
 #ifdef BACKEND_UATOOLKIT
 	#include <uabase.h>
@@ -35,8 +36,11 @@
 #include <uastring.h>
 #include <ASNodeManager.h>
 #include <DRoot.h>
+#include <QuasarIoReactor.h>
 #include <boost/program_options.hpp>
 
+namespace Quasar { class PollingScheduler; }
+
 /*
  * Class representing the internal logic for starting a Server up.
  * This class should not be modified by the final user. The class contain several virtual methods which represent the parts that will change depending on the implementation.
@@ -111,7 +115,31 @@ private:
     void shutdownEnvironment();
     //Handler for initializing the node manager configuration only when the server is ready
     UaStatus configurationInitializerHandler(const std::string& configFileName, AddressSpace::ASNodeManager *nm);
+    //Starts calling the polling hooks of device logic, if the Design has any
+    void startPolling();
+    //Makes SIGUSR1 dump the Calculated Variables dependency graph of the running server
+    void watchDependencyGraphDumpSignal();
 
     std::list<std::string> m_commandLineArgs;
+
+    //If not empty, Calculated Variables dependency graph is dumped there after the configuration
+    std::string m_calculatedVariablesGraphPath;
+    //Dumps the Calculated Variables dependency graph on SIGUSR1 (not on Windows)
+    Quasar::IoReactor::RegistrationPtr m_dependencyGraphDumpSignal;
+
+    //Timestamps put on variable updates: "precise" (system clock for every update) or "coarse" (cached clock)
+    std::string m_timestampsMode;
+    //Refresh period of the cached clock in the coarse mode
+    unsigned int m_timestampsResolutionMs;
+    //Capacity of the AsyncUpdateChannel, 0 when not used
+    unsigned int m_asyncUpdateQueueSize;
+    //Number of worker threads running the polling hooks (see pollPeriod in the Design)
+    unsigned int m_pollingThreads;
+    //Number of threads configuring the server from the config file, more than 1 enables the parallel configuration mode
+    unsigned int m_configurationThreads;
+    //If not empty, the parsed configuration is saved there and loaded from there at the next start (see configure())
+    std::string m_configurationSnapshotPath;
+    //Exists only when the Design declares some pollPeriod
+    std::unique_ptr<Quasar::PollingScheduler> m_pollingScheduler;
 };
 #endif // include guard
@@ -62,6 +62,10 @@
 
 #include <MetaBuildInfo.h>
 #include <CalculatedVariablesEngine.h>
+#include <QuasarTimestampProvider.h>
+#include <AsyncUpdateChannel.h>
+#include <QuasarPollingScheduler.h>
+#include <QuasarIoReactor.h>
 #include <Utils.h>
 
 #include <OpcuaToolkitInfo.hpp>
@@ -71,7 +75,12 @@ using namespace boost::program_options;
 
 BaseQuasarServer::BaseQuasarServer() :
         m_pServer(0),
-        m_nodeManager(0)
+        m_nodeManager(0),
+        m_timestampsMode("precise"),
+        m_timestampsResolutionMs(1),
+        m_asyncUpdateQueueSize(0),
+        m_pollingThreads(2),
+        m_configurationThreads(0)
 {
 }
 
@@ -180,8 +189,14 @@ int BaseQuasarServer::serverRun(
             " caught in BaseQuasarServer::serverRun:  [" << Quasar::TermColors::ForeRed() << e.what() << Quasar::TermColors::StyleReset() << "]";
         serverReturnCode = 1;
     }
+    m_pollingScheduler.reset(); // first: the polling hooks (also the Meta ones reading the channels below) are done
     AddressSpace::SourceVariables_destroySourceVariablesThreadPool ();
     shutdown();  // this is typically overridden by the developer
+    Quasar::IoReactor::shutdown();
+    m_dependencyGraphDumpSignal.reset();
+    AddressSpace::AsyncUpdateChannel::shutdown();
+    CalculatedVariables::Engine::shutdown(); // after everything that could still update variables
+    Quasar::TimestampProvider::shutdown();
 
     unlinkAllDevices(m_nodeManager);
     Device::DRoot::getInstance()->unlinkAllChildren();
@@ -314,7 +329,21 @@ int BaseQuasarServer::parseCommandLine(
             ("create_certificate", bool_switch(&createCertificateOnly), "Create new certificate and exit")
             ("help,h", "Print help")
             ("version,v", bool_switch(&printVersion), "Print version and exit")
-            ("version_extra", bool_switch(&printVersionExtraInfo), "Print version extra info and exit");
+            ("version_extra", bool_switch(&printVersionExtraInfo), "Print version extra info and exit")
+            ("calculated_variables_graph", value<string>(&m_calculatedVariablesGraphPath),
+                 "(Optional) path prefix to dump the Calculated Variables dependency graph (.json and .dot) after the configuration and on SIGUSR1")
+            ("timestamps", value<string>(&m_timestampsMode)->default_value("precise"),
+                 "(Optional) timestamps of variable updates: precise (system clock read for every update) or coarse (cached clock, for high update rates)")
+            ("timestamps_resolution_ms", value<unsigned int>(&m_timestampsResolutionMs)->default_value(1),
+                 "(Optional) refresh period of the cached clock when timestamps are coarse")
+            ("async_update_queue_size", value<unsigned int>(&m_asyncUpdateQueueSize)->default_value(0),
+                 "(Optional) capacity of the queue of asynchronous updates (BulkUpdate::post), 0 means updates are applied directly")
+            ("polling_threads", value<unsigned int>(&m_pollingThreads)->default_value(2),
+                 "(Optional) number of worker threads calling the polling hooks of device logic")
+            ("configuration_threads", value<unsigned int>(&m_configurationThreads)->default_value(0),
+                 "(Optional) number of threads building the address space and device logic from the config file, 0 or 1 means sequentially")
+            ("configuration_snapshot", value<string>(&m_configurationSnapshotPath),
+                 "(Optional) file caching the parsed config file, used at the next start if neither the config file nor the server changed");
 
     positional_options_description p;
     p.add("config_file", 1);
@@ -337,6 +366,11 @@ int BaseQuasarServer::parseCommandLine(
         return 1;
     }
     notify(vm);
+    if (m_timestampsMode != "precise" && m_timestampsMode != "coarse")
+    {
+        cout << "Unknown timestamps mode '" << m_timestampsMode << "', allowed are: precise, coarse" << endl;
+        return 1;
+    }
     if (vm.count("help"))
     {
         cout << desc << endl;
@@ -429,6 +463,11 @@ int BaseQuasarServer::initializeEnvironment()
 #endif
     initializeLogIt();
     logEnvironment();
+    Quasar::TimestampProvider::configure(
+            m_timestampsMode == "coarse" ? Quasar::TimestampProvider::Mode::Coarse : Quasar::TimestampProvider::Mode::Precise,
+            std::chrono::milliseconds(m_timestampsResolutionMs));
+    if (m_asyncUpdateQueueSize > 0)
+        AddressSpace::AsyncUpdateChannel::start(m_asyncUpdateQueueSize);
     CalculatedVariables::Engine::initialize();
     return ret;
 }
@@ -475,7 +514,7 @@ void BaseQuasarServer::mainLoop()
 }
 bool BaseQuasarServer::overridableConfigure(const std::string& fileName, AddressSpace::ASNodeManager *nm)
 {
-    return configure(fileName, nm);
+    return configure(fileName, nm, ConfigXmlDecoratorFunction(), m_configurationThreads, m_configurationSnapshotPath);
 }
 
 
@@ -519,10 +558,44 @@ UaStatus BaseQuasarServer::configurationInitializerHandler(const std::string& co
     CalculatedVariables::Engine::optimize();
     CalculatedVariables::Engine::setupSynchronization();
     CalculatedVariables::Engine::printInstantiationStatistics();
+    if (!m_calculatedVariablesGraphPath.empty())
+        CalculatedVariables::Engine::dumpDependencyGraph(m_calculatedVariablesGraphPath);
+    watchDependencyGraphDumpSignal();
     initialize();
+    startPolling();
     return OpcUa_Good;
 }
 
+void BaseQuasarServer::startPolling()
+{
+    std::unique_ptr<Quasar::PollingScheduler> scheduler (new Quasar::PollingScheduler(m_pollingThreads));
+    Device::DRoot::registerPollingHooks(*scheduler);
+    Meta::registerPollingHooks(*scheduler);
+    if (scheduler->numHooks() == 0)
+        return;
+    scheduler->start();
+    m_pollingScheduler = std::move(scheduler);
+}
+
+void BaseQuasarServer::watchDependencyGraphDumpSignal()
+{
+#ifndef _WIN32
+    Quasar::IoReactor* reactor = Quasar::IoReactor::instance();
+    if (!reactor)
+    {
+        LOG(Log::WRN) << "The I/O reactor is not running, SIGUSR1 won't dump the Calculated Variables dependency graph";
+        return;
+    }
+    const std::string pathPrefix (m_calculatedVariablesGraphPath.empty() ? "calculated_variables_graph" : m_calculatedVariablesGraphPath);
+    m_dependencyGraphDumpSignal = reactor->watchSignal(SIGUSR1, [pathPrefix]()
+    {
+        LOG(Log::INF) << "Got SIGUSR1, dumping the Calculated Variables dependency graph";
+        CalculatedVariables::Engine::dumpDependencyGraph(pathPrefix);
+    });
+    LOG(Log::INF) << "Send SIGUSR1 to the server process to dump the Calculated Variables dependency graph into " << pathPrefix << ".json/.dot";
+#endif // _WIN32
+}
+
 void BaseQuasarServer::appendCustomCommandLineOptions(options_description& commandLineOptions,
         positional_options_description& positionalOptionsDescription)
 {